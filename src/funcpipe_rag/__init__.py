@@ -38,6 +38,8 @@ from .core.rag_types import (
     CleanDoc,
     ChunkWithoutEmbedding,
     Chunk,
+    SpanChunk,
+    SpanSource,
     RagEnv,
     TextNode,
     TreeDoc,
@@ -48,12 +50,27 @@ from .rag.stages import (
     clean_doc,
     chunk_doc,
     iter_chunk_spans,
+    iter_cdc_spans,
     iter_chunk_doc,
+    iter_span_chunks,
+    iter_arena_span_chunks,
     iter_overlapping_chunks_text,
     embed_chunk,
+    embed_span_chunk,
+    iter_embed_batched,
     structural_dedup_chunks,
 )
-from .core.structural_dedup import DedupIterator, structural_dedup_lazy
+from .rag.external_sort import structural_dedup_chunks_external
+from .core.text_arena import TextArena, iter_text_arenas
+from .core.structural_dedup import (
+    BloomFilter,
+    DedupIterator,
+    FingerprintSet,
+    LRUWindow,
+    chunk_fingerprint,
+    structural_dedup_compact,
+    structural_dedup_lazy,
+)
 
 # Functional composition helpers (Modules 02–03)
 from .fp import (
@@ -128,7 +145,7 @@ from .result import (
     option_from_nullable,
     option_to_nullable,
 )
-from .rag.clean_cfg import CleanConfig, DEFAULT_CLEAN_CONFIG, make_cleaner
+from .rag.clean_cfg import CleanConfig, DEFAULT_CLEAN_CONFIG, clean_arena, compile_cleaner, make_cleaner
 from .rag.types import DocRule, RagTaps, DebugConfig, Observations
 from .rag.types import RagTraceV3, TraceLens
 from .core.rules_pred import (
@@ -142,7 +159,10 @@ from .core.rules_pred import (
     RulesConfig,
     DEFAULT_RULES,
     eval_pred,
+    compile_pred,
+    pred_paths,
 )
+from .core.rules_adaptive import AdaptivePred, PredStats, compile_rules
 from .core.rules_dsl import (
     any_doc,
     none_doc,
@@ -157,6 +177,7 @@ from .core.rules_dsl import (
 )
 from .core.rules_lint import SafeVisitor, assert_rule_is_safe_expr
 from .rag.config import (
+    BatchEmbedder,
     RagConfig,
     RagCoreDeps,
     RagBoundaryDeps,
@@ -170,6 +191,7 @@ from .rag.core import (
     _trace_iter,
     gen_chunk_doc,
     gen_chunk_spans,
+    gen_span_chunks,
     gen_overlapping_chunks,
     iter_rag,
     iter_rag_core,
@@ -183,6 +205,7 @@ from .rag.core import (
     iter_chunks_from_cleaned,
     full_rag_api,
     full_rag_api_docs,
+    gen_rag_api_docs,
     full_rag_api_path,
 )
 from .policies.breakers import (
@@ -196,7 +219,7 @@ from .policies.breakers import (
     short_circuit_on_err_emit,
     short_circuit_on_err_truncate,
 )
-from .policies.memo import DiskCache, content_hash_key, lru_cache_custom, memoize_keyed
+from .policies.memo import CachedEmbedder, DiskCache, cached_embedder, content_hash_key, lru_cache_custom, memoize_keyed
 from .policies.reports import ErrGroup, ErrReport, fold_error_counts, fold_error_report, report_to_jsonable
 from .policies.resources import auto_close, managed_stream, nested_managed, with_resource_stream
 from .policies.retries import (
@@ -274,6 +297,8 @@ __all__ = [
     "CleanDoc",
     "ChunkWithoutEmbedding",
     "Chunk",
+    "SpanChunk",
+    "SpanSource",
     "RagEnv",
     "TextNode",
     "TreeDoc",
@@ -282,12 +307,25 @@ __all__ = [
     "clean_doc",
     "chunk_doc",
     "iter_chunk_spans",
+    "iter_cdc_spans",
     "iter_chunk_doc",
+    "iter_span_chunks",
+    "iter_arena_span_chunks",
+    "TextArena",
+    "iter_text_arenas",
     "iter_overlapping_chunks_text",
     "embed_chunk",
+    "embed_span_chunk",
+    "iter_embed_batched",
     "structural_dedup_chunks",
+    "structural_dedup_chunks_external",
     "DedupIterator",
     "structural_dedup_lazy",
+    "structural_dedup_compact",
+    "chunk_fingerprint",
+    "FingerprintSet",
+    "BloomFilter",
+    "LRUWindow",
 
     # Functional composition
     "identity",
@@ -358,6 +396,8 @@ __all__ = [
     "memoize_keyed",
     "DiskCache",
     "content_hash_key",
+    "CachedEmbedder",
+    "cached_embedder",
 
     # Result stream combinators (Module 04)
     "try_map_iter",
@@ -423,6 +463,11 @@ __all__ = [
     "RulesConfig",
     "DEFAULT_RULES",
     "eval_pred",
+    "compile_pred",
+    "pred_paths",
+    "AdaptivePred",
+    "PredStats",
+    "compile_rules",
     "any_doc",
     "none_doc",
     "category_startswith",
@@ -439,12 +484,15 @@ __all__ = [
     # Config + API (Modules 02–03)
     "CleanConfig",
     "DEFAULT_CLEAN_CONFIG",
+    "clean_arena",
+    "compile_cleaner",
     "make_cleaner",
     "RagTaps",
     "DebugConfig",
     "Observations",
     "TraceLens",
     "RagTraceV3",
+    "BatchEmbedder",
     "RagConfig",
     "RagCoreDeps",
     "DocsReader",
@@ -456,6 +504,7 @@ __all__ = [
     "_trace_iter",
     "gen_chunk_doc",
     "gen_chunk_spans",
+    "gen_span_chunks",
     "gen_overlapping_chunks",
     "iter_rag",
     "iter_rag_core",
@@ -471,6 +520,7 @@ __all__ = [
     "iter_chunks_from_cleaned",
     "full_rag_api",
     "full_rag_api_docs",
+    "gen_rag_api_docs",
     "full_rag_api_path",
     "FSReader",
     "write_chunks_jsonl",
@@ -0,0 +1,282 @@
+"""Persisted inverted index over ``categories`` for repeated keep-rule filtering (end-of-Module-09).
+
+Every `rules_pred` run over the same corpus rescans each `RawDoc`. A
+`CategoryIndex` assigns each doc a row number and keeps, per distinct
+``categories`` value, a sorted ``array('I')`` posting list of rows. Distinct
+values are also held sorted, so ``StartsWith`` is a ``bisect`` range rather
+than a scan. A `Pred` is then answered with bitmap algebra over Python ints
+(bit ``r`` = row ``r``):
+
+- ``Eq("categories", v)``          -> postings of ``v``
+- ``StartsWith("categories", p)``  -> union over the ``bisect`` range of ``p``
+- ``LenGt("categories", n)``       -> union over distinct values longer than ``n``
+
+A union writes every sparse value's postings into one shared bytearray and
+converts it to an int once, ORing in cached dense bitmaps, so its cost is
+O(matched rows + n/8) rather than one n/8-byte bitmap per matched value.
+- ``Eq("doc_id", v)``              -> the doc's row
+- ``All`` / ``AnyOf`` / ``Not``    -> ``&`` / ``|`` / ``live & ~b``
+
+Postings are the compact form (4 bytes per doc); values covering at least
+1/32 of the rows also cache their dense int bitmap, roaring-style, which bounds
+cache memory to about 4 bytes per doc. `add` is incremental: new docs get new
+rows, and re-adding a ``doc_id`` retires its old row. Leaves on other paths
+raise ``ValueError`` since they need the text. Persistence is one
+zlib-compressed file, written atomically like the ingest manifest.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Iterator
+
+from funcpipe_rag.core.rag_types import RawDoc
+from funcpipe_rag.core.rules_pred import All, AnyOf, Eq, LenGt, Not, Pred, StartsWith
+from funcpipe_rag.result.types import Err, Ok, Result
+
+CATEGORY_INDEX_MAGIC = b"FPCI\x01"
+_DENSE_FRACTION = 32
+
+
+def _rows_to_bitmap(rows: Iterable[int], n: int) -> int:
+    buf = bytearray((n + 7) >> 3)
+    for r in rows:
+        buf[r >> 3] |= 1 << (r & 7)
+    return int.from_bytes(buf, "little")
+
+
+_BYTE_BITS = tuple(tuple(i for i in range(8) if b >> i & 1) for b in range(256))
+
+
+def _bitmap_to_rows(bitmap: int) -> Iterator[int]:
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) >> 3, "little")
+    bits = _BYTE_BITS
+    for i, byte in enumerate(data):
+        if byte:
+            base = i << 3
+            for b in bits[byte]:
+                yield base + b
+
+
+class CategoryIndex:
+    def __init__(self) -> None:
+        self.doc_ids: list[str] = []
+        self._row_of: dict[str, int] = {}
+        self._values: list[str] = []
+        self._postings: dict[str, array[int]] = {}
+        self._retired = 0
+        self._dense: dict[str, int] = {}
+
+    @classmethod
+    def from_docs(cls, docs: Iterable[RawDoc]) -> CategoryIndex:
+        index = cls()
+        index.add(docs)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    @property
+    def rows(self) -> int:
+        """Rows allocated so far, including retired ones."""
+
+        return len(self.doc_ids)
+
+    @property
+    def values(self) -> tuple[str, ...]:
+        return tuple(self._values)
+
+    def add(self, docs: Iterable[RawDoc]) -> None:
+        """Index ``docs``; a known ``doc_id`` is re-indexed under a fresh row."""
+
+        for doc in docs:
+            old = self._row_of.get(doc.doc_id)
+            if old is not None:
+                self._retired |= 1 << old
+            row = len(self.doc_ids)
+            self.doc_ids.append(doc.doc_id)
+            self._row_of[doc.doc_id] = row
+            postings = self._postings.get(doc.categories)
+            if postings is None:
+                postings = self._postings[doc.categories] = array("I")
+                insort(self._values, doc.categories)
+            postings.append(row)
+        self._dense.clear()
+
+    def live(self) -> int:
+        return ((1 << len(self.doc_ids)) - 1) & ~self._retired
+
+    def _value_bitmap(self, value: str) -> int:
+        cached = self._dense.get(value)
+        if cached is not None:
+            return cached
+        postings = self._postings.get(value)
+        if postings is None:
+            return 0
+        bitmap = _rows_to_bitmap(postings, len(self.doc_ids))
+        if len(postings) * _DENSE_FRACTION >= len(self.doc_ids):
+            self._dense[value] = bitmap
+        return bitmap
+
+    def _union(self, values: Iterable[str]) -> int:
+        # Sparse postings all set bits in one shared buffer, converted once;
+        # only dense values materialize (and cache) their own bitmap.
+        n = len(self.doc_ids)
+        buf = bytearray((n + 7) >> 3)
+        dense = 0
+        for v in values:
+            cached = self._dense.get(v)
+            if cached is not None:
+                dense |= cached
+                continue
+            postings = self._postings.get(v)
+            if postings is None:
+                continue
+            if len(postings) * _DENSE_FRACTION >= n:
+                dense |= self._value_bitmap(v)
+                continue
+            for r in postings:
+                buf[r >> 3] |= 1 << (r & 7)
+        return dense | int.from_bytes(buf, "little")
+
+    def _leaf(self, pred: Eq | StartsWith | LenGt) -> int:
+        if pred.path == "doc_id" and isinstance(pred, Eq):
+            row = self._row_of.get(pred.value) if isinstance(pred.value, str) else None
+            return 0 if row is None else 1 << row
+        if pred.path != "categories":
+            raise ValueError(f"CategoryIndex cannot answer {type(pred).__name__} on {pred.path!r}")
+        if isinstance(pred, Eq):
+            return self._value_bitmap(pred.value) if isinstance(pred.value, str) else 0
+        if isinstance(pred, StartsWith):
+            lo = bisect_left(self._values, pred.value)
+            hi = lo
+            while hi < len(self._values) and self._values[hi].startswith(pred.value):
+                hi += 1
+            return self._union(self._values[lo:hi])
+        return self._union(v for v in self._values if len(v) > pred.value)
+
+    def _eval(self, pred: Pred, live: int) -> int:
+        if isinstance(pred, (Eq, StartsWith, LenGt)):
+            return self._leaf(pred)
+        if isinstance(pred, All):
+            out = live
+            for p in pred.rules:
+                out &= self._eval(p, live)
+                if not out:
+                    break
+            return out
+        if isinstance(pred, AnyOf):
+            out = 0
+            for p in pred.rules:
+                out |= self._eval(p, live)
+            return out
+        if isinstance(pred, Not):
+            return live & ~self._eval(pred.rule, live)
+        raise ValueError(f"Unknown predicate: {type(pred).__name__}")
+
+    def bitmap(self, pred: Pred) -> int:
+        """Row bitmap of live docs satisfying ``pred``."""
+
+        live = self.live()
+        return self._eval(pred, live) & live
+
+    def matching_rows(self, pred: Pred) -> list[int]:
+        return list(_bitmap_to_rows(self.bitmap(pred)))
+
+    def matching_doc_ids(self, pred: Pred) -> list[str]:
+        """Doc ids satisfying ``pred``, in the order they were (last) added."""
+
+        ids = self.doc_ids
+        return [ids[r] for r in _bitmap_to_rows(self.bitmap(pred))]
+
+    def to_bytes(self) -> bytes:
+        header = {
+            "doc_ids": self.doc_ids,
+            "values": [[v, len(self._postings[v])] for v in self._values],
+            "retired": list(_bitmap_to_rows(self._retired)),
+        }
+        head = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        parts = [struct.pack("<Q", len(head)), head]
+        for v in self._values:
+            postings = self._postings[v]
+            if sys.byteorder != "little":
+                postings = array("I", postings)
+                postings.byteswap()
+            parts.append(postings.tobytes())
+        return CATEGORY_INDEX_MAGIC + zlib.compress(b"".join(parts))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> CategoryIndex:
+        if not data.startswith(CATEGORY_INDEX_MAGIC):
+            raise ValueError("not a category index")
+        payload = zlib.decompress(data[len(CATEGORY_INDEX_MAGIC) :])
+        (head_len,) = struct.unpack_from("<Q", payload)
+        header = json.loads(payload[8 : 8 + head_len])
+        index = cls()
+        index.doc_ids = list(header["doc_ids"])
+        offset = 8 + head_len
+        for value, count in header["values"]:
+            postings = array("I")
+            postings.frombytes(payload[offset : offset + 4 * count])
+            if sys.byteorder != "little":
+                postings.byteswap()
+            offset += 4 * count
+            index._postings[value] = postings
+            index._values.append(value)
+        if offset != len(payload):
+            raise ValueError("category index payload has trailing bytes")
+        index._values.sort()
+        index._retired = _rows_to_bitmap(header["retired"], len(index.doc_ids))
+        for row, doc_id in enumerate(index.doc_ids):
+            if not (index._retired >> row) & 1:
+                index._row_of[doc_id] = row
+        return index
+
+
+def load_category_index(path: str) -> Result[CategoryIndex, str]:
+    """Read a persisted index; a missing file is an empty index (first run)."""
+
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return Ok(CategoryIndex())
+    except OSError as exc:
+        return Err(f"Category index load failed: {exc}")
+    try:
+        return Ok(CategoryIndex.from_bytes(data))
+    except (ValueError, KeyError, TypeError, struct.error, zlib.error) as exc:
+        return Err(f"Category index load failed: {exc}")
+
+
+def save_category_index(path: str, index: CategoryIndex) -> Result[None, str]:
+    """Atomically write an index (temp + fsync + rename)."""
+
+    tmp_path: str | None = None
+    try:
+        with tempfile.NamedTemporaryFile(mode="wb", dir=os.path.dirname(path) or ".", delete=False) as tmp:
+            tmp_path = tmp.name
+            tmp.write(index.to_bytes())
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, path)
+        return Ok(None)
+    except OSError as exc:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        return Err(f"Category index save failed: {exc}")
+
+
+__all__ = [
+    "CATEGORY_INDEX_MAGIC",
+    "CategoryIndex",
+    "load_category_index",
+    "save_category_index",
+]
@@ -0,0 +1,189 @@
+"""Per-document ingest manifest for incremental re-ingest (end-of-Module-09).
+
+A manifest maps ``doc_id`` to a content hash over the document's raw fields
+salted with a *config fingerprint* (canonical JSON → sha256, as in
+`pipelines.specs.spec_hash`). Comparing a new input against the previous
+manifest partitions it into:
+
+- changed docs (new ids, or content/config changed) → reprocess
+- unchanged docs → skip
+- removed ids → tombstone
+
+Planning is pure (`plan_ingest`); loading/saving is the only I/O and saves are
+atomic (temp + fsync + rename). Doc ids are assumed unique within one input.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from funcpipe_rag.core.rag_types import RawDoc
+from funcpipe_rag.pipelines.specs import canonical_json
+from funcpipe_rag.policies.memo import embedder_id
+from funcpipe_rag.rag.config import RagConfig, RagCoreDeps
+from funcpipe_rag.rag.stages import embed_chunk
+from funcpipe_rag.result.types import Err, Ok, Result
+
+MANIFEST_VERSION = 1
+
+
+def fingerprint(payload: object) -> str:
+    """sha256 over the canonical JSON of a config payload."""
+
+    return hashlib.sha256(canonical_json(payload).encode("utf-8")).hexdigest()
+
+
+def rag_config_fingerprint(config: RagConfig, deps: RagCoreDeps | None = None) -> str:
+    """Fingerprint of every `RagConfig` field, and the embedder in ``deps``, that can change emitted chunks.
+
+    The embedder is the one the cores actually call: ``deps.batch_embedder``
+    when set, else ``deps.embedder`` (`embed_chunk` without ``deps``).
+    """
+
+    if deps is None:
+        embedder = embedder_id(embed_chunk)
+    else:
+        embedder = embedder_id(deps.batch_embedder if deps.batch_embedder is not None else deps.embedder)
+    env = config.env
+    return fingerprint(
+        {
+            "env": {
+                "chunk_size": env.chunk_size,
+                "overlap": env.overlap,
+                "tail_policy": env.tail_policy,
+                "chunk_mode": env.chunk_mode,
+                "cdc_bounds": list(env.cdc_bounds),
+            },
+            "clean": list(config.clean.rule_names),
+            "keep": repr(config.keep.keep_pred),
+            "embedder": embedder,
+        }
+    )
+
+
+def doc_hash(doc: RawDoc, config_fp: str) -> str:
+    """Content hash of a doc's raw fields, salted with the config fingerprint."""
+
+    payload = canonical_json([config_fp, doc.doc_id, doc.title, doc.abstract, doc.categories])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class Manifest:
+    entries: Mapping[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "entries", MappingProxyType(dict(self.entries)))
+
+
+@dataclass(frozen=True)
+class ManifestStats:
+    new: int
+    changed: int
+    unchanged: int
+    removed: int
+
+
+@dataclass(frozen=True)
+class IngestPlan:
+    """Outcome of diffing an input against a manifest.
+
+    ``new`` docs are absent from the previous manifest and ``changed`` ones
+    are present with a different hash; only ``changed`` and ``removed`` ids
+    invalidate previously emitted chunks. ``to_process`` is ``new`` plus
+    ``changed`` in input order.
+    """
+
+    new: tuple[RawDoc, ...]
+    changed: tuple[RawDoc, ...]
+    removed: tuple[str, ...]
+    manifest: Manifest
+    stats: ManifestStats
+    to_process: tuple[RawDoc, ...] = ()
+
+
+def plan_ingest(docs: Iterable[RawDoc], previous: Manifest, config_fp: str) -> IngestPlan:
+    """Partition ``docs`` into new / changed / unchanged / removed against ``previous``."""
+
+    entries: dict[str, str] = {}
+    new: list[RawDoc] = []
+    changed: list[RawDoc] = []
+    to_process: list[RawDoc] = []
+    unchanged = 0
+    old = previous.entries
+    for doc in docs:
+        h = doc_hash(doc, config_fp)
+        entries[doc.doc_id] = h
+        before = old.get(doc.doc_id)
+        if before == h:
+            unchanged += 1
+            continue
+        (new if before is None else changed).append(doc)
+        to_process.append(doc)
+    removed = tuple(sorted(k for k in old if k not in entries))
+    return IngestPlan(
+        new=tuple(new),
+        changed=tuple(changed),
+        removed=removed,
+        manifest=Manifest(entries),
+        stats=ManifestStats(new=len(new), changed=len(changed), unchanged=unchanged, removed=len(removed)),
+        to_process=tuple(to_process),
+    )
+
+
+def load_manifest(path: str) -> Result[Manifest, str]:
+    """Read a manifest; a missing file is an empty manifest (first run)."""
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return Ok(Manifest())
+    except (OSError, ValueError) as exc:
+        return Err(f"Manifest load failed: {exc}")
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return Err("Manifest load failed: unsupported manifest version")
+    docs = data.get("docs")
+    if not isinstance(docs, dict) or not all(isinstance(k, str) and isinstance(v, str) for k, v in docs.items()):
+        return Err("Manifest load failed: docs must map str -> str")
+    return Ok(Manifest(docs))
+
+
+def save_manifest(path: str, manifest: Manifest) -> Result[None, str]:
+    """Atomically write a manifest (temp + fsync + rename)."""
+
+    tmp_path: str | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=os.path.dirname(path) or ".", delete=False, encoding="utf-8"
+        ) as tmp:
+            tmp_path = tmp.name
+            json.dump({"version": MANIFEST_VERSION, "docs": dict(manifest.entries)}, tmp, sort_keys=True)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, path)
+        return Ok(None)
+    except OSError as exc:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        return Err(f"Manifest save failed: {exc}")
+
+
+__all__ = [
+    "MANIFEST_VERSION",
+    "IngestPlan",
+    "Manifest",
+    "ManifestStats",
+    "doc_hash",
+    "fingerprint",
+    "load_manifest",
+    "plan_ingest",
+    "rag_config_fingerprint",
+    "save_manifest",
+]
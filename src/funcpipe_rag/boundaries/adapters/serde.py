@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, BinaryIO, Callable, Iterable, Iterator, Mapping, Tuple, TypeAlias, TypeVar, cast
 import json
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Tuple,
+    TypeAlias,
+    TypeVar,
+    cast,
+)
 
 import msgpack  # type: ignore[import-untyped]
-
 from typing_extensions import assert_never
 
 from funcpipe_rag.fp.core import (
@@ -23,6 +37,10 @@ from funcpipe_rag.fp.core import (
     VSuccess,
 )
 
+if TYPE_CHECKING:
+    from funcpipe_rag.core.chunk_batch import ChunkBatch
+    from funcpipe_rag.core.rag_types import Chunk
+
 T = TypeVar("T")
 
 JSON = str | int | float | bool | None | list["JSON"] | dict[str, "JSON"]
@@ -201,6 +219,113 @@ def dec_validation(
     return _dec
 
 
+def enc_chunk_batch() -> Encoder[ChunkBatch]:
+    """Columnar chunk codec: one envelope per `ChunkBatch` instead of one per chunk."""
+
+    def _enc(x: ChunkBatch) -> Envelope:
+        return Envelope(tag="chunk_batch", ver=1, payload=cast(dict[str, JSON], x.to_columns()))
+
+    return _enc
+
+
+def dec_chunk_batch() -> Decoder[ChunkBatch]:
+    from funcpipe_rag.core.chunk_batch import (
+        ChunkBatch,  # NumPy-backed; imported on use
+    )
+
+    def _dec(env: Envelope) -> ChunkBatch:
+        if env.tag != "chunk_batch":
+            raise ValueError(f"expected tag 'chunk_batch', got {env.tag}")
+        if env.ver != 1:
+            raise ValueError(f"unknown version {env.ver}")
+        return ChunkBatch.from_columns(env.payload)
+
+    return _dec
+
+
+def enc_chunk() -> Encoder[Chunk]:
+    """One `Chunk` per envelope (tag ``chunk``, ver 1); the record of the JSONL sinks."""
+
+    def _enc(x: Chunk) -> Envelope:
+        return Envelope(
+            tag="chunk",
+            ver=1,
+            payload={
+                "doc_id": x.doc_id,
+                "text": x.text,
+                "start": x.start,
+                "end": x.end,
+                "metadata": cast(dict[str, JSON], dict(x.metadata)),
+                "embedding": list(x.embedding),
+            },
+        )
+
+    return _enc
+
+
+def dec_chunk() -> Decoder[Chunk]:
+    from funcpipe_rag.core.rag_types import Chunk
+
+    def _dec(env: Envelope) -> Chunk:
+        if env.tag != "chunk":
+            raise ValueError(f"expected tag 'chunk', got {env.tag}")
+        if env.ver != 1:
+            raise ValueError(f"unknown version {env.ver}")
+        p = env.payload
+        try:
+            return Chunk(
+                doc_id=cast(str, p["doc_id"]),
+                text=cast(str, p["text"]),
+                start=cast(int, p["start"]),
+                end=cast(int, p["end"]),
+                metadata=cast(dict[str, JSON], p.get("metadata") or {}),
+                embedding=tuple(cast(list[float], p["embedding"])),
+            )
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"invalid chunk payload: {exc}") from exc
+
+    return _dec
+
+
+def dec_chunk_columns() -> Decoder[ChunkBatch]:
+    """Columnar ``chunk`` batch (from `iter_msgpack_columns`) straight into a `ChunkBatch`."""
+
+    import numpy as np
+
+    from funcpipe_rag.core.chunk_batch import EMBED_DIM, ChunkBatch
+
+    def _dec(env: Envelope) -> ChunkBatch:
+        if env.tag != "chunk":
+            raise ValueError(f"expected tag 'chunk', got {env.tag}")
+        if env.ver != 1:
+            raise ValueError(f"unknown version {env.ver}")
+        cols = cast(dict[str, Any], env.payload)
+        try:
+            doc_index: dict[str, int] = {}
+            codes = [doc_index.setdefault(d, len(doc_index)) for d in cols["doc_id"]]
+            texts = [t.encode("utf-8") for t in cols["text"]]
+            offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+            np.cumsum([len(t) for t in texts], out=offsets[1:])
+            emb = cols["embedding"]
+            matrix = (
+                np.frombuffer(emb, dtype="<f4") if isinstance(emb, bytes) else np.asarray(emb, dtype=np.float32)
+            )
+            return ChunkBatch(
+                doc_ids=tuple(doc_index),
+                doc_codes=np.asarray(codes, dtype=np.int32),
+                starts=np.asarray(cols["start"], dtype=np.int64),
+                ends=np.asarray(cols["end"], dtype=np.int64),
+                text_arena=b"".join(texts),
+                text_offsets=offsets,
+                embeddings=matrix.reshape(-1, EMBED_DIM),
+                metadata={row: dict(m) for row, m in enumerate(cols.get("metadata", ())) if m},
+            )
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"invalid chunk columns: {exc}") from exc
+
+    return _dec
+
+
 _MP_PACK: dict[str, object] = {"use_bin_type": True}
 _MP_UNPACK: dict[str, object] = {"raw": False}
 
@@ -296,6 +421,184 @@ def iter_msgpack(fp: BinaryIO, dec: Decoder[T]) -> Iterator[T]:
         yield dec(migrate(Envelope(obj["tag"], obj["ver"], obj["payload"])))
 
 
+# Batch-framed MessagePack streams.
+#
+# ``to_msgpack`` / ``iter_msgpack`` repeat the envelope and re-run
+# ``_check_env`` + ``migrate`` for every record. A batch stream is instead
+#
+#     BATCH_STREAM_MAGIC | u32 len | msgpack {"tag", "ver", "f32"}
+#     (u32 len | msgpack [payload, ...])*          (lengths little-endian)
+#
+# so tag/version are stored and validated once, migration is resolved once
+# per batch, and each batch decodes with one ``unpackb``. Numeric lists under
+# the ``f32`` fields (``embedding`` by default) are stored as little-endian
+# float32 ``bin`` payloads: 4 bytes per value instead of 9, at float32
+# precision on read-back.
+
+BATCH_STREAM_MAGIC = b"FPMB\x01"
+_FRAME = struct.Struct("<I")
+
+
+def _pack_f32(values: Iterable[float]) -> bytes:
+    a = array("f", values)
+    if sys.byteorder != "little":
+        a.byteswap()
+    return a.tobytes()
+
+
+def _unpack_f32(data: bytes) -> list[float]:
+    a = array("f")
+    a.frombytes(data)
+    if sys.byteorder != "little":
+        a.byteswap()
+    return a.tolist()
+
+
+def write_msgpack_batches(
+    fp: BinaryIO,
+    xs: Iterable[T],
+    enc: Encoder[T],
+    *,
+    batch_size: int = 1024,
+    f32_fields: Iterable[str] = ("embedding",),
+) -> int:
+    """Encode ``xs`` as a batch stream; returns the number of records.
+
+    All records must share the first record's tag and version. An empty
+    ``xs`` writes nothing (which `iter_msgpack_batches` reads as empty).
+    """
+
+    if batch_size <= 0:
+        raise ValueError("batch_size must be > 0")
+    f32 = tuple(f32_fields)
+    packer = msgpack.Packer(**_MP_PACK)
+    head: tuple[str, int] | None = None
+    batch: list[dict[str, Any]] = []
+    count = 0
+
+    def flush() -> None:
+        data = packer.pack(batch)
+        fp.write(_FRAME.pack(len(data)) + data)
+        batch.clear()
+
+    for x in xs:
+        env = enc(x)
+        if head is None:
+            head = (env.tag, env.ver)
+            data = packer.pack({"tag": env.tag, "ver": env.ver, "f32": list(f32)})
+            fp.write(BATCH_STREAM_MAGIC + _FRAME.pack(len(data)) + data)
+        elif (env.tag, env.ver) != head:
+            raise ValueError(f"batch stream is {head}, got {(env.tag, env.ver)}")
+        payload: dict[str, Any] = env.payload
+        for name in f32:
+            v = payload.get(name)
+            if isinstance(v, (list, tuple)):
+                payload = {**payload, name: _pack_f32(v)}
+        batch.append(payload)
+        count += 1
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return count
+
+
+def _read_frame(fp: BinaryIO) -> Any:
+    head = fp.read(_FRAME.size)
+    if not head:
+        return None
+    if len(head) != _FRAME.size:
+        raise ValueError("truncated batch frame")
+    (size,) = _FRAME.unpack(head)
+    data = fp.read(size)
+    if len(data) != size:
+        raise ValueError("truncated batch frame")
+    return msgpack.unpackb(data, **_MP_UNPACK)
+
+
+def _read_batches(fp: BinaryIO) -> Iterator[tuple[str, int, tuple[str, ...], list[dict[str, Any]]]]:
+    magic = fp.read(len(BATCH_STREAM_MAGIC))
+    if not magic:
+        return
+    if magic != BATCH_STREAM_MAGIC:
+        raise ValueError("not a batch-framed msgpack stream")
+    header = _read_frame(fp)
+    if not isinstance(header, dict) or not isinstance(header.get("tag"), str) or not isinstance(header.get("ver"), int):
+        raise ValueError("invalid batch stream header")  # noqa: TRY004 - decode errors are ValueError
+    f32 = tuple(header.get("f32") or ())
+    while (batch := _read_frame(fp)) is not None:
+        if not isinstance(batch, list) or not all(type(p) is dict for p in batch):
+            raise ValueError("batch frame must be a list of payload objects")
+        yield header["tag"], header["ver"], f32, batch
+
+
+def _decode_f32(batch: list[dict[str, Any]], f32: tuple[str, ...]) -> None:
+    for name in f32:
+        for p in batch:
+            v = p.get(name)
+            if isinstance(v, bytes):
+                p[name] = _unpack_f32(v)
+
+
+def migrate_batch(tag: str, ver: int, payloads: list[dict[str, Any]]) -> tuple[str, int, list[dict[str, Any]]]:
+    """`migrate` for a batch sharing ``(tag, ver)``: the chain is resolved once, not per record."""
+
+    key = (tag, ver)
+    steps = 0
+    seen: set[tuple[str, int]] = set()
+    while key in MIGRATORS and payloads:
+        if key in seen:
+            raise RuntimeError(f"migration cycle detected at {key}")
+        seen.add(key)
+        steps += 1
+        if steps > MAX_MIGRATION_STEPS:
+            raise RuntimeError("migration step limit exceeded")
+        step = MIGRATORS[key]
+        envs = [step(Envelope(key[0], key[1], p)) for p in payloads]
+        keys = {(e.tag, e.ver) for e in envs}
+        if len(keys) != 1:
+            raise ValueError(f"migration of {key} split a batch across {sorted(keys)}")
+        (key,) = keys
+        payloads = [e.payload for e in envs]
+    return key[0], key[1], payloads
+
+
+def iter_msgpack_batches(fp: BinaryIO, dec: Decoder[T]) -> Iterator[list[T]]:
+    """Decode a batch stream, one ``list`` per stored batch."""
+
+    for tag, ver, f32, batch in _read_batches(fp):
+        _decode_f32(batch, f32)
+        tag, ver, payloads = migrate_batch(tag, ver, batch)
+        yield [dec(Envelope(tag, ver, p)) for p in payloads]
+
+
+def iter_msgpack_columns(fp: BinaryIO) -> Iterator[Envelope]:
+    """Decode a batch stream column-wise: one `Envelope` per batch with ``payload[field]`` = column.
+
+    ``f32`` columns are a single little-endian float32 ``bytes`` buffer
+    (``np.frombuffer``-ready) rather than a list of lists.
+    """
+
+    for tag, ver, f32, batch in _read_batches(fp):
+        if (tag, ver) in MIGRATORS:
+            _decode_f32(batch, f32)
+            tag, ver, batch = migrate_batch(tag, ver, batch)
+            for name in f32:
+                for p in batch:
+                    if isinstance(p.get(name), (list, tuple)):
+                        p[name] = _pack_f32(p[name])
+        fields = list(batch[0]) if batch else []
+        try:
+            cols: dict[str, Any] = {name: [p[name] for p in batch] for name in fields}
+        except KeyError as exc:
+            raise ValueError(f"batch records do not share field {exc}") from exc
+        for name in f32:
+            col = cols.get(name)
+            if col and all(isinstance(v, bytes) for v in col):
+                cols[name] = b"".join(col)
+        yield Envelope(tag, ver, cols)
+
+
 __all__ = [
     "Envelope",
     "Encoder",
@@ -306,6 +609,11 @@ __all__ = [
     "dec_result",
     "enc_validation",
     "dec_validation",
+    "enc_chunk_batch",
+    "dec_chunk_batch",
+    "enc_chunk",
+    "dec_chunk",
+    "dec_chunk_columns",
     "to_json",
     "from_json",
     "to_msgpack",
@@ -315,4 +623,9 @@ __all__ = [
     "migrate",
     "iter_ndjson",
     "iter_msgpack",
+    "BATCH_STREAM_MAGIC",
+    "write_msgpack_batches",
+    "migrate_batch",
+    "iter_msgpack_batches",
+    "iter_msgpack_columns",
 ]
@@ -14,6 +14,8 @@ import json
 from pathlib import Path
 from typing import Any, cast
 
+from funcpipe_rag.boundaries.adapters.manifest import fingerprint, load_manifest, plan_ingest, save_manifest
+from funcpipe_rag.boundaries.shells.rag_api_shell import tombstones_path, write_tombstones_jsonl
 from funcpipe_rag.core.rag_types import RawDoc
 from funcpipe_rag.infra.adapters.file_storage import FileStorage
 from funcpipe_rag.pipelines.cli import deep_merge, parse_override
@@ -53,6 +55,12 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("input_csv", type=Path)
     p.add_argument("--config", type=Path, required=True)
     p.add_argument("--set", dest="overrides", action="append", default=[], help="Override a.b.c=value")
+    p.add_argument(
+        "--manifest",
+        type=Path,
+        help="Incremental mode: only process docs changed since this manifest; "
+        "changed/removed ids are written to <manifest>.tombstones.jsonl",
+    )
     args = p.parse_args(argv)
 
     cfg = _load_config(args.config)
@@ -80,12 +88,30 @@ def main(argv: list[str] | None = None) -> int:
         else:
             return _render(Err(doc_res.error))
 
+    manifest_path = cast(Path | None, args.manifest)
+    plan = None
+    if manifest_path is not None:
+        manifest_res = load_manifest(str(manifest_path))
+        if isinstance(manifest_res, Err):
+            return _render(Err(ErrInfo(code="IO_MANIFEST", msg=manifest_res.error, stage="cli.manifest")))
+        steps_payload = [{"name": s.name, "params": dict(s.params)} for s in cfg.steps]
+        plan = plan_ingest(ok_docs, manifest_res.value, fingerprint(steps_payload))
+        ok_docs = list(plan.to_process)
+
     pipe = build_rag_pipeline(cfg)
     results = pipe(iter(ok_docs))
     # minimal sink: force execution and report first error if any
     for out_res in results:
         if isinstance(out_res, Err):
             return _render(out_res)
+
+    if plan is not None and manifest_path is not None:
+        tomb_res = write_tombstones_jsonl(tombstones_path(str(manifest_path)), plan)
+        if isinstance(tomb_res, Err):
+            return _render(Err(ErrInfo(code="IO_WRITE", msg=tomb_res.error, stage="cli.manifest")))
+        save_res = save_manifest(str(manifest_path), plan.manifest)
+        if isinstance(save_res, Err):
+            return _render(Err(ErrInfo(code="IO_MANIFEST", msg=save_res.error, stage="cli.manifest")))
     return 0
 
 
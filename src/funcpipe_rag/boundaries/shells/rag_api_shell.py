@@ -1,12 +1,23 @@
-"""CSV-in / JSONL-out boundary shell for the end-of-Module-09 API."""
+"""CSV-in / JSONL-out boundary shell for the end-of-Module-09 API (``.gz``/``.bz2``/``.xz`` paths are compressed transparently)."""
 
 from __future__ import annotations
 
 import csv
 import json
-from dataclasses import asdict
+import os
+import tempfile
+from dataclasses import replace
 from typing import Iterable
 
+from funcpipe_rag.boundaries.adapters.manifest import (
+    IngestPlan,
+    load_manifest,
+    plan_ingest,
+    rag_config_fingerprint,
+    save_manifest,
+)
+from funcpipe_rag.infra.adapters.compression import codec_for, open_text, text_writer
+from funcpipe_rag.infra.adapters.jsonl_writer import encode_chunk_line, write_lines
 from funcpipe_rag.rag.config import DocsReader, RagBoundaryDeps, RagConfig, get_deps
 from funcpipe_rag.rag.rag_api import full_rag_api
 from funcpipe_rag.rag.types import Observations
@@ -19,7 +30,7 @@ class FSReader(DocsReader):
 
     def read_docs(self, path: str) -> Result[list[RawDoc], str]:
         try:
-            with open(path, encoding="utf-8") as f_in:
+            with open_text(path) as f_in:
                 reader = csv.DictReader(f_in)
                 return Ok([RawDoc(**row) for row in reader])
         except (OSError, csv.Error, TypeError, ValueError) as exc:
@@ -28,28 +39,94 @@ class FSReader(DocsReader):
 
 def write_chunks_jsonl(path: str, chunks: Iterable[Chunk]) -> Result[None, str]:
     try:
-        with open(path, "w", encoding="utf-8") as f_out:
-            for chunk in chunks:
-                json.dump(asdict(chunk), f_out, ensure_ascii=False)
+        with open(path, "wb") as raw, text_writer(raw, codec_for(path)) as f_out:
+            write_lines(f_out, map(encode_chunk_line, chunks))
+        return Ok(None)
+    except OSError as exc:
+        return Err(f"Write failed: {exc}")
+
+
+def tombstones_path(manifest_path: str) -> str:
+    """Where an incremental run writes its tombstones: next to the manifest."""
+
+    return manifest_path + ".tombstones.jsonl"
+
+
+def write_tombstones_jsonl(path: str, plan: IngestPlan) -> Result[None, str]:
+    """One record per doc whose previously emitted chunks must be dropped downstream.
+
+    New docs had no earlier chunks, so they are never tombstoned. The file is
+    replaced atomically (temp + fsync + rename), like the manifest.
+    """
+
+    tmp_path: str | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=os.path.dirname(path) or ".", delete=False, encoding="utf-8"
+        ) as f_out:
+            tmp_path = f_out.name
+            for doc in plan.changed:
+                json.dump({"doc_id": doc.doc_id, "reason": "changed"}, f_out, ensure_ascii=False)
+                f_out.write("\n")
+            for doc_id in plan.removed:
+                json.dump({"doc_id": doc_id, "reason": "removed"}, f_out, ensure_ascii=False)
                 f_out.write("\n")
+            f_out.flush()
+            os.fsync(f_out.fileno())
+        os.replace(tmp_path, path)
         return Ok(None)
     except OSError as exc:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
         return Err(f"Write failed: {exc}")
 
 
-def run(input_path: str, output_path: str, *, config: RagConfig) -> Result[Observations, str]:
-    """Effectful boundary: read docs, run pure core, write chunks."""
+def run(
+    input_path: str,
+    output_path: str,
+    *,
+    config: RagConfig,
+    manifest_path: str | None = None,
+) -> Result[Observations, str]:
+    """Effectful boundary: read docs, run pure core, write chunks.
+
+    With ``manifest_path`` the run is incremental: only new/changed docs are
+    processed and written to ``output_path``; changed (not new) and removed doc
+    ids are written to ``tombstones_path(manifest_path)`` (the same file the
+    CLI's ``--manifest`` mode uses); the manifest is saved last, so
+    a failed run is simply retried in full. Delta counts are reported in
+    ``Observations.extra`` as ``("manifest", ManifestStats)``.
+    """
 
     reader = FSReader()
     deps = RagBoundaryDeps(core=get_deps(config), reader=reader)
     docs_res = deps.reader.read_docs(input_path)
     if isinstance(docs_res, Err):
         return Err(docs_res.error)
-    chunks, obs = full_rag_api(docs_res.value, config, deps.core)
+    docs = docs_res.value
+
+    plan: IngestPlan | None = None
+    if manifest_path is not None:
+        manifest_res = load_manifest(manifest_path)
+        if isinstance(manifest_res, Err):
+            return Err(manifest_res.error)
+        plan = plan_ingest(docs, manifest_res.value, rag_config_fingerprint(config, deps.core))
+        docs = list(plan.to_process)
+
+    chunks, obs = full_rag_api(docs, config, deps.core)
     write_res = write_chunks_jsonl(output_path, chunks)
     if isinstance(write_res, Err):
         return Err(write_res.error)
-    return Ok(obs)
+    if plan is None or manifest_path is None:
+        return Ok(obs)
+
+    tomb_res = write_tombstones_jsonl(tombstones_path(manifest_path), plan)
+    if isinstance(tomb_res, Err):
+        return Err(tomb_res.error)
+    save_res = save_manifest(manifest_path, plan.manifest)
+    if isinstance(save_res, Err):
+        return Err(save_res.error)
+    return Ok(replace(obs, extra=obs.extra + (("manifest", plan.stats),)))
 
 
-__all__ = ["DocsReader", "FSReader", "write_chunks_jsonl", "run"]
+__all__ = ["DocsReader", "FSReader", "run", "tombstones_path", "write_chunks_jsonl", "write_tombstones_jsonl"]
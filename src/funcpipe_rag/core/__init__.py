@@ -13,6 +13,8 @@ from .rules_pred import (
     RulesConfig,
     DEFAULT_RULES,
     eval_pred,
+    compile_pred,
+    pred_paths,
 )
 from .rules_dsl import (
     any_doc,
@@ -26,8 +28,18 @@ from .rules_dsl import (
     rule_all,
     parse_rule,
 )
+from .rules_adaptive import AdaptivePred, PredStats, compile_rules
 from .rules_lint import SafeVisitor, assert_rule_is_safe_expr
-from .structural_dedup import DedupIterator, structural_dedup_lazy
+from .text_arena import TextArena, iter_text_arenas
+from .structural_dedup import (
+    BloomFilter,
+    DedupIterator,
+    FingerprintSet,
+    LRUWindow,
+    chunk_fingerprint,
+    structural_dedup_compact,
+    structural_dedup_lazy,
+)
 
 __all__ = [
     "Pred",
@@ -40,6 +52,11 @@ __all__ = [
     "RulesConfig",
     "DEFAULT_RULES",
     "eval_pred",
+    "compile_pred",
+    "pred_paths",
+    "AdaptivePred",
+    "PredStats",
+    "compile_rules",
     "any_doc",
     "none_doc",
     "category_startswith",
@@ -54,4 +71,11 @@ __all__ = [
     "assert_rule_is_safe_expr",
     "DedupIterator",
     "structural_dedup_lazy",
+    "structural_dedup_compact",
+    "TextArena",
+    "iter_text_arenas",
+    "chunk_fingerprint",
+    "FingerprintSet",
+    "BloomFilter",
+    "LRUWindow",
 ]
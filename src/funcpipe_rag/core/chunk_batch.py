@@ -0,0 +1,330 @@
+"""Columnar (struct-of-arrays) chunk batches (end-of-Module-09; NumPy path).
+
+`Chunk` is the canonical per-record value type. For multi-million-chunk runs,
+`ChunkBatch` stores the same information column-wise:
+
+- ``doc_ids``: dictionary of distinct doc ids; ``doc_codes`` indexes into it
+- ``starts`` / ``ends``: int64 offsets
+- ``text_arena``: one UTF-8 buffer; row ``i`` is ``text_arena[text_offsets[i]:text_offsets[i + 1]]``
+- ``embeddings``: an ``(N, 16)`` matrix (float32 by default), or ``None`` for
+  chunks that have not been embedded yet
+- ``metadata``: sparse ``row -> dict`` for the (rare) rows with metadata
+
+Conversion to and from `Chunk` is lossless for float32-representable
+embeddings (e.g. `rag.batch_embed.embed_chunks_batch` output); pass
+``dtype=np.float64`` to `ChunkBatch.from_chunks` for exact round trips of
+arbitrary vectors. This module imports NumPy and is therefore not re-exported
+from `funcpipe_rag.core`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+from funcpipe_rag.core.rag_types import Chunk, ChunkWithoutEmbedding, SpanChunk
+
+EMBED_DIM = 16
+
+
+@dataclass(frozen=True, eq=False)
+class ChunkBatch:
+    """Immutable struct-of-arrays view over a run of chunks."""
+
+    doc_ids: tuple[str, ...]
+    doc_codes: NDArray[np.int32]
+    starts: NDArray[np.int64]
+    ends: NDArray[np.int64]
+    text_arena: bytes
+    text_offsets: NDArray[np.int64]
+    embeddings: NDArray[np.floating[Any]] | None = None
+    metadata: Mapping[int, Mapping[str, object]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        n = len(self.doc_codes)
+        if len(self.starts) != n or len(self.ends) != n:
+            raise ValueError("ChunkBatch columns must have equal length")
+        if len(self.text_offsets) != n + 1:
+            raise ValueError("ChunkBatch.text_offsets must have len(batch) + 1 entries")
+        if self.embeddings is not None and self.embeddings.shape != (n, EMBED_DIM):
+            raise ValueError(f"ChunkBatch.embeddings must have shape ({n}, {EMBED_DIM})")
+        for col in (self.doc_codes, self.starts, self.ends, self.text_offsets, self.embeddings):
+            if col is not None:
+                col.setflags(write=False)
+
+    def __len__(self) -> int:
+        return len(self.doc_codes)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate payload size of the columns (excluding the doc-id dictionary)."""
+
+        cols = (self.doc_codes, self.starts, self.ends, self.text_offsets, self.embeddings)
+        return len(self.text_arena) + sum(c.nbytes for c in cols if c is not None)
+
+    @classmethod
+    def from_chunks(
+        cls,
+        chunks: Iterable[ChunkWithoutEmbedding | SpanChunk],
+        *,
+        dtype: DTypeLike = np.float32,
+    ) -> ChunkBatch:
+        """Pack chunks column-wise; all rows must agree on having an embedding.
+
+        `SpanChunk` rows are copied into the arena straight from their parent
+        buffer, without materializing an intermediate ``str``.
+        """
+
+        codes: dict[str, int] = {}
+        doc_codes: list[int] = []
+        starts: list[int] = []
+        ends: list[int] = []
+        texts: list[bytes | memoryview] = []
+        vectors: list[tuple[float, ...]] = []
+        metadata: dict[int, Mapping[str, object]] = {}
+        embedded: bool | None = None
+
+        for row, c in enumerate(chunks):
+            is_chunk = isinstance(c, Chunk)
+            if embedded is None:
+                embedded = is_chunk
+            elif embedded != is_chunk:
+                raise ValueError("ChunkBatch rows must be all Chunk or all ChunkWithoutEmbedding")
+            doc_codes.append(codes.setdefault(c.doc_id, len(codes)))
+            starts.append(c.start)
+            ends.append(c.end)
+            texts.append(c.text_bytes() if isinstance(c, SpanChunk) else c.text.encode("utf-8"))
+            if isinstance(c, Chunk):
+                vectors.append(c.embedding)
+            if c.metadata:
+                metadata[row] = dict(c.metadata)
+
+        offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum([len(t) for t in texts], out=offsets[1:])
+        embeddings = np.asarray(vectors, dtype=dtype).reshape(len(vectors), EMBED_DIM) if embedded else None
+        return cls(
+            doc_ids=tuple(codes),
+            doc_codes=np.asarray(doc_codes, dtype=np.int32),
+            starts=np.asarray(starts, dtype=np.int64),
+            ends=np.asarray(ends, dtype=np.int64),
+            text_arena=b"".join(texts),
+            text_offsets=offsets,
+            embeddings=embeddings,
+            metadata=metadata,
+        )
+
+    @classmethod
+    def concat(cls, batches: Sequence[ChunkBatch]) -> ChunkBatch:
+        """Concatenate batches, re-encoding the doc-id dictionaries."""
+
+        if not batches:
+            return cls.from_chunks(())
+        embedded = {b.embeddings is not None for b in batches if len(b)}
+        if len(embedded) > 1:
+            raise ValueError("cannot concat embedded and non-embedded ChunkBatches")
+
+        codes: dict[str, int] = {}
+        doc_codes: list[NDArray[np.int32]] = []
+        offsets: list[NDArray[np.int64]] = [np.zeros(1, dtype=np.int64)]
+        metadata: dict[int, Mapping[str, object]] = {}
+        row_base = 0
+        byte_base = 0
+        for b in batches:
+            remap = np.asarray([codes.setdefault(d, len(codes)) for d in b.doc_ids], dtype=np.int32)
+            doc_codes.append(remap[b.doc_codes])
+            offsets.append(b.text_offsets[1:] + byte_base)
+            metadata.update({row_base + row: meta for row, meta in b.metadata.items()})
+            row_base += len(b)
+            byte_base += len(b.text_arena)
+
+        matrices = [b.embeddings for b in batches if b.embeddings is not None]
+        return cls(
+            doc_ids=tuple(codes),
+            doc_codes=np.concatenate(doc_codes).astype(np.int32, copy=False),
+            starts=np.concatenate([b.starts for b in batches]),
+            ends=np.concatenate([b.ends for b in batches]),
+            text_arena=b"".join(b.text_arena for b in batches),
+            text_offsets=np.concatenate(offsets),
+            embeddings=np.concatenate(matrices) if embedded == {True} else None,
+            metadata=metadata,
+        )
+
+    def to_columns(self) -> dict[str, Any]:
+        """JSON-friendly column payload (the serde ``chunk_batch`` envelope body)."""
+
+        return {
+            "doc_ids": list(self.doc_ids),
+            "doc_codes": self.doc_codes.tolist(),
+            "starts": self.starts.tolist(),
+            "ends": self.ends.tolist(),
+            "text": self.text_arena.decode("utf-8"),
+            "text_offsets": self.text_offsets.tolist(),
+            "embeddings": self.embeddings.tolist() if self.embeddings is not None else None,
+            "embedding_dtype": str(self.embeddings.dtype) if self.embeddings is not None else None,
+            "metadata": {str(row): dict(meta) for row, meta in self.metadata.items()},
+        }
+
+    @classmethod
+    def from_columns(cls, cols: Mapping[str, Any]) -> ChunkBatch:
+        """Inverse of `to_columns`; raises ValueError on malformed payloads."""
+
+        try:
+            embeddings = cols["embeddings"]
+            text = cols["text"]
+            if not isinstance(text, str):
+                raise ValueError("chunk_batch.text must be str")  # noqa: TRY004 - decode errors are ValueError
+            return cls(
+                doc_ids=tuple(cols["doc_ids"]),
+                doc_codes=np.asarray(cols["doc_codes"], dtype=np.int32),
+                starts=np.asarray(cols["starts"], dtype=np.int64),
+                ends=np.asarray(cols["ends"], dtype=np.int64),
+                text_arena=text.encode("utf-8"),
+                text_offsets=np.asarray(cols["text_offsets"], dtype=np.int64),
+                embeddings=(
+                    None
+                    if embeddings is None
+                    else np.asarray(embeddings, dtype=cols["embedding_dtype"]).reshape(-1, EMBED_DIM)
+                ),
+                metadata={int(row): dict(meta) for row, meta in cols.get("metadata", {}).items()},
+            )
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"invalid chunk_batch payload: {exc}") from exc
+
+    def doc_id(self, row: int) -> str:
+        return self.doc_ids[int(self.doc_codes[row])]
+
+    def text_bytes(self, row: int) -> memoryview:
+        """Zero-copy UTF-8 view of a row's text."""
+
+        lo, hi = int(self.text_offsets[row]), int(self.text_offsets[row + 1])
+        return memoryview(self.text_arena)[lo:hi]
+
+    def text(self, row: int) -> str:
+        lo, hi = int(self.text_offsets[row]), int(self.text_offsets[row + 1])
+        return self.text_arena[lo:hi].decode("utf-8")
+
+    def iter_chunks(self) -> Iterator[ChunkWithoutEmbedding]:
+        """Materialize rows as `Chunk` (or `ChunkWithoutEmbedding` when not embedded)."""
+
+        offsets = self.text_offsets.tolist()
+        starts = self.starts.tolist()
+        ends = self.ends.tolist()
+        codes = self.doc_codes.tolist()
+        vectors = self.embeddings.tolist() if self.embeddings is not None else None
+        arena = self.text_arena
+        for row in range(len(self)):
+            fields: dict[str, Any] = {
+                "doc_id": self.doc_ids[codes[row]],
+                "text": arena[offsets[row] : offsets[row + 1]].decode("utf-8"),
+                "start": starts[row],
+                "end": ends[row],
+                "metadata": self.metadata.get(row, {}),
+            }
+            if vectors is None:
+                yield ChunkWithoutEmbedding(**fields)
+            else:
+                yield Chunk(**fields, embedding=tuple(vectors[row]))
+
+    def to_chunks(self) -> list[ChunkWithoutEmbedding]:
+        return list(self.iter_chunks())
+
+    def iter_jsonable(self) -> Iterator[dict[str, object]]:
+        """Yield JSONL-ready records (same field order as `Chunk`) without building `Chunk`s."""
+
+        offsets = self.text_offsets.tolist()
+        starts = self.starts.tolist()
+        ends = self.ends.tolist()
+        codes = self.doc_codes.tolist()
+        vectors = self.embeddings.tolist() if self.embeddings is not None else None
+        arena = self.text_arena
+        for row in range(len(self)):
+            record: dict[str, object] = {
+                "doc_id": self.doc_ids[codes[row]],
+                "text": arena[offsets[row] : offsets[row + 1]].decode("utf-8"),
+                "start": starts[row],
+                "end": ends[row],
+                "metadata": dict(self.metadata.get(row, {})),
+            }
+            if vectors is not None:
+                record["embedding"] = vectors[row]
+            yield record
+
+    def take(self, rows: Sequence[int] | NDArray[np.intp]) -> ChunkBatch:
+        """Gather ``rows`` (in the given order) into a new batch."""
+
+        idx = np.asarray(rows, dtype=np.intp)
+        lo = self.text_offsets[idx]
+        hi = self.text_offsets[idx + 1]
+        offsets = np.zeros(len(idx) + 1, dtype=np.int64)
+        np.cumsum(hi - lo, out=offsets[1:])
+        arena = self.text_arena
+        new_rows = {int(old): new for new, old in enumerate(idx.tolist())}
+        return ChunkBatch(
+            doc_ids=self.doc_ids,
+            doc_codes=self.doc_codes[idx],
+            starts=self.starts[idx],
+            ends=self.ends[idx],
+            text_arena=b"".join(arena[a:b] for a, b in zip(lo.tolist(), hi.tolist())),
+            text_offsets=offsets,
+            embeddings=self.embeddings[idx] if self.embeddings is not None else None,
+            metadata={new_rows[r]: m for r, m in self.metadata.items() if r in new_rows},
+        )
+
+
+def iter_chunk_batches(chunks: Iterable[ChunkWithoutEmbedding], batch_size: int) -> Iterator[ChunkBatch]:
+    """Pack a chunk stream into `ChunkBatch`es of at most ``batch_size`` rows."""
+
+    if batch_size <= 0:
+        raise ValueError("batch_size must be > 0")
+    it = iter(chunks)
+    while batch := list(islice(it, batch_size)):
+        yield ChunkBatch.from_chunks(batch)
+
+
+def _row_key(batch: ChunkBatch, row: int) -> tuple[str, int, int, bytes]:
+    lo, hi = int(batch.text_offsets[row]), int(batch.text_offsets[row + 1])
+    return (batch.doc_id(row), int(batch.starts[row]), int(batch.ends[row]), batch.text_arena[lo:hi])
+
+
+def structural_dedup_batch(batch: ChunkBatch) -> ChunkBatch:
+    """Columnar `structural_dedup_chunks`: stable sort by (doc_id, start), then drop duplicates."""
+
+    rank = np.empty(len(batch.doc_ids), dtype=np.int64)
+    rank[sorted(range(len(batch.doc_ids)), key=batch.doc_ids.__getitem__)] = np.arange(len(batch.doc_ids))
+    order = np.lexsort((batch.starts, rank[batch.doc_codes])) if len(batch) else np.zeros(0, dtype=np.intp)
+
+    seen: set[tuple[str, int, int, bytes]] = set()
+    keep: list[int] = []
+    for row in order.tolist():
+        k = _row_key(batch, row)
+        if k not in seen:
+            seen.add(k)
+            keep.append(row)
+    return batch.take(keep)
+
+
+def gen_deduped_batches(batches: Iterable[ChunkBatch]) -> Iterator[ChunkBatch]:
+    """Columnar `structural_dedup_lazy`: first occurrence wins across the whole batch stream."""
+
+    seen: set[tuple[str, int, int, bytes]] = set()
+    for batch in batches:
+        keep: list[int] = []
+        for row in range(len(batch)):
+            k = _row_key(batch, row)
+            if k not in seen:
+                seen.add(k)
+                keep.append(row)
+        yield batch if len(keep) == len(batch) else batch.take(keep)
+
+
+__all__ = [
+    "ChunkBatch",
+    "gen_deduped_batches",
+    "iter_chunk_batches",
+    "structural_dedup_batch",
+]
@@ -13,6 +13,7 @@ from dataclasses import dataclass, field
 from types import MappingProxyType
 
 TailPolicy = str
+ChunkMode = str
 
 
 @dataclass(frozen=True)
@@ -73,14 +74,133 @@ class Chunk(ChunkWithoutEmbedding):
             raise ValueError("Chunk.embedding must be a 16-dimensional tuple[float, ...]")
 
 
+class SpanSource:
+    """Shared parent buffer for the span chunks of one document.
+
+    The UTF-8 encoding is computed at most once per document and only when an
+    embedder or writer asks for bytes. For ASCII text, character offsets are
+    byte offsets, so span bytes are zero-copy ``memoryview`` slices.
+    `from_utf8` wraps an existing buffer (e.g. a `TextArena` slice) instead;
+    ASCII buffers are then never decoded as a whole.
+    """
+
+    __slots__ = ("_ascii", "_len", "_text", "_utf8")
+
+    def __init__(self, text: str) -> None:
+        self._text: str | None = text
+        self._utf8: bytes | memoryview | None = None
+        self._ascii = text.isascii()
+        self._len = len(text)
+
+    @classmethod
+    def from_utf8(cls, data: bytes | memoryview, *, ascii: bool | None = None) -> SpanSource:
+        """Wrap UTF-8 ``data``; pass ``ascii`` when the caller already knows it."""
+
+        is_ascii = ascii if ascii is not None else bytes(data).isascii()
+        if not is_ascii:
+            source = cls(str(data, "utf-8"))
+            source._utf8 = data
+            return source
+        source = cls.__new__(cls)
+        source._text = None
+        source._utf8 = data
+        source._ascii = True
+        source._len = len(data)
+        return source
+
+    def __repr__(self) -> str:
+        return f"SpanSource(len={self._len})"
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = str(self.utf8(), "ascii")
+        return self._text
+
+    def utf8(self) -> bytes | memoryview:
+        if self._utf8 is None:
+            self._utf8 = self.text.encode("utf-8")
+        return self._utf8
+
+    def slice_text(self, start: int, end: int) -> str:
+        if self._text is None:
+            return str(self.utf8()[start:end], "ascii")
+        return self._text[start:end]
+
+    def slice_bytes(self, start: int, end: int) -> bytes | memoryview:
+        if self._ascii:
+            return memoryview(self.utf8())[start:end]
+        return self.text[start:end].encode("utf-8")
+
+
+_NO_METADATA: Mapping[str, object] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class SpanChunk:
+    """Zero-copy chunk view: a ``(start, end)`` span over a shared `SpanSource`.
+
+    ``text`` is sliced from the parent abstract on access; ``text_bytes`` reads
+    straight from the parent's UTF-8 buffer. A span past the end of the source
+    (``tail_policy="pad"``) is NUL-padded exactly like `ChunkWithoutEmbedding`.
+    """
+
+    doc_id: str
+    source: SpanSource = field(compare=False)
+    start: int
+    end: int
+    metadata: Mapping[str, object] = field(default_factory=lambda: _NO_METADATA, compare=False)
+
+    @property
+    def text(self) -> str:
+        segment = self.source.slice_text(self.start, self.end)
+        pad = self.end - self.start - len(segment)
+        return segment + "\0" * pad if pad > 0 else segment
+
+    def text_bytes(self) -> bytes | memoryview:
+        view = self.source.slice_bytes(self.start, self.end)
+        pad = self.end - max(self.start, min(self.end, len(self.source)))
+        return bytes(view) + b"\0" * pad if pad > 0 else view
+
+    def to_chunk(self) -> ChunkWithoutEmbedding:
+        return ChunkWithoutEmbedding(
+            doc_id=self.doc_id,
+            text=self.text,
+            start=self.start,
+            end=self.end,
+            metadata=self.metadata,
+        )
+
+
 @dataclass(frozen=True)
 class RagEnv:
-    """Immutable configuration for a single pipeline run."""
+    """Immutable configuration for a single pipeline run.
+
+    ``chunk_mode="fixed"`` cuts fixed ``chunk_size`` windows. ``"cdc"`` cuts
+    content-defined chunks (Gear rolling hash) averaging ``chunk_size``
+    characters, bounded by ``min_chunk_size`` (default ``chunk_size // 4``) and
+    ``max_chunk_size`` (default ``4 * chunk_size``); it takes no overlap, and a
+    ``"drop"`` tail policy drops a final chunk shorter than the minimum.
+    """
 
     chunk_size: int
     sample_size: int = 5
     overlap: int = 0
     tail_policy: TailPolicy = "emit_short"
+    chunk_mode: ChunkMode = "fixed"
+    min_chunk_size: int | None = None
+    max_chunk_size: int | None = None
+
+    @property
+    def cdc_bounds(self) -> tuple[int, int, int]:
+        """``(min, avg, max)`` chunk sizes for ``chunk_mode="cdc"``."""
+
+        lo = self.min_chunk_size if self.min_chunk_size is not None else max(1, self.chunk_size // 4)
+        hi = self.max_chunk_size if self.max_chunk_size is not None else 4 * self.chunk_size
+        return lo, self.chunk_size, hi
 
     def __post_init__(self) -> None:
         if not isinstance(self.chunk_size, int):
@@ -97,6 +217,20 @@ class RagEnv:
             raise ValueError("RagEnv.overlap must satisfy 0 <= overlap < chunk_size")
         if self.tail_policy not in {"emit_short", "drop", "pad"}:
             raise ValueError('RagEnv.tail_policy must be one of: "emit_short", "drop", "pad"')
+        if self.chunk_mode not in {"fixed", "cdc"}:
+            raise ValueError('RagEnv.chunk_mode must be one of: "fixed", "cdc"')
+        for name in ("min_chunk_size", "max_chunk_size"):
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, int):
+                raise ValueError(f"RagEnv.{name} must be an int or None")
+        if self.chunk_mode == "cdc":
+            lo, avg, hi = self.cdc_bounds
+            if not 1 <= lo <= avg <= hi:
+                raise ValueError("RagEnv cdc bounds must satisfy 1 <= min_chunk_size <= chunk_size <= max_chunk_size")
+            if self.overlap != 0:
+                raise ValueError('RagEnv.overlap must be 0 when chunk_mode="cdc"')
+            if self.tail_policy == "pad":
+                raise ValueError('RagEnv.tail_policy "pad" is not supported when chunk_mode="cdc"')
 
 
 @dataclass(frozen=True)
@@ -127,7 +261,10 @@ __all__ = [
     "CleanDoc",
     "ChunkWithoutEmbedding",
     "Chunk",
+    "SpanSource",
+    "SpanChunk",
     "TailPolicy",
+    "ChunkMode",
     "RagEnv",
     "TextNode",
     "TreeDoc",
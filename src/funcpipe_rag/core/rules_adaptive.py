@@ -0,0 +1,171 @@
+"""Adaptive ordering of ``All``/``AnyOf`` children by observed cost and selectivity (end-of-Module-09).
+
+`compile_pred` keeps declaration order, so a costly ``LenGt`` on the abstract
+may run before a cheap, highly selective ``Eq`` on categories. `AdaptivePred`
+evaluates *every* child for the first ``sample`` docs, recording per-child
+time and pass rate, then freezes an order that minimizes expected cost for
+independent filters and switches to a plain short-circuiting closure:
+
+- ``All``:   ascending ``mean_cost / (1 - pass_rate)`` (cheap rejectors first)
+- ``AnyOf``: ascending ``mean_cost / pass_rate``       (cheap acceptors first)
+
+Children are pure, but a leaf can raise on a field of the wrong type (e.g.
+``StartsWith`` on ``categories=None``) that `eval_pred` would never reach
+because an earlier child already decided. So whenever a child raises, while
+sampling or in the frozen order, the doc is re-evaluated in declaration
+order. The contract is the one `compile_pred` has: whenever `eval_pred`
+returns, `AdaptivePred` returns the same value. Where `eval_pred` raises, a
+reordered child may decide first and return instead, but it never raises
+where `eval_pred` returns. Ties fall back to declaration order, and the
+timer is injectable so the order itself can be made deterministic. Nested
+``All``/``AnyOf`` children adapt independently.
+
+Each `compile_rules` call builds a fresh `AdaptivePred`. To keep one across
+calls, and to read back its `order` / `stats`, compile it once and pass it
+as ``keep=`` to `iter_rag_core`; `parallel_rag_core` does this once per
+worker process.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from operator import attrgetter
+
+from funcpipe_rag.core.rag_types import RawDoc
+from funcpipe_rag.core.rules_pred import (
+    Accessor,
+    All,
+    AnyOf,
+    DocPred,
+    Pred,
+    RulesConfig,
+    compile_node,
+    compile_pred,
+    flatten_rules,
+    join_preds,
+)
+
+_EPS = 1e-9
+
+
+@dataclass(frozen=True)
+class PredStats:
+    calls: int
+    passes: int
+    total_ns: int
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passes / self.calls if self.calls else 0.0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+class AdaptivePred:
+    """Callable ``RawDoc -> bool`` for an ``All``/``AnyOf`` that reorders itself once."""
+
+    def __init__(
+        self,
+        pred: All | AnyOf,
+        *,
+        sample: int = 256,
+        timer: Callable[[], int] = time.perf_counter_ns,
+        accessor: Accessor = attrgetter,
+    ) -> None:
+        if not isinstance(pred, (All, AnyOf)):
+            raise ValueError("AdaptivePred requires an All or AnyOf predicate")  # noqa: TRY004 - bad arguments are ValueError here
+        if sample <= 0:
+            raise ValueError("sample must be > 0")
+        self.pred = pred
+        self.any_of = isinstance(pred, AnyOf)
+        self.children: tuple[Pred, ...] = tuple(flatten_rules(type(pred), pred.rules))
+        self.subnodes: dict[int, AdaptivePred] = {
+            i: AdaptivePred(c, sample=sample, timer=timer, accessor=accessor)
+            for i, c in enumerate(self.children)
+            if isinstance(c, (All, AnyOf))
+        }
+        self._fns: list[DocPred] = [self.subnodes.get(i) or compile_node(c, accessor) for i, c in enumerate(self.children)]
+        self._declared = join_preds(self._fns, any_of=self.any_of)
+        self._sample = sample
+        self._timer = timer
+        self._calls = 0
+        self._passes = [0] * len(self.children)
+        self._ns = [0] * len(self.children)
+        self._order: tuple[int, ...] = tuple(range(len(self.children)))
+        self._fast: DocPred | None = None
+
+    def __call__(self, doc: RawDoc) -> bool:
+        fast = self._fast
+        if fast is None:
+            return self._observe(doc)
+        try:
+            return fast(doc)
+        except Exception:  # noqa: BLE001 - declaration order decides whether it really raises
+            return self._declared(doc)
+
+    @property
+    def frozen(self) -> bool:
+        return self._fast is not None
+
+    @property
+    def order(self) -> tuple[int, ...]:
+        """Child indexes (into `children`) in evaluation order; declaration order until frozen."""
+
+        return self._order
+
+    @property
+    def stats(self) -> tuple[PredStats, ...]:
+        """Per-child sampling stats, in declaration order."""
+
+        return tuple(PredStats(self._calls, p, ns) for p, ns in zip(self._passes, self._ns))
+
+    def _observe(self, doc: RawDoc) -> bool:
+        timer = self._timer
+        hits = 0
+        raised = False
+        for i, fn in enumerate(self._fns):
+            t0 = timer()
+            try:
+                ok = fn(doc)
+            except Exception:  # noqa: BLE001 - counted as a miss; re-run in declaration order below
+                ok, raised = False, True
+            self._ns[i] += timer() - t0
+            if ok:
+                self._passes[i] += 1
+                hits += 1
+        self._calls += 1
+        if self._calls >= self._sample:
+            self._freeze()
+        if raised:
+            return self._declared(doc)
+        return hits > 0 if self.any_of else hits == len(self._fns)
+
+    def _freeze(self) -> None:
+        def rank(i: int) -> tuple[float, int]:
+            st = PredStats(self._calls, self._passes[i], self._ns[i])
+            decisive = st.pass_rate if self.any_of else 1.0 - st.pass_rate
+            return max(st.mean_ns, _EPS) / max(decisive, _EPS), i
+
+        self._order = tuple(sorted(range(len(self._fns)), key=rank))
+        self._fast = join_preds([self._fns[i] for i in self._order], any_of=self.any_of)
+
+
+def compile_rules(
+    rules: RulesConfig,
+    *,
+    timer: Callable[[], int] = time.perf_counter_ns,
+    accessor: Accessor = attrgetter,
+) -> DocPred:
+    """Keep-predicate for a `RulesConfig`: adaptive when ``adaptive_sample > 0``, else `compile_pred`."""
+
+    pred = rules.keep_pred
+    if rules.adaptive_sample > 0 and isinstance(pred, (All, AnyOf)):
+        return AdaptivePred(pred, sample=rules.adaptive_sample, timer=timer, accessor=accessor)
+    return compile_pred(pred, accessor=accessor)
+
+
+__all__ = ["AdaptivePred", "PredStats", "compile_rules"]
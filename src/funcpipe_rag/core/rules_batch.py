@@ -0,0 +1,175 @@
+"""Vectorized `Pred` evaluation over columnar doc batches (end-of-Module-09; NumPy path).
+
+`eval_pred` / `compile_pred` decide one `RawDoc` at a time. `eval_pred_batch`
+evaluates the same tree over a batch laid out as columns (one array per doc
+field) and returns a boolean mask, so a reader can drop most rows before any
+`RawDoc` is built. Leaves map to array ops:
+
+- ``Eq``         -> ``col == value``
+- ``StartsWith`` -> ``np.char.startswith(col, value)``
+- ``LenGt``      -> ``np.char.str_len(col) > value``
+- ``All`` / ``AnyOf`` / ``Not`` -> ``&`` / ``|`` / ``~`` (nested nodes flattened)
+
+Columns may be a mapping of field name to sequence/array, or a pandas
+DataFrame when pandas is installed (see `interop.dataframes`), in which case
+the ``Series.str`` accessors are used instead. NumPy fixed-width (``U``)
+strings cannot hold trailing NUL characters; such values compare as if the
+NULs were absent.
+
+Cells that are not ``str`` (``None`` from a short CSV row, pandas ``NaN``)
+are never stringified. ``Eq`` compares them with ``==``, exactly as
+`eval_pred` does. ``StartsWith`` / ``LenGt``, on which `eval_pred` raises,
+are False for them. So ``mask[i] == eval_pred(row_i, pred)`` whenever
+`eval_pred` returns, and the mask never raises where it would not.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from funcpipe_rag.core.rag_types import RawDoc
+from funcpipe_rag.core.rules_pred import (
+    PRED_PATHS,
+    All,
+    AnyOf,
+    Eq,
+    LenGt,
+    Not,
+    Pred,
+    StartsWith,
+    flatten_rules,
+)
+from funcpipe_rag.interop.dataframes import PANDAS
+
+Mask = NDArray[np.bool_]
+
+
+def doc_columns(docs: Iterable[RawDoc]) -> dict[str, NDArray[Any]]:
+    """Columnar view of a doc batch: one ``str`` array per `RawDoc` field (``object`` if it holds non-str)."""
+
+    rows = list(docs)
+    out: dict[str, NDArray[Any]] = {}
+    for path in sorted(PRED_PATHS):
+        values = [getattr(d, path) for d in rows]
+        out[path] = np.array(values, dtype=np.str_ if all(isinstance(v, str) for v in values) else object)
+    return out
+
+
+class _Columns:
+    """Per-call column cache: each referenced field is converted at most once."""
+
+    def __init__(self, columns: Mapping[str, ArrayLike] | Any) -> None:
+        self._frame = columns if PANDAS is not None and isinstance(columns, PANDAS.DataFrame) else None
+        self._raw = columns
+        self._cache: dict[str, Any] = {}
+        self._bad: dict[str, Mask | None] = {}
+        self.n = len(columns) if self._frame is not None else self._length(columns)
+
+    @staticmethod
+    def _length(columns: Mapping[str, ArrayLike]) -> int:
+        lengths = {len(np.asarray(v)) for v in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("columns must have equal length")
+        return lengths.pop() if lengths else 0
+
+    def get(self, path: str) -> Any:
+        """String column for ``path``; non-str cells hold ``""`` (see `bad`)."""
+
+        if path not in PRED_PATHS:
+            raise ValueError(f"Unknown path: {path!r}")
+        col = self._cache.get(path)
+        if col is None:
+            if path not in self._raw:
+                raise ValueError(f"Missing column: {path!r}")
+            bad: Mask | None = None
+            if self._frame is not None:
+                series = self._frame[path]
+                bad = ~series.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+                col = series.where(~bad, "").astype(str) if bad.any() else series.astype(str)
+            else:
+                col = np.asarray(self._raw[path])
+                if col.dtype.kind != "U":
+                    bad = np.fromiter((not isinstance(v, str) for v in col.tolist()), dtype=np.bool_, count=len(col))
+                    col = np.where(bad, "", col).astype(np.str_) if bad.any() else col.astype(np.str_)
+            self._bad[path] = bad if bad is not None and bad.any() else None
+            self._cache[path] = col
+        return col
+
+    def bad(self, path: str) -> Mask | None:
+        """Rows whose ``path`` cell is not a ``str``, or ``None`` if there are none."""
+
+        self.get(path)
+        return self._bad[path]
+
+    def values(self, path: str) -> list[Any]:
+        """The original cell values of ``path`` (only needed for exact ``==``)."""
+
+        raw = self._frame[path] if self._frame is not None else np.asarray(self._raw[path])
+        return list(raw.tolist())
+
+    def mask(self, values: Any) -> Mask:
+        if self._frame is not None:
+            return np.asarray(values.to_numpy(dtype=bool))
+        return np.asarray(values, dtype=np.bool_)
+
+    def eq(self, path: str, value: Any) -> Mask:
+        col = self.get(path)
+        if not isinstance(value, str) or self._bad[path] is not None:
+            # Mirror the scalar `==` exactly (None == "None" is False).
+            return np.fromiter((v == value for v in self.values(path)), dtype=np.bool_, count=self.n)
+        return self.mask(col == value)
+
+    def _str_only(self, path: str, out: Mask) -> Mask:
+        bad = self._bad[path]
+        return out if bad is None else out & ~bad
+
+    def startswith(self, path: str, prefix: str) -> Mask:
+        col = self.get(path)
+        if self._frame is not None:
+            return self._str_only(path, self.mask(col.str.startswith(prefix)))
+        return self._str_only(path, self.mask(np.char.startswith(col, prefix)))
+
+    def len_gt(self, path: str, n: int) -> Mask:
+        col = self.get(path)
+        if self._frame is not None:
+            return self._str_only(path, self.mask(col.str.len() > n))
+        return self._str_only(path, self.mask(np.char.str_len(col) > n))
+
+
+def _eval(pred: Pred, cols: _Columns) -> Mask:
+    if isinstance(pred, Eq):
+        return cols.eq(pred.path, pred.value)
+    if isinstance(pred, StartsWith):
+        return cols.startswith(pred.path, pred.value)
+    if isinstance(pred, LenGt):
+        return cols.len_gt(pred.path, pred.value)
+    if isinstance(pred, All):
+        out = np.ones(cols.n, dtype=np.bool_)
+        for p in flatten_rules(All, pred.rules):
+            out &= _eval(p, cols)
+            if not out.any():
+                break
+        return out
+    if isinstance(pred, AnyOf):
+        out = np.zeros(cols.n, dtype=np.bool_)
+        for p in flatten_rules(AnyOf, pred.rules):
+            out |= _eval(p, cols)
+            if out.all():
+                break
+        return out
+    if isinstance(pred, Not):
+        return ~_eval(pred.rule, cols)
+    raise ValueError(f"Unknown predicate: {type(pred).__name__}")
+
+
+def eval_pred_batch(pred: Pred, columns: Mapping[str, ArrayLike] | Any) -> Mask:
+    """Boolean mask with ``mask[i] == eval_pred(row_i, pred)`` for every row where `eval_pred` returns."""
+
+    return _eval(pred, _Columns(columns))
+
+
+__all__ = ["Mask", "doc_columns", "eval_pred_batch"]
@@ -70,76 +70,115 @@ def rule_all(*rules: DocRule) -> DocRule:
     return rule
 
 
+_DOC_FIELDS = frozenset({"title", "abstract", "categories"})
+_COMPARE_OPS = (ast.Gt, ast.GtE, ast.Lt, ast.LtE, ast.Eq, ast.NotEq, ast.In, ast.NotIn)
+
+
+def _lower(base: Any) -> str:
+    if not isinstance(base, str):
+        raise ValueError("lower() base must be str")  # noqa: TRY004 - same error as eval_pred
+    return base.lower()
+
+
+def _startswith(base: Any, arg: Any) -> bool:
+    if not isinstance(base, str) or not isinstance(arg, str):
+        raise ValueError("startswith() requires (str, str)")  # noqa: TRY004 - same error as eval_pred
+    return base.startswith(arg)
+
+
+# The compiled lambda sees only these names; ``d`` is its sole parameter.
+_RULE_GLOBALS: dict[str, Any] = {
+    "__builtins__": {},
+    "len": len,
+    "bool": bool,
+    "_lower": _lower,
+    "_startswith": _startswith,
+}
+
+
+def _name(id_: str) -> ast.Name:
+    return ast.Name(id=id_, ctx=ast.Load())
+
+
+def _call(func: ast.expr, *args: ast.expr) -> ast.Call:
+    return ast.Call(func=func, args=list(args), keywords=[])
+
+
+def _as_bool(compiled: tuple[ast.expr, str]) -> ast.expr:
+    node, kind = compiled
+    return node if kind == "bool" else _call(_name("bool"), node)
+
+
+def _rewrite(node: ast.AST) -> tuple[ast.expr, str]:
+    """Rebuild a validated node as a plain Python expression plus its static kind.
+
+    Kinds are "bool", "str", "int" or "any"; they let ``startswith``/``lower``
+    on known strings call the method directly and keep ``and``/``or`` results
+    boolean without wrapping operands that already are. Doc fields are "any"
+    (a short CSV row leaves them ``None``), so methods on them go through the
+    type-checking helpers and raise ``ValueError``, not ``AttributeError``.
+    """
+
+    if isinstance(node, ast.BoolOp) and isinstance(node.op, (ast.And, ast.Or)):
+        return ast.BoolOp(op=node.op, values=[_as_bool(_rewrite(v)) for v in node.values]), "bool"
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return ast.UnaryOp(op=ast.Not(), operand=_rewrite(node.operand)[0]), "bool"
+    if isinstance(node, ast.Compare):
+        if len(node.ops) != 1 or len(node.comparators) != 1:
+            raise ValueError("Chained comparisons are not supported")
+        if not isinstance(node.ops[0], _COMPARE_OPS):
+            raise ValueError(f"Unsupported compare op: {type(node.ops[0]).__name__}")  # noqa: TRY004 - DSL errors are ValueError
+        left, right = _rewrite(node.left)[0], _rewrite(node.comparators[0])[0]
+        return ast.Compare(left=left, ops=[node.ops[0]], comparators=[right]), "bool"
+    if (
+        isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "d"
+        and node.attr in _DOC_FIELDS
+    ):
+        return ast.Attribute(value=_name("d"), attr=node.attr, ctx=ast.Load()), "any"
+    if isinstance(node, ast.Call) and not node.keywords:
+        func = node.func
+        if isinstance(func, ast.Name) and func.id == "len" and len(node.args) == 1:
+            return _call(_name("len"), _rewrite(node.args[0])[0]), "int"
+        if isinstance(func, ast.Attribute) and func.attr == "lower" and not node.args:
+            base, kind = _rewrite(func.value)
+            if kind == "str":
+                return _call(ast.Attribute(value=base, attr="lower", ctx=ast.Load())), "str"
+            return _call(_name("_lower"), base), "str"
+        if isinstance(func, ast.Attribute) and func.attr == "startswith" and len(node.args) == 1:
+            (base, base_kind), (arg, arg_kind) = _rewrite(func.value), _rewrite(node.args[0])
+            if base_kind == arg_kind == "str":
+                return _call(ast.Attribute(value=base, attr="startswith", ctx=ast.Load()), arg), "bool"
+            return _call(_name("_startswith"), base, arg), "bool"
+    if isinstance(node, ast.Constant):
+        v = node.value
+        kind = "bool" if isinstance(v, bool) else "str" if isinstance(v, str) else "int" if isinstance(v, int) else "any"
+        return ast.Constant(value=v), kind
+    raise ValueError(f"Unsupported expression node: {type(node).__name__}")
+
+
 def parse_rule(expr: str) -> DocRule:
     """Parse a safe boolean expression into a ``DocRule``.
 
     The expression is evaluated against a single bound name: ``d`` (the RawDoc).
     Example:
         d.categories.startswith("cs.") and len(d.abstract) > 500
+
+    The AST is validated by `SafeVisitor`, rebuilt from the supported node
+    shapes only (anything else raises ``ValueError`` here, not per document),
+    and compiled once into ``lambda d: ...`` whose globals hold nothing but
+    ``len``/``bool`` and the type-checking helpers. Per-doc cost is that of a
+    hand-written lambda. ``and``/``or`` short-circuit as in Python.
     """
 
     tree = ast.parse(expr, mode="eval")
     SafeVisitor().visit(tree)
 
-    def interpret(node: ast.AST, doc: RawDoc) -> Any:
-        if isinstance(node, ast.Expression):
-            return interpret(node.body, doc)
-        if isinstance(node, ast.BoolOp):
-            values = [interpret(v, doc) for v in node.values]
-            if isinstance(node.op, ast.And):
-                return all(values)
-            if isinstance(node.op, ast.Or):
-                return any(values)
-        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
-            return not interpret(node.operand, doc)
-        if isinstance(node, ast.Compare) and len(node.ops) == 1 and len(node.comparators) == 1:
-            left = interpret(node.left, doc)
-            right = interpret(node.comparators[0], doc)
-            op = node.ops[0]
-            if isinstance(op, ast.Gt):
-                return left > right
-            if isinstance(op, ast.GtE):
-                return left >= right
-            if isinstance(op, ast.Lt):
-                return left < right
-            if isinstance(op, ast.LtE):
-                return left <= right
-            if isinstance(op, ast.Eq):
-                return left == right
-            if isinstance(op, ast.NotEq):
-                return left != right
-            if isinstance(op, ast.In):
-                return left in right
-            if isinstance(op, ast.NotIn):
-                return left not in right
-            raise ValueError(f"Unsupported compare op: {type(op).__name__}")
-        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "d":
-            if node.attr == "title":
-                return doc.title
-            if node.attr == "abstract":
-                return doc.abstract
-            if node.attr == "categories":
-                return doc.categories
-        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "len":
-            return len(interpret(node.args[0], doc))
-        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
-            base_value = interpret(node.func.value, doc)
-            arg_value = interpret(node.args[0], doc) if node.args else None
-            if node.func.attr == "lower":
-                if not isinstance(base_value, str):
-                    raise ValueError("lower() base must be str")
-                return base_value.lower()
-            if node.func.attr == "startswith":
-                if not isinstance(base_value, str) or not isinstance(arg_value, str):
-                    raise ValueError("startswith() requires (str, str)")
-                return base_value.startswith(arg_value)
-        if isinstance(node, ast.Constant):
-            return node.value
-        raise ValueError(f"Unsupported expression node: {type(node).__name__}")
-
-    def rule(doc: RawDoc) -> bool:
-        return bool(interpret(tree, doc))
-
+    body = _as_bool(_rewrite(tree.body))
+    args = ast.arguments(posonlyargs=[], args=[ast.arg(arg="d")], kwonlyargs=[], kw_defaults=[], defaults=[])
+    lam = ast.fix_missing_locations(ast.Expression(body=ast.Lambda(args=args, body=body)))
+    rule: DocRule = eval(compile(lam, "<rule>", "eval"), dict(_RULE_GLOBALS))
     return rule
 
 
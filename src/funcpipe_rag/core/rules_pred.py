@@ -1,10 +1,19 @@
 """A tiny, frozen predicate DSL expressed as data (Modules 02–03).
 
-End-of-Module-09 snapshot."""
+End-of-Module-09 snapshot.
+
+`eval_pred` interprets the tree for every document. `compile_pred` validates
+the tree once and returns a single closure: paths become ``attrgetter``s,
+nested ``All``/``AnyOf`` are flattened, ``AnyOf`` over ``Eq`` on one path
+becomes a set lookup, and constant branches fold away. Pipelines that filter a
+whole corpus use the compiled form.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any, Union
 
 from funcpipe_rag.core.rag_types import RawDoc
@@ -49,11 +58,21 @@ Pred = Union[Eq, StartsWith, LenGt, All, AnyOf, Not]
 @dataclass(frozen=True)
 class RulesConfig:
     keep_pred: Pred = All(())
+    # > 0: reorder All/AnyOf children after this many docs (see `core.rules_adaptive`).
+    adaptive_sample: int = 0
+
+    def __post_init__(self) -> None:
+        if self.adaptive_sample < 0:
+            raise ValueError("adaptive_sample must be >= 0")
 
 
 DEFAULT_RULES = RulesConfig()
 
 
+# Field paths a `Pred` leaf may read.
+PRED_PATHS = frozenset({"doc_id", "title", "abstract", "categories"})
+
+
 def _get_path(doc: RawDoc, path: str) -> Any:
     if path == "doc_id":
         return doc.doc_id
@@ -88,7 +107,172 @@ def eval_pred(doc: RawDoc, pred: Pred) -> bool:
     raise ValueError(f"Unknown predicate: {type(pred).__name__}")
 
 
+DocPred = Callable[[RawDoc], bool]
+
+
+def _always(doc: RawDoc) -> bool:
+    return True
+
+
+def _never(doc: RawDoc) -> bool:
+    return False
+
+
+Accessor = Callable[[str], Callable[[Any], Any]]
+
+
+def _getter(path: str, accessor: Accessor) -> Callable[[Any], Any]:
+    if path not in PRED_PATHS:
+        raise ValueError(f"Unknown path: {path!r}")
+    return accessor(path)
+
+
+def flatten_rules(kind: type[All | AnyOf], rules: tuple[Pred, ...]) -> list[Pred]:
+    """Children of nested ``kind`` nodes spliced into one list (``All(a, All(b))`` -> ``[a, b]``)."""
+
+    out: list[Pred] = []
+    for p in rules:
+        if isinstance(p, kind):
+            out.extend(flatten_rules(kind, p.rules))
+        else:
+            out.append(p)
+    return out
+
+
+def _compile_any(rules: tuple[Pred, ...], accessor: Accessor) -> DocPred:
+    # AnyOf(Eq(p, "a"), Eq(p, "b"), ...) on a str path -> one set lookup per path.
+    by_path: dict[str, set[str]] = {}
+    rest: list[Pred] = []
+    for p in flatten_rules(AnyOf, rules):
+        if isinstance(p, Eq) and isinstance(p.value, str):
+            _getter(p.path, accessor)
+            by_path.setdefault(p.path, set()).add(p.value)
+        else:
+            rest.append(p)
+    fns: list[DocPred] = []
+    for path, values in by_path.items():
+        get, members = accessor(path), frozenset(values)
+        fns.append(lambda d, get=get, members=members: get(d) in members)
+    fns.extend(compile_node(p, accessor) for p in rest)
+    fns = [f for f in fns if f is not _never]
+    if any(f is _always for f in fns):
+        return _always
+    return join_preds(fns, any_of=True)
+
+
+def join_preds(fns: list[DocPred], *, any_of: bool) -> DocPred:
+    """Short-circuiting ``or`` (``any_of``) / ``and`` of ``fns``, in the given order."""
+
+    if not fns:
+        return _never if any_of else _always
+    if len(fns) == 1:
+        return fns[0]
+    if len(fns) == 2:
+        a, b = fns
+        if any_of:
+            return lambda d: a(d) or b(d)
+        return lambda d: a(d) and b(d)
+    fs = tuple(fns)
+    if any_of:
+
+        def any_of_fn(d: RawDoc) -> bool:
+            for f in fs:
+                if f(d):
+                    return True
+            return False
+
+        return any_of_fn
+
+    def all_fn(d: RawDoc) -> bool:
+        for f in fs:
+            if not f(d):
+                return False
+        return True
+
+    return all_fn
+
+
+def compile_node(pred: Pred, accessor: Accessor) -> DocPred:
+    """`compile_pred` for one node; building block for other compilers (e.g. `core.rules_adaptive`)."""
+
+    if isinstance(pred, Eq):
+        get, value = _getter(pred.path, accessor), pred.value
+        if isinstance(value, str):
+            return lambda d: get(d) == value
+        return lambda d: bool(get(d) == value)
+    # StartsWith / LenGt keep eval_pred's type checks (and its ValueError), so
+    # e.g. a None from a short CSV row fails the same way in both forms.
+    if isinstance(pred, StartsWith):
+        get, prefix = _getter(pred.path, accessor), pred.value
+
+        def starts_with(d: RawDoc) -> bool:
+            value = get(d)
+            if not isinstance(value, str):
+                raise ValueError(f"StartsWith path must be str, got {type(value).__name__}")  # noqa: TRY004 - as eval_pred
+            return value.startswith(prefix)
+
+        return starts_with
+    if isinstance(pred, LenGt):
+        get, n = _getter(pred.path, accessor), pred.value
+
+        def len_gt(d: RawDoc) -> bool:
+            value = get(d)
+            if not isinstance(value, (str, tuple, list)):
+                raise ValueError(f"LenGt path must be sized, got {type(value).__name__}")  # noqa: TRY004 - as eval_pred
+            return len(value) > n
+
+        return len_gt
+    if isinstance(pred, All):
+        fns = [f for f in (compile_node(p, accessor) for p in flatten_rules(All, pred.rules)) if f is not _always]
+        if any(f is _never for f in fns):
+            return _never
+        return join_preds(fns, any_of=False)
+    if isinstance(pred, AnyOf):
+        return _compile_any(pred.rules, accessor)
+    if isinstance(pred, Not):
+        if isinstance(pred.rule, Not):
+            return compile_node(pred.rule.rule, accessor)
+        inner = compile_node(pred.rule, accessor)
+        if inner is _always:
+            return _never
+        if inner is _never:
+            return _always
+        return lambda d: not inner(d)
+    raise ValueError(f"Unknown predicate: {type(pred).__name__}")
+
+
+def pred_paths(pred: Pred) -> frozenset[str]:
+    """Every field path ``pred`` reads (for column projection)."""
+
+    if isinstance(pred, (Eq, StartsWith, LenGt)):
+        return frozenset((pred.path,))
+    if isinstance(pred, (All, AnyOf)):
+        return frozenset().union(*map(pred_paths, pred.rules))
+    if isinstance(pred, Not):
+        return pred_paths(pred.rule)
+    raise ValueError(f"Unknown predicate: {type(pred).__name__}")
+
+
+def compile_pred(pred: Pred, *, accessor: Accessor = attrgetter) -> DocPred:
+    """Compile ``pred`` into one ``RawDoc -> bool`` closure, equivalent to `eval_pred`.
+
+    Evaluated leaves keep `eval_pred`'s type checks: a ``StartsWith`` on a
+    non-str field (e.g. ``None`` from a short CSV row) or a ``LenGt`` on an
+    unsized one raises the same ``ValueError``. Folding and the ``AnyOf`` set
+    lookup may skip leaves that cannot change the result, so the compiled form
+    can return where `eval_pred` would raise, but never the reverse.
+
+    Validation (unknown paths or node types raise ``ValueError``) happens here,
+    once, rather than lazily per document. ``accessor`` maps a path to a field
+    getter; the default reads `RawDoc` attributes, while e.g. a path ->
+    ``itemgetter(column_index)`` factory evaluates the predicate on raw CSV rows.
+    """
+
+    return compile_node(pred, accessor)
+
+
 __all__ = [
+    "PRED_PATHS",
     "Pred",
     "Eq",
     "StartsWith",
@@ -99,4 +283,11 @@ __all__ = [
     "RulesConfig",
     "DEFAULT_RULES",
     "eval_pred",
+    "Accessor",
+    "DocPred",
+    "compile_pred",
+    "compile_node",
+    "flatten_rules",
+    "join_preds",
+    "pred_paths",
 ]
@@ -6,18 +6,44 @@ Module 02 provides a canonical, order-independent deduplication helper
 Module 03 introduces a streaming alternative that preserves encounter order:
 the first time an item is seen it is yielded, and later duplicates are skipped.
 
+For long-running streams the exact key set holds a second copy of every chunk's
+text. Passing a ``seen`` structure keys chunks by a 128-bit blake2b
+fingerprint instead:
+
+- `FingerprintSet`: exact up to fingerprint collisions (~n²/2¹²⁹; fingerprints
+  ``0`` and ``1`` are also treated as equal), in an array-backed
+  open-addressing table of 16-byte slots kept 3/8 to 3/4 full, i.e. ~21-43
+  bytes per distinct chunk (up to 1.5x that while the table doubles)
+- `BloomFilter`: fixed memory; a *new* chunk is wrongly dropped with
+  probability ≈ ``fp_rate`` once ``capacity`` chunks have been added
+- `LRUWindow`: fixed memory; only duplicates within the last ``maxsize``
+  distinct chunks are dropped (older repeats are re-emitted, never lost)
+
 End-of-Module-09 snapshot."""
 
 from __future__ import annotations
 
+import hashlib
+import math
+from array import array
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Generic, Protocol, TypeVar
 
 from funcpipe_rag.core.rag_types import Chunk
 
 T = TypeVar("T")
 K = TypeVar("K", bound=object)
+K_contra = TypeVar("K_contra", contravariant=True)
+
+
+class SeenSet(Protocol[K_contra]):
+    """Minimal set interface used by `DedupIterator`."""
+
+    def __contains__(self, key: K_contra, /) -> bool: ...
+
+    def add(self, key: K_contra, /) -> None: ...
 
 
 @dataclass
@@ -26,12 +52,12 @@ class DedupIterator(Generic[T, K]):
 
     _items: Iterator[T]
     _key: Callable[[T], K]
-    _seen: set[K]
+    _seen: SeenSet[K]
 
-    def __init__(self, items: Iterable[T], *, key: Callable[[T], K]) -> None:
+    def __init__(self, items: Iterable[T], *, key: Callable[[T], K], seen: SeenSet[K] | None = None) -> None:
         self._items = iter(items)
         self._key = key
-        self._seen = set()
+        self._seen = seen if seen is not None else set()
 
     def __iter__(self) -> DedupIterator[T, K]:
         return self
@@ -45,8 +71,173 @@ class DedupIterator(Generic[T, K]):
                 return item
 
 
-def structural_dedup_lazy(chunks: Iterable[Chunk]) -> Iterator[Chunk]:
-    """Streaming structural dedup for Chunk, preserving encounter order."""
+def chunk_fingerprint(c: Chunk) -> int:
+    """128-bit blake2b fingerprint of the structural key ``(doc_id, text, start, end)``."""
+
+    doc_id = c.doc_id.encode("utf-8")
+    h = hashlib.blake2b(digest_size=16)
+    h.update(len(doc_id).to_bytes(8, "little"))
+    h.update(doc_id)
+    h.update(f"{c.start}:{c.end}:".encode())
+    h.update(c.text.encode("utf-8"))
+    return int.from_bytes(h.digest(), "little")
+
+
+_MASK64 = (1 << 64) - 1
+
+
+class FingerprintSet:
+    """Open-addressing (linear probing) set of 128-bit ints in two ``array('Q')`` columns.
+
+    The all-zero fingerprint marks an empty slot, so ``0`` is stored as ``1``:
+    keys ``0`` and ``1`` collide (``add(0)`` makes ``1 in s`` true, and vice
+    versa). The table doubles once it is 3/4 full, so each key costs 16 bytes
+    at 3/8 to 3/4 load: ~21-43 bytes per key, plus the old table while growing.
+    """
+
+    __slots__ = ("_hi", "_lo", "_mask", "_size")
+
+    def __init__(self, capacity: int = 1024) -> None:
+        slots = 8
+        while slots * 3 < capacity * 4:
+            slots *= 2
+        self._hi = array("Q", bytes(8 * slots))
+        self._lo = array("Q", bytes(8 * slots))
+        self._mask = slots - 1
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        return self._hi.itemsize * (len(self._hi) + len(self._lo))
+
+    def _probe(self, hi: int, lo: int) -> tuple[int, bool]:
+        mask, his, los = self._mask, self._hi, self._lo
+        i = (lo ^ hi) & mask
+        while True:
+            slot_hi, slot_lo = his[i], los[i]
+            if slot_hi == hi and slot_lo == lo:
+                return i, True
+            if slot_hi == 0 and slot_lo == 0:
+                return i, False
+            i = (i + 1) & mask
+
+    def __contains__(self, key: int) -> bool:
+        key = key or 1
+        return self._probe(key >> 64 & _MASK64, key & _MASK64)[1]
+
+    def add(self, key: int) -> None:
+        key = key or 1
+        hi, lo = key >> 64 & _MASK64, key & _MASK64
+        i, found = self._probe(hi, lo)
+        if found:
+            return
+        self._hi[i] = hi
+        self._lo[i] = lo
+        self._size += 1
+        if self._size * 4 > (self._mask + 1) * 3:
+            self._grow()
+
+    def _grow(self) -> None:
+        old = zip(self._hi, self._lo)
+        slots = 2 * (self._mask + 1)
+        self._hi = array("Q", bytes(8 * slots))
+        self._lo = array("Q", bytes(8 * slots))
+        self._mask = slots - 1
+        for hi, lo in old:
+            if hi or lo:
+                i, _ = self._probe(hi, lo)
+                self._hi[i] = hi
+                self._lo[i] = lo
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 128-bit fingerprints.
+
+    Sized for ``capacity`` insertions at false-positive rate ``fp_rate``:
+    ``m = -n·ln(p)/ln(2)²`` bits and ``k = (m/n)·ln(2)`` probes (Kirsch–Mitzenmacher
+    double hashing on the two fingerprint halves). Past ``capacity`` the rate
+    degrades as ``(1 - e^(-k·N/m))^k``; see `false_positive_rate`.
+    """
+
+    __slots__ = ("_bits", "_count", "_k", "_m")
+
+    def __init__(self, capacity: int, fp_rate: float = 1e-6) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        if not 0.0 < fp_rate < 1.0:
+            raise ValueError("fp_rate must be in (0, 1)")
+        m = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self._m = m
+        self._k = max(1, round(m / capacity * math.log(2)))
+        self._bits = bytearray((m + 7) // 8)
+        self._count = 0
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+    def false_positive_rate(self) -> float:
+        """Expected false-positive rate after the insertions made so far."""
+
+        return (1.0 - math.exp(-self._k * self._count / self._m)) ** self._k
+
+    def _positions(self, key: int) -> Iterator[int]:
+        h1 = key & _MASK64
+        h2 = (key >> 64) | 1
+        m = self._m
+        for i in range(self._k):
+            yield (h1 + i * h2) % m
+
+    def __contains__(self, key: int) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key: int) -> None:
+        bits = self._bits
+        for p in self._positions(key):
+            bits[p >> 3] |= 1 << (p & 7)
+        self._count += 1
+
+
+class LRUWindow:
+    """Remember only the ``maxsize`` most recently seen keys (no false positives)."""
+
+    __slots__ = ("_keys", "_maxsize")
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        self._keys: OrderedDict[int, None] = OrderedDict()
+        self._maxsize = maxsize
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: int) -> bool:
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return True
+        return False
+
+    def add(self, key: int) -> None:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        if len(self._keys) > self._maxsize:
+            self._keys.popitem(last=False)
+
+
+def structural_dedup_lazy(chunks: Iterable[Chunk], *, seen: SeenSet[int] | None = None) -> Iterator[Chunk]:
+    """Streaming structural dedup for Chunk, preserving encounter order.
+
+    With ``seen`` (e.g. `FingerprintSet`, `BloomFilter`, `LRUWindow`) chunks are
+    keyed by `chunk_fingerprint` instead of by their full text.
+    """
+
+    if seen is not None:
+        return DedupIterator(chunks, key=chunk_fingerprint, seen=seen)
 
     def key(c: Chunk) -> tuple[str, str, int, int]:
         return (c.doc_id, c.text, c.start, c.end)
@@ -54,4 +245,19 @@ def structural_dedup_lazy(chunks: Iterable[Chunk]) -> Iterator[Chunk]:
     return DedupIterator(chunks, key=key)
 
 
-__all__ = ["DedupIterator", "structural_dedup_lazy"]
+def structural_dedup_compact(chunks: Iterable[Chunk]) -> Iterator[Chunk]:
+    """`structural_dedup_lazy` with a `FingerprintSet` (~21-43 bytes per distinct chunk)."""
+
+    return structural_dedup_lazy(chunks, seen=FingerprintSet())
+
+
+__all__ = [
+    "BloomFilter",
+    "DedupIterator",
+    "FingerprintSet",
+    "LRUWindow",
+    "SeenSet",
+    "chunk_fingerprint",
+    "structural_dedup_compact",
+    "structural_dedup_lazy",
+]
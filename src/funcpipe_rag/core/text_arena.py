@@ -0,0 +1,136 @@
+"""Corpus text arena: many abstracts in one contiguous UTF-8 buffer (end-of-Module-09).
+
+`RawDoc`/`CleanDoc` hold one ``str`` per abstract. A `TextArena` stores a
+batch of abstracts as a single ``bytes`` buffer plus an ``array('q')`` of
+``N + 1`` offsets, with the (small) per-doc fields kept alongside. Doc ``i``'s
+abstract is ``buffer[offsets[i]:offsets[i + 1]]``; `abstract_bytes` returns it
+as a zero-copy ``memoryview``.
+
+Per-doc ASCII flags are computed once at load time: for ASCII docs character
+offsets equal byte offsets, so span chunks over the arena
+(`rag.stages.iter_arena_span_chunks`) hash and write straight from the buffer
+without decoding or re-encoding.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import islice
+
+from funcpipe_rag.core.rag_types import CleanDoc, RawDoc, SpanSource
+
+
+@dataclass(frozen=True, eq=False)
+class TextArena:
+    doc_ids: tuple[str, ...]
+    titles: tuple[str, ...]
+    categories: tuple[str, ...]
+    buffer: bytes
+    offsets: array[int]
+    ascii: tuple[bool, ...]
+
+    def __post_init__(self) -> None:
+        n = len(self.doc_ids)
+        if not len(self.titles) == len(self.categories) == len(self.ascii) == n:
+            raise ValueError("TextArena columns must have equal length")
+        if len(self.offsets) != n + 1 or self.offsets[0] != 0 or self.offsets[-1] != len(self.buffer):
+            raise ValueError("TextArena.offsets must have N + 1 entries spanning the buffer")
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    @classmethod
+    def from_docs(cls, docs: Iterable[RawDoc | CleanDoc]) -> TextArena:
+        """Load a batch of docs: one encode per abstract, one join for the batch."""
+
+        doc_ids: list[str] = []
+        titles: list[str] = []
+        categories: list[str] = []
+        parts: list[bytes] = []
+        flags: list[bool] = []
+        offsets = array("q", [0])
+        for d in docs:
+            doc_ids.append(d.doc_id)
+            titles.append(d.title)
+            categories.append(d.categories)
+            flags.append(d.abstract.isascii())
+            b = d.abstract.encode("utf-8")
+            parts.append(b)
+            offsets.append(offsets[-1] + len(b))
+        return cls(
+            doc_ids=tuple(doc_ids),
+            titles=tuple(titles),
+            categories=tuple(categories),
+            buffer=b"".join(parts),
+            offsets=offsets,
+            ascii=tuple(flags),
+        )
+
+    def abstract_bytes(self, i: int) -> memoryview:
+        return memoryview(self.buffer)[self.offsets[i] : self.offsets[i + 1]]
+
+    def abstract(self, i: int) -> str:
+        return str(self.abstract_bytes(i), "utf-8")
+
+    def source(self, i: int) -> SpanSource:
+        """`SpanSource` over doc ``i``'s slice of the buffer (no copy for ASCII docs)."""
+
+        return SpanSource.from_utf8(self.abstract_bytes(i), ascii=self.ascii[i])
+
+    def map_abstracts(
+        self,
+        on_bytes: Callable[[bytes], bytes] | None,
+        on_str: Callable[[str], str],
+        *,
+        bytes_ok: Callable[[bytes], bool] | None = None,
+    ) -> TextArena:
+        """New arena with every abstract transformed.
+
+        ``on_bytes`` runs directly on the UTF-8 slice of ASCII docs for which
+        ``bytes_ok`` (if given) holds; every other doc is decoded, passed to
+        ``on_str`` and re-encoded.
+        """
+
+        buf = self.buffer
+        offs = self.offsets
+        parts: list[bytes] = []
+        flags: list[bool] = []
+        offsets = array("q", [0])
+        for i in range(len(self.doc_ids)):
+            raw = buf[offs[i] : offs[i + 1]]
+            if on_bytes is not None and self.ascii[i] and (bytes_ok is None or bytes_ok(raw)):
+                out = on_bytes(raw)
+                flags.append(True)
+            else:
+                text = on_str(raw.decode("utf-8"))
+                out = text.encode("utf-8")
+                flags.append(text.isascii())
+            parts.append(out)
+            offsets.append(offsets[-1] + len(out))
+        return TextArena(
+            doc_ids=self.doc_ids,
+            titles=self.titles,
+            categories=self.categories,
+            buffer=b"".join(parts),
+            offsets=offsets,
+            ascii=tuple(flags),
+        )
+
+    def iter_clean_docs(self) -> Iterator[CleanDoc]:
+        for i, doc_id in enumerate(self.doc_ids):
+            yield CleanDoc(doc_id=doc_id, title=self.titles[i], abstract=self.abstract(i), categories=self.categories[i])
+
+
+def iter_text_arenas(docs: Iterable[RawDoc | CleanDoc], batch_size: int) -> Iterator[TextArena]:
+    """Load a doc stream as consecutive arenas of up to ``batch_size`` docs."""
+
+    if batch_size <= 0:
+        raise ValueError("batch_size must be > 0")
+    it = iter(docs)
+    while batch := list(islice(it, batch_size)):
+        yield TextArena.from_docs(batch)
+
+
+__all__ = ["TextArena", "iter_text_arenas"]
@@ -4,11 +4,12 @@ End-of-Module-09 snapshot."""
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator
 from datetime import datetime
 from typing import Protocol
 
 from funcpipe_rag.core.rag_types import Chunk, RawDoc
+from funcpipe_rag.core.rules_pred import Pred
 from funcpipe_rag.result.types import ErrInfo, Option, Result
 
 from .logging import LogEntry
@@ -24,7 +25,15 @@ __all__ = [
 
 
 class StorageRead(Protocol):
-    def read_docs(self, path: str) -> Iterator[Result[RawDoc, ErrInfo]]: ...
+    def read_docs(
+        self,
+        path: str,
+        *,
+        keep: Pred | None = None,
+        columns: Collection[str] | None = None,
+    ) -> Iterator[Result[RawDoc, ErrInfo]]:
+        """Stream docs; ``keep`` filters and ``columns`` projects before any `RawDoc` is built."""
+        ...
 
 
 class StorageWrite(Protocol):
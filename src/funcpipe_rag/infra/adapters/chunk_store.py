@@ -0,0 +1,325 @@
+"""Memory-mapped binary chunk store (end-of-Module-09; NumPy path).
+
+JSONL output is slow to parse back and has no random access. A chunk store
+file holds the same columns as `core.chunk_batch.ChunkBatch`, as fixed-width
+little-endian sections after a fixed header:
+
+======================  =====================================================
+header (184 bytes)      magic ``FPCHUNK1``, version, embedding dim/itemsize,
+                        row and doc counts (40 bytes), then ``(offset,
+                        length)`` per section (144 bytes)
+embeddings              ``N x dim`` float32 (or float64), row-major
+starts / ends           ``N`` int64 each
+text_offsets            ``N + 1`` int64 into the text blob
+doc_codes               ``N`` int32 into the doc-id dictionary
+doc_offsets / doc_blob  ``D + 1`` int64 + UTF-8 doc ids
+text_blob               UTF-8 chunk texts, concatenated
+metadata                JSON ``{row: metadata}`` for rows that have any
+======================  =====================================================
+
+Every section starts on a 64-byte boundary. `ChunkStore.write_chunks`
+implements the `domain.capabilities.StorageWrite` capability. It streams
+embeddings and text into spool files, so only the int columns (~28 bytes per
+row) stay in memory, and it publishes the result with temp + fsync + rename
+like `FileStorage`. `open_chunk_store` maps the file once: ``embeddings`` is a
+zero-copy ``np.memmap``, the int columns are ``np.frombuffer`` views, and
+``reader[i]`` decodes only row ``i``. This module imports NumPy and is not
+re-exported from `infra.adapters`.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from itertools import pairwise
+from typing import Any, BinaryIO
+
+import numpy as np
+from numpy.typing import NDArray
+from typing_extensions import Self
+
+from funcpipe_rag.core.chunk_batch import EMBED_DIM, ChunkBatch
+from funcpipe_rag.core.rag_types import Chunk
+from funcpipe_rag.result.types import Err, ErrInfo, Ok, Result
+
+CHUNK_STORE_MAGIC = b"FPCHUNK1"
+CHUNK_STORE_VERSION = 1
+
+_SECTIONS = (
+    "embeddings",
+    "starts",
+    "ends",
+    "text_offsets",
+    "doc_codes",
+    "doc_offsets",
+    "doc_blob",
+    "text_blob",
+    "metadata",
+)
+_HEAD = struct.Struct("<8sIIIIQQ")
+_TABLE = struct.Struct("<" + "QQ" * len(_SECTIONS))
+HEADER_SIZE = _HEAD.size + _TABLE.size
+_ALIGN = 64
+_FLUSH_ROWS = 4096
+_FLOAT_CODES = {4: "f", 8: "d"}
+
+
+def _le(a: array[Any]) -> bytes:
+    if sys.byteorder != "little":
+        a = array(a.typecode, a)
+        a.byteswap()
+    return a.tobytes()
+
+
+class ChunkStore:
+    """`StorageWrite` sink producing memory-mappable chunk store files."""
+
+    def __init__(self, *, embedding_dtype: str = "float32") -> None:
+        itemsize = np.dtype(embedding_dtype).itemsize
+        if itemsize not in _FLOAT_CODES or np.dtype(embedding_dtype).kind != "f":
+            raise ValueError("embedding_dtype must be float32 or float64")
+        self.itemsize = itemsize
+
+    def write_chunks(self, path: str, chunks: Iterator[Chunk]) -> Result[None, ErrInfo]:
+        return self._write(path, chunks, stage="chunk_store.write_chunks")
+
+    def write_chunk_batches(self, path: str, batches: Iterable[ChunkBatch]) -> Result[None, ErrInfo]:
+        chunks = (c for b in batches for c in b.iter_chunks())
+        return self._write(path, chunks, stage="chunk_store.write_chunk_batches")
+
+    def _write(self, path: str, chunks: Iterable[Chunk], *, stage: str) -> Result[None, ErrInfo]:
+        tmp_path: str | None = None
+        tmp_dir = os.path.dirname(path) or "."
+        try:
+            with ExitStack() as stack:
+                emb_spool = stack.enter_context(tempfile.TemporaryFile(dir=tmp_dir))
+                text_spool = stack.enter_context(tempfile.TemporaryFile(dir=tmp_dir))
+                cols = self._spool(chunks, emb_spool, text_spool)
+                tmp = stack.enter_context(tempfile.NamedTemporaryFile(mode="wb", dir=tmp_dir, delete=False))
+                tmp_path = tmp.name
+                self._assemble(tmp, cols, emb_spool, text_spool)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_path, path)
+            return Ok(None)
+        except Exception as ex:  # noqa: BLE001 - every failure becomes an Err and the temp file is removed
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            if isinstance(ex, OSError):
+                return Err(ErrInfo(code="IO_WRITE", msg=str(ex), stage=stage))
+            return Err(ErrInfo(code="WRITE_FAILED", msg=str(ex), stage=stage))
+
+    def _spool(self, chunks: Iterable[Chunk], emb_spool: BinaryIO, text_spool: BinaryIO) -> dict[str, Any]:
+        code = _FLOAT_CODES[self.itemsize]
+        starts, ends, text_offsets = array("q"), array("q"), array("q", [0])
+        doc_codes = array("i")
+        doc_index: dict[str, int] = {}
+        metadata: dict[str, object] = {}
+        vec = array(code)
+        texts: list[bytes] = []
+        text_pos = 0
+        row = -1
+        for row, c in enumerate(chunks):
+            if not isinstance(c, Chunk):
+                raise TypeError("ChunkStore rows must be embedded Chunks")
+            if len(c.embedding) != EMBED_DIM:
+                raise ValueError(f"ChunkStore rows must have {EMBED_DIM}-dim embeddings")
+            doc_codes.append(doc_index.setdefault(c.doc_id, len(doc_index)))
+            starts.append(c.start)
+            ends.append(c.end)
+            data = c.text.encode("utf-8")
+            texts.append(data)
+            text_pos += len(data)
+            text_offsets.append(text_pos)
+            vec.extend(c.embedding)
+            if c.metadata:
+                metadata[str(row)] = dict(c.metadata)
+            if len(texts) >= _FLUSH_ROWS:
+                emb_spool.write(_le(vec))
+                text_spool.write(b"".join(texts))
+                vec = array(code)
+                texts.clear()
+        emb_spool.write(_le(vec))
+        text_spool.write(b"".join(texts))
+        doc_blob = [d.encode("utf-8") for d in doc_index]
+        doc_offsets = array("q", [0])
+        for d in doc_blob:
+            doc_offsets.append(doc_offsets[-1] + len(d))
+        return {
+            "n": row + 1,
+            "starts": _le(starts),
+            "ends": _le(ends),
+            "text_offsets": _le(text_offsets),
+            "doc_codes": _le(doc_codes),
+            "doc_offsets": _le(doc_offsets),
+            "doc_blob": b"".join(doc_blob),
+            "metadata": json.dumps(metadata, ensure_ascii=False).encode("utf-8"),
+            "n_docs": len(doc_blob),
+            "embeddings_len": emb_spool.tell(),
+            "text_blob_len": text_spool.tell(),
+        }
+
+    def _assemble(self, out: BinaryIO, cols: dict[str, Any], emb_spool: BinaryIO, text_spool: BinaryIO) -> None:
+        lengths = {
+            name: cols[f"{name}_len"] if name in ("embeddings", "text_blob") else len(cols[name])
+            for name in _SECTIONS
+        }
+        table: list[int] = []
+        pos = HEADER_SIZE
+        for name in _SECTIONS:
+            pos = -(-pos // _ALIGN) * _ALIGN
+            table += [pos, lengths[name]]
+            pos += lengths[name]
+        head = _HEAD.pack(CHUNK_STORE_MAGIC, CHUNK_STORE_VERSION, EMBED_DIM, self.itemsize, 0, cols["n"], cols["n_docs"])
+        out.write(head + _TABLE.pack(*table))
+        for i, name in enumerate(_SECTIONS):
+            out.write(b"\0" * (table[2 * i] - out.tell()))
+            if name in ("embeddings", "text_blob"):
+                spool = emb_spool if name == "embeddings" else text_spool
+                spool.seek(0)
+                shutil.copyfileobj(spool, out, 1 << 20)
+            else:
+                out.write(cols[name])
+
+
+class ChunkStoreReader:
+    """Read-only, memory-mapped view of a chunk store file."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load(path)
+        except Exception:
+            self._mm.close()
+            raise
+
+    def _load(self, path: str) -> None:
+        mm = self._mm
+        if len(mm) < HEADER_SIZE:
+            raise ValueError("not a chunk store (file too short)")
+        magic, version, dim, itemsize, _, n, n_docs = _HEAD.unpack_from(mm, 0)
+        if magic != CHUNK_STORE_MAGIC or version != CHUNK_STORE_VERSION or itemsize not in _FLOAT_CODES:
+            raise ValueError("not a chunk store (bad magic/version)")
+        table = _TABLE.unpack_from(mm, _HEAD.size)
+        sections = {name: (table[2 * i], table[2 * i + 1]) for i, name in enumerate(_SECTIONS)}
+        if any(off + length > len(mm) for off, length in sections.values()):
+            raise ValueError("chunk store is truncated")
+        self._sections = sections
+
+        def view(name: str, dtype: str, count: int) -> NDArray[Any]:
+            return np.frombuffer(mm, dtype=dtype, count=count, offset=sections[name][0])
+
+        emb_off = sections["embeddings"][0]
+        self.embeddings: NDArray[np.floating[Any]] = np.memmap(
+            path, dtype=f"<f{itemsize}", mode="r", offset=emb_off, shape=(n, dim)
+        ) if n else np.zeros((0, dim), dtype=f"<f{itemsize}")
+        self.starts: NDArray[np.int64] = view("starts", "<i8", n)
+        self.ends: NDArray[np.int64] = view("ends", "<i8", n)
+        self.text_offsets: NDArray[np.int64] = view("text_offsets", "<i8", n + 1)
+        self.doc_codes: NDArray[np.int32] = view("doc_codes", "<i4", n)
+        doc_offsets = view("doc_offsets", "<i8", n_docs + 1).tolist()
+        blob_off = sections["doc_blob"][0]
+        self.doc_ids: tuple[str, ...] = tuple(
+            bytes(mm[blob_off + a : blob_off + b]).decode("utf-8") for a, b in pairwise(doc_offsets)
+        )
+        meta_off, meta_len = sections["metadata"]
+        raw_meta = json.loads(bytes(mm[meta_off : meta_off + meta_len]).decode("utf-8"))
+        self.metadata: dict[int, dict[str, object]] = {int(k): v for k, v in raw_meta.items()}
+        self._text_base = sections["text_blob"][0]
+
+    def __len__(self) -> int:
+        return len(self.doc_codes)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # Drop numpy views first; mmap.close() refuses while buffers are exported.
+        for name in ("embeddings", "starts", "ends", "text_offsets", "doc_codes"):
+            self.__dict__.pop(name, None)
+        try:
+            self._mm.close()
+        except BufferError:
+            pass  # a caller still holds a view; the map is released with it
+
+    def text_bytes(self, row: int) -> memoryview:
+        """Zero-copy UTF-8 slice of row ``row``'s text."""
+
+        a, b = int(self.text_offsets[row]), int(self.text_offsets[row + 1])
+        return memoryview(self._mm)[self._text_base + a : self._text_base + b]
+
+    def text(self, row: int) -> str:
+        return str(self.text_bytes(row), "utf-8")
+
+    def doc_id(self, row: int) -> str:
+        return self.doc_ids[int(self.doc_codes[row])]
+
+    def __getitem__(self, row: int) -> Chunk:
+        n = len(self)
+        if row < 0:
+            row += n
+        if not 0 <= row < n:
+            raise IndexError("chunk store row out of range")
+        return Chunk(
+            doc_id=self.doc_id(row),
+            text=self.text(row),
+            start=int(self.starts[row]),
+            end=int(self.ends[row]),
+            metadata=self.metadata.get(row, {}),
+            embedding=tuple(self.embeddings[row].tolist()),
+        )
+
+    def iter_chunks(self, rows: Iterable[int] | None = None) -> Iterator[Chunk]:
+        """Decode rows lazily, in ``rows`` order (default: all rows)."""
+
+        for row in range(len(self)) if rows is None else rows:
+            yield self[row]
+
+    def __iter__(self) -> Iterator[Chunk]:
+        return self.iter_chunks()
+
+    def to_batch(self) -> ChunkBatch:
+        """Columnar `ChunkBatch` over the store (int columns and embeddings are views; text is copied)."""
+
+        off, length = self._sections["text_blob"]
+        return ChunkBatch(
+            doc_ids=self.doc_ids,
+            doc_codes=self.doc_codes,
+            starts=self.starts,
+            ends=self.ends,
+            text_arena=bytes(self._mm[off : off + length]),
+            text_offsets=self.text_offsets,
+            embeddings=self.embeddings,
+            metadata=self.metadata,
+        )
+
+
+def open_chunk_store(path: str) -> ChunkStoreReader:
+    """Map a chunk store file; raises ``OSError`` / ``ValueError`` on unreadable or foreign files."""
+
+    return ChunkStoreReader(path)
+
+
+__all__ = [
+    "CHUNK_STORE_MAGIC",
+    "CHUNK_STORE_VERSION",
+    "HEADER_SIZE",
+    "ChunkStore",
+    "ChunkStoreReader",
+    "open_chunk_store",
+]
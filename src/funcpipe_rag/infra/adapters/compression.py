@@ -0,0 +1,291 @@
+"""Transparent gzip/bz2/lzma I/O with pipelined (de)compression (end-of-Module-09).
+
+The codec is picked from the path suffix (`codec_for`): ``.gz`` -> gzip,
+``.bz2`` -> bz2, ``.xz`` / ``.lzma`` -> lzma. Other paths are opened as they
+always were, so callers can route every open through this module.
+
+Reads (`open_text`): a background thread decompresses blocks of up to
+``block_size`` bytes into a bounded queue, so decompression overlaps CSV
+parsing. The decompressors release the GIL, which makes this real overlap.
+Decoding errors are re-raised in the reading thread as ``OSError``, the same
+way I/O errors are surfaced, but only after everything decoded before the bad
+spot has been read (bz2 can only decode whole ~900 kB blocks). Closing the
+reader early stops the thread.
+
+Writes (`text_writer`): output is cut into ``block_size`` blocks and each one
+is compressed as an independent stream member on a thread pool. Concatenated
+gzip members, bz2 streams and xz streams are all valid files for the stdlib
+readers and the usual CLI tools. Members are written in order, with a bounded
+number in flight. `text_writer` never closes the file it wraps, so
+`FileStorage` can still fsync and rename its temp file.
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import queue
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import BinaryIO, TextIO
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+DEFAULT_QUEUE_BLOCKS = 8
+
+_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma", ".lzma": "lzma"}
+_OPENERS: dict[str, Callable[[str], BinaryIO]] = {
+    "gzip": partial(gzip.open, mode="rb"),  # type: ignore[dict-item]
+    "bz2": partial(bz2.open, mode="rb"),  # type: ignore[dict-item]
+    "lzma": partial(lzma.open, mode="rb"),  # type: ignore[dict-item]
+}
+_EOF = object()
+
+
+def codec_for(path: str) -> str | None:
+    """``"gzip"`` / ``"bz2"`` / ``"lzma"`` from the suffix of ``path``, else ``None``."""
+
+    return _SUFFIXES.get(os.path.splitext(path)[1].lower())
+
+
+def _compressor(codec: str, level: int | None) -> Callable[[bytes], bytes]:
+    if codec == "gzip":
+        lvl = 6 if level is None else level
+        return lambda b: gzip.compress(b, compresslevel=lvl, mtime=0)
+    if codec == "bz2":
+        lvl = 9 if level is None else level
+        return lambda b: bz2.compress(b, lvl)
+    if codec == "lzma":
+        return lambda b: lzma.compress(b, preset=level)
+    raise ValueError(f"Unknown codec: {codec!r}")
+
+
+class PrefetchReader(io.RawIOBase):
+    """Raw reader fed by a thread that reads ``source`` ahead into a bounded queue."""
+
+    def __init__(
+        self, source: BinaryIO, *, block_size: int = DEFAULT_BLOCK_SIZE, queue_blocks: int = DEFAULT_QUEUE_BLOCKS
+    ) -> None:
+        if block_size <= 0 or queue_blocks <= 0:
+            raise ValueError("block_size and queue_blocks must be > 0")
+        super().__init__()
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=queue_blocks)
+        self._stop = threading.Event()
+        self._buf = memoryview(b"")
+        self._eof = False
+        self._thread = threading.Thread(
+            target=self._pump, args=(source, block_size), name="funcpipe-decompress", daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, item: object) -> None:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _pump(self, source: BinaryIO, block_size: int) -> None:
+        # ``read1`` returns what one underlying read decodes, so a truncated or
+        # corrupt archive still delivers everything before the bad spot.
+        read = getattr(source, "read1", source.read)
+        try:
+            with source:
+                while not self._stop.is_set():
+                    block = read(block_size)
+                    if not block:
+                        break
+                    self._put(block)
+        except OSError as ex:
+            self._put(ex)
+            return
+        except Exception as ex:  # noqa: BLE001 - EOFError, lzma.LZMAError, zlib.error, ... must reach the reader
+            self._put(OSError(f"decompression failed: {ex}"))
+            return
+        self._put(_EOF)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: bytearray | memoryview) -> int:  # type: ignore[override]
+        if not self._buf:
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if item is _EOF or isinstance(item, BaseException):
+                self._eof = True
+                if item is _EOF:
+                    return 0
+                raise item  # type: ignore[misc]
+            self._buf = memoryview(item)  # type: ignore[arg-type]
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        self._buf = self._buf[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+        super().close()
+
+
+def open_binary(
+    path: str, *, block_size: int = DEFAULT_BLOCK_SIZE, queue_blocks: int = DEFAULT_QUEUE_BLOCKS
+) -> BinaryIO:
+    """Decompressed byte stream of ``path`` (plain ``open(path, "rb")`` when uncompressed)."""
+
+    codec = codec_for(path)
+    if codec is None:
+        return open(path, "rb")
+    raw = PrefetchReader(_OPENERS[codec](path), block_size=block_size, queue_blocks=queue_blocks)
+    return io.BufferedReader(raw, buffer_size=block_size)  # type: ignore[return-value]
+
+
+def open_text(
+    path: str,
+    *,
+    encoding: str = "utf-8",
+    newline: str | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    queue_blocks: int = DEFAULT_QUEUE_BLOCKS,
+) -> TextIO:
+    """``open(path, encoding=..., newline=...)`` that also reads compressed files, decompressing ahead."""
+
+    if codec_for(path) is None:
+        return open(path, encoding=encoding, newline=newline)
+    return io.TextIOWrapper(
+        open_binary(path, block_size=block_size, queue_blocks=queue_blocks), encoding=encoding, newline=newline
+    )
+
+
+class BlockCompressWriter(io.RawIOBase):
+    """Raw writer compressing ``block_size`` blocks into independent members on a thread pool.
+
+    ``close`` flushes the last block and waits for every member, but leaves
+    ``f`` open.
+    """
+
+    def __init__(
+        self,
+        f: BinaryIO,
+        codec: str,
+        *,
+        level: int | None = None,
+        workers: int | None = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        n_workers = workers if workers is not None else min(4, os.cpu_count() or 1)
+        if n_workers <= 0:
+            raise ValueError("workers must be > 0")
+        if block_size <= 0:
+            raise ValueError("block_size must be > 0")
+        super().__init__()
+        self._f = f
+        self._compress = _compressor(codec, level)
+        self._block_size = block_size
+        self._pending = bytearray()
+        self._inflight: deque[Future[bytes]] = deque()
+        self._max_inflight = 2 * n_workers
+        self._members = 0
+        self._aborted = False
+        self._pool = ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="funcpipe-compress")
+
+    def writable(self) -> bool:
+        return True
+
+    def _submit(self, block: bytes) -> None:
+        if len(self._inflight) >= self._max_inflight:
+            self._f.write(self._inflight.popleft().result())
+        self._inflight.append(self._pool.submit(self._compress, block))
+        self._members += 1
+
+    def write(self, b: bytes | bytearray | memoryview) -> int:  # type: ignore[override]
+        if self._aborted:
+            return len(b)
+        self._pending += b
+        size = self._block_size
+        if len(self._pending) >= size:
+            view = memoryview(self._pending)
+            k = 0
+            while len(self._pending) - k >= size:
+                self._submit(bytes(view[k : k + size]))
+                k += size
+            view.release()
+            del self._pending[:k]
+        return len(b)
+
+    def abort(self) -> None:
+        """Drop buffered data and stop the pool (the output is being discarded)."""
+
+        self._aborted = True
+        self._pending.clear()
+        self._inflight.clear()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if not self._aborted:
+                if self._pending or not self._members:
+                    self._submit(bytes(self._pending))  # always at least one valid member
+                    self._pending.clear()
+                while self._inflight:
+                    self._f.write(self._inflight.popleft().result())
+        finally:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            super().close()
+
+
+@contextmanager
+def text_writer(
+    f: BinaryIO,
+    codec: str | None,
+    *,
+    encoding: str = "utf-8",
+    level: int | None = None,
+    workers: int | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Iterator[TextIO]:
+    """Text stream onto the binary file ``f``, compressed with ``codec`` (``None``: plain).
+
+    On normal exit all text is encoded, compressed and written to ``f``; ``f``
+    itself stays open.
+    """
+
+    if codec is None:
+        plain = io.TextIOWrapper(f, encoding=encoding)  # type: ignore[arg-type]
+        try:
+            yield plain
+        finally:
+            plain.detach()  # flushes; keeps ``f`` open
+        return
+    raw = BlockCompressWriter(f, codec, level=level, workers=workers, block_size=block_size)
+    out = io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=block_size), encoding=encoding)
+    try:
+        yield out
+    except BaseException:
+        raw.abort()
+        raise
+    finally:
+        out.close()
+
+
+__all__ = [
+    "DEFAULT_BLOCK_SIZE",
+    "DEFAULT_QUEUE_BLOCKS",
+    "BlockCompressWriter",
+    "PrefetchReader",
+    "codec_for",
+    "open_binary",
+    "open_text",
+    "text_writer",
+]
@@ -0,0 +1,220 @@
+"""Byte-offset sidecar index for random access into the input CSV (end-of-Module-09).
+
+`FileStorage.read_docs` can only scan. `build_csv_index` makes one pass over
+the file and records where every CSV record starts. Records are framed by
+``csv.reader`` itself, fed one physical line at a time from a byte-counting
+line iterator, so the index agrees with `read_docs` on every input it
+accepts: quoted fields spanning lines, a stray ``"`` inside an unquoted field
+(``1,5" disk,...``), and an unterminated quote at end of file.
+
+The index keeps record offsets in file order plus ``doc_id -> record``
+(last occurrence wins), and is stamped with the file's size and ``mtime_ns``.
+`ensure_csv_index` reuses the ``<csv>.idx`` sidecar only while both still
+match, and otherwise rebuilds it. `byte_ranges` cuts the file at record
+boundaries for parallel readers.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import tempfile
+from array import array
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from itertools import pairwise
+from types import MappingProxyType
+from typing import BinaryIO
+
+from funcpipe_rag.result.types import Err, Ok, Result
+
+CSV_INDEX_VERSION = 1
+
+
+@dataclass(frozen=True, eq=False)
+class CsvIndex:
+    size: int
+    mtime_ns: int
+    header: tuple[str, ...]
+    offsets: array[int]  # record starts in file order, then one final entry = end of data
+    rows: Mapping[str, int] = field(default_factory=dict)  # doc_id -> record number
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "rows", MappingProxyType(dict(self.rows)))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def span(self, doc_id: str) -> tuple[int, int] | None:
+        """``(start, end)`` byte range of ``doc_id``'s record, or ``None``."""
+
+        r = self.rows.get(doc_id)
+        return None if r is None else (self.offsets[r], self.offsets[r + 1])
+
+    def matches(self, path: str) -> bool:
+        st = os.stat(path)
+        return st.st_size == self.size and st.st_mtime_ns == self.mtime_ns
+
+    def byte_ranges(self, parts: int) -> list[tuple[int, int]]:
+        """Split the data records into at most ``parts`` contiguous, record-aligned byte ranges."""
+
+        if parts <= 0:
+            raise ValueError("parts must be > 0")
+        n = len(self)
+        if n == 0:
+            return []
+        cuts = sorted({n * k // parts for k in range(parts + 1)})
+        return [(self.offsets[a], self.offsets[b]) for a, b in pairwise(cuts)]
+
+
+def parse_record(data: bytes, header: tuple[str, ...]) -> dict[str, str | None]:
+    """One CSV record as a ``DictReader``-style row (missing fields are ``None``)."""
+
+    (row,) = [r for r in csv.reader(io.StringIO(data.decode("utf-8"), newline="")) if r]
+    out: dict[str, str | None] = dict(zip(header, row))
+    for name in header[len(row) :]:
+        out[name] = None
+    if len(row) > len(header):
+        out[None] = row[len(header) :]  # type: ignore[index]  # DictReader restkey
+    return out
+
+
+class _ByteLines:
+    """Decoded lines of a binary file, tracking the byte offset consumed so far."""
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        self.pos = 0
+
+    def __iter__(self) -> _ByteLines:
+        return self
+
+    def __next__(self) -> str:
+        line = self._f.readline()
+        if not line:
+            raise StopIteration
+        self.pos += len(line)
+        return line.decode("utf-8")
+
+
+def scan_records(f: BinaryIO) -> Iterator[tuple[int, list[str]]]:
+    """``(byte offset, fields)`` of every record of ``f``, header and blank lines included.
+
+    ``f`` is read from its current position; offsets are relative to it.
+    Records are framed exactly as ``csv.reader`` (and so `read_docs`) frames
+    them. Raises ``csv.Error`` on malformed input.
+    """
+
+    lines = _ByteLines(f)
+    start = 0
+    for fields in csv.reader(lines):
+        yield start, fields
+        start = lines.pos
+
+
+def build_csv_index(path: str, *, id_column: str = "doc_id") -> CsvIndex:
+    """One pass over ``path``; raises ``OSError`` on I/O and ``ValueError`` on a bad header or CSV."""
+
+    st = os.stat(path)
+    offsets = array("q")
+    rows: dict[str, int] = {}
+    with open(path, "rb") as f:
+        records = scan_records(f)
+        try:
+            header = tuple(next(records, (0, []))[1])
+            if header and id_column not in header:
+                raise ValueError(f"CSV header has no {id_column!r} column")
+            id_pos = header.index(id_column) if header else 0
+            for start, fields in records:
+                if not fields:
+                    continue  # blank lines are skipped, as DictReader does
+                if id_pos < len(fields):
+                    rows[fields[id_pos]] = len(offsets)
+                offsets.append(start)
+        except csv.Error as exc:
+            raise ValueError(f"CSV parse failed near byte {f.tell()}: {exc}") from exc
+        offsets.append(f.tell())
+    return CsvIndex(size=st.st_size, mtime_ns=st.st_mtime_ns, header=header, offsets=offsets, rows=rows)
+
+
+def index_path_for(csv_path: str) -> str:
+    return csv_path + ".idx"
+
+
+def load_csv_index(path: str) -> Result[CsvIndex, str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as exc:
+        return Err(f"CSV index load failed: {exc}")
+    if not isinstance(data, dict) or data.get("version") != CSV_INDEX_VERSION:
+        return Err("CSV index load failed: unsupported index version")
+    try:
+        offsets = array("q", data["offsets"])
+        return Ok(
+            CsvIndex(
+                size=int(data["size"]),
+                mtime_ns=int(data["mtime_ns"]),
+                header=tuple(data["header"]),
+                offsets=offsets,
+                rows=dict(zip(data["doc_ids"], data["records"])),
+            )
+        )
+    except (KeyError, TypeError, ValueError) as exc:
+        return Err(f"CSV index load failed: {exc}")
+
+
+def save_csv_index(path: str, index: CsvIndex) -> Result[None, str]:
+    """Atomically write an index (temp + fsync + rename)."""
+
+    payload = {
+        "version": CSV_INDEX_VERSION,
+        "size": index.size,
+        "mtime_ns": index.mtime_ns,
+        "header": list(index.header),
+        "offsets": index.offsets.tolist(),
+        "doc_ids": list(index.rows),
+        "records": list(index.rows.values()),
+    }
+    tmp_path: str | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=os.path.dirname(path) or ".", delete=False, encoding="utf-8"
+        ) as tmp:
+            tmp_path = tmp.name
+            json.dump(payload, tmp, ensure_ascii=False)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, path)
+        return Ok(None)
+    except OSError as exc:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        return Err(f"CSV index save failed: {exc}")
+
+
+def ensure_csv_index(csv_path: str, *, index_path: str | None = None) -> CsvIndex:
+    """Valid index for ``csv_path``: the sidecar if fresh, else rebuilt (and saved best-effort)."""
+
+    index_path = index_path or index_path_for(csv_path)
+    loaded = load_csv_index(index_path)
+    if isinstance(loaded, Ok) and loaded.value.matches(csv_path):
+        return loaded.value
+    index = build_csv_index(csv_path)
+    save_csv_index(index_path, index)
+    return index
+
+
+__all__ = [
+    "CSV_INDEX_VERSION",
+    "CsvIndex",
+    "build_csv_index",
+    "ensure_csv_index",
+    "index_path_for",
+    "load_csv_index",
+    "parse_record",
+    "save_csv_index",
+    "scan_records",
+]
@@ -3,38 +3,85 @@
 This adapter is resource-safe:
 - reads are implemented as a resource-owning iterator (generator + `with open`)
 - shells should use `contextlib.closing(...)` for deterministic close on partial consumption
-- writes are atomic via temp+fsync+rename
+- writes are atomic via temp+fsync+rename, with lines encoded by
+  `infra.adapters.jsonl_writer` and flushed in large buffers
+- reads accept a pushed-down keep predicate and column projection: the `Pred`
+  is compiled against raw CSV row positions, so rejected rows never become a
+  `RawDoc` or an `Ok`
+- ``.gz`` / ``.bz2`` / ``.xz`` paths are (de)compressed transparently, with
+  pipelined decompression on reads and block-parallel compression on writes
+  (see `infra.adapters.compression`); byte-offset access (`read_docs_by_id`,
+  parallel byte ranges) needs an uncompressed CSV
 
 End-of-Module-09 snapshot."""
 
 from __future__ import annotations
 
 import csv
-from dataclasses import asdict
-import json
 import os
 import tempfile
-from collections.abc import Iterator
+from collections.abc import Collection, Iterable, Iterator
 from contextlib import ExitStack
+from itertools import chain, islice
+from operator import itemgetter
+from typing import TYPE_CHECKING
 
 from funcpipe_rag.core.rag_types import Chunk, RawDoc
+from funcpipe_rag.core.rules_pred import Pred, compile_pred, pred_paths
 from funcpipe_rag.domain.capabilities import Storage
+from funcpipe_rag.infra.adapters.compression import codec_for, open_text, text_writer
+from funcpipe_rag.infra.adapters.csv_index import CsvIndex, ensure_csv_index, parse_record
+from funcpipe_rag.infra.adapters.jsonl_writer import encode_chunk_line, encode_record_line, write_lines
+from funcpipe_rag.infra.adapters.parallel_csv import DocBatch, read_doc_batches
 from funcpipe_rag.result.types import Err, ErrInfo, Ok, Result
 
+if TYPE_CHECKING:
+    from funcpipe_rag.core.chunk_batch import ChunkBatch
 
-def _chunk_to_jsonable(c: Chunk) -> dict[str, object]:
-    d = asdict(c)
-    if isinstance(d.get("metadata"), dict):
-        return d
-    meta = c.metadata
-    d["metadata"] = dict(meta)
-    return d
+
+RAW_DOC_FIELDS = ("doc_id", "title", "abstract", "categories")
+_SEQUENTIAL_BATCH = 1 << 16
+
+
+def projection(columns: Collection[str] | None) -> tuple[str, ...]:
+    """Fields to parse, in `RawDoc` order; ``doc_id`` is always kept."""
+
+    if columns is None:
+        return RAW_DOC_FIELDS
+    unknown = set(columns) - set(RAW_DOC_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown columns: {sorted(unknown)!r}")
+    return tuple(f for f in RAW_DOC_FIELDS if f == "doc_id" or f in columns)
 
 
 class FileStorage(Storage):
-    def read_docs(self, path: str) -> Iterator[Result[RawDoc, ErrInfo]]:
+    def read_docs(
+        self,
+        path: str,
+        *,
+        keep: Pred | None = None,
+        columns: Collection[str] | None = None,
+    ) -> Iterator[Result[RawDoc, ErrInfo]]:
+        """Stream CSV rows as `RawDoc` results.
+
+        With ``keep`` and/or ``columns`` the pushdown reader is used: rows are
+        read positionally, ``keep`` runs on the raw fields, and only the
+        projected ``columns`` are copied into the `RawDoc` (the others are
+        ``""``). Extra CSV columns are ignored in that mode. Row width is
+        handled as ``DictReader`` does in both modes: a short row gets ``None``
+        for its missing fields, and a row with surplus fields is ``PARSE_ROW``
+        (as is a row ``keep`` raises on, e.g. ``StartsWith`` on a ``None``).
+        """
+
+        if keep is None and columns is None:
+            return self._read_all(path)
+        if keep is not None:
+            compile_pred(keep)  # validate eagerly; the row-level form needs the header
+        return self._read_pushdown(path, keep, projection(columns))
+
+    def _read_all(self, path: str) -> Iterator[Result[RawDoc, ErrInfo]]:
         try:
-            with open(path, newline="", encoding="utf-8") as f_in:
+            with open_text(path, newline="") as f_in:
                 reader = csv.DictReader(f_in)
                 for row_num, row in enumerate(reader, start=1):
                     try:
@@ -51,18 +98,128 @@ class FileStorage(Storage):
         except OSError as ex:
             yield Err(ErrInfo(code="IO_READ", msg=str(ex), stage="storage.read_docs"))
 
+    def _read_pushdown(
+        self, path: str, keep: Pred | None, fields: tuple[str, ...]
+    ) -> Iterator[Result[RawDoc, ErrInfo]]:
+        stage = "storage.read_docs"
+        try:
+            with open_text(path, newline="") as f_in:
+                reader = csv.reader(f_in)
+                header = next(reader, None)
+                if header is None:
+                    return
+                index = {name: i for i, name in enumerate(header)}
+                needed = set(fields) | (pred_paths(keep) if keep is not None else set())
+                missing = sorted(needed - index.keys())
+                if missing:
+                    yield Err(ErrInfo(code="PARSE_HEADER", msg=f"missing columns: {missing!r}", stage=stage))
+                    return
+                keep_row = compile_pred(keep, accessor=lambda p: itemgetter(index[p])) if keep is not None else None
+                width = len(header)
+                # Dropped fields read a "" appended past the end of the row.
+                pick = itemgetter(*(index[f] if f in fields else width for f in RAW_DOC_FIELDS))
+                pad = len(fields) < len(RAW_DOC_FIELDS)
+                row_num = 0
+                for row in reader:
+                    if not row:
+                        continue
+                    row_num += 1
+                    try:
+                        if len(row) > width:
+                            raise ValueError(f"expected {width} fields, got {len(row)}")
+                        if len(row) < width:
+                            row.extend([None] * (width - len(row)))  # type: ignore[list-item]  # DictReader restval
+                        if keep_row is not None and not keep_row(row):
+                            continue
+                    except ValueError as ex:
+                        yield Err(
+                            ErrInfo(
+                                code="PARSE_ROW",
+                                msg=str(ex),
+                                stage=stage,
+                                ctx={"row": row_num, "raw_row": dict(zip(header, row))},
+                            )
+                        )
+                        continue
+                    if pad:
+                        row.append("")
+                    yield Ok(RawDoc(*pick(row)))
+        except OSError as ex:
+            yield Err(ErrInfo(code="IO_READ", msg=str(ex), stage=stage))
+
+    def read_docs_by_id(
+        self, path: str, ids: Iterable[str], *, index: CsvIndex | None = None
+    ) -> Iterator[Result[RawDoc, ErrInfo]]:
+        """Seek straight to each requested doc via the byte-offset sidecar (see `infra.adapters.csv_index`).
+
+        Results come back in ``ids`` order; an unknown id yields ``NOT_FOUND``.
+        Without ``index`` the ``<path>.idx`` sidecar is used if it still matches
+        the file's size/mtime, and is rebuilt otherwise.
+        """
+
+        stage = "storage.read_docs_by_id"
+        if codec_for(path) is not None:
+            yield Err(ErrInfo(code="IO_READ", msg="random access needs an uncompressed CSV", stage=stage))
+            return
+        try:
+            if index is None:
+                index = ensure_csv_index(path)
+            with open(path, "rb") as f:
+                for doc_id in ids:
+                    span = index.span(doc_id)
+                    if span is None:
+                        yield Err(
+                            ErrInfo(
+                                code="NOT_FOUND",
+                                msg=f"unknown doc_id {doc_id!r}",
+                                stage=stage,
+                                ctx={"doc_id": doc_id},
+                            )
+                        )
+                        continue
+                    f.seek(span[0])
+                    row = parse_record(f.read(span[1] - span[0]), index.header)
+                    try:
+                        yield Ok(RawDoc(**row))  # type: ignore[arg-type]
+                    except (TypeError, ValueError) as ex:
+                        yield Err(
+                            ErrInfo(code="PARSE_ROW", msg=str(ex), stage=stage, ctx={"doc_id": doc_id, "raw_row": row})
+                        )
+        except (OSError, ValueError) as ex:
+            yield Err(ErrInfo(code="IO_READ", msg=str(ex), stage=stage))
+
+    def read_doc_batches(self, path: str, *, workers: int | None = None, ordered: bool = True) -> Iterator[DocBatch]:
+        """Process-parallel `read_docs` in ``Result`` batches (see `infra.adapters.parallel_csv`).
+
+        Compressed files cannot be split by byte range; they are read
+        sequentially (still with background decompression) in batches, and
+        ``workers`` and ``ordered`` are ignored: batches always come in file
+        order.
+        """
+
+        if codec_for(path) is not None:
+            docs = self.read_docs(path)
+            return iter(lambda: list(islice(docs, _SEQUENTIAL_BATCH)), [])
+        return read_doc_batches(path, workers=workers, ordered=ordered)
+
     def write_chunks(self, path: str, chunks: Iterator[Chunk]) -> Result[None, ErrInfo]:
+        return self._write_jsonl(path, map(encode_chunk_line, chunks), stage="storage.write_chunks")
+
+    def write_chunk_batches(self, path: str, batches: Iterable[ChunkBatch]) -> Result[None, ErrInfo]:
+        """Columnar sink: write `ChunkBatch` rows without materializing `Chunk` objects."""
+
+        records = chain.from_iterable(b.iter_jsonable() for b in batches)
+        return self._write_jsonl(path, map(encode_record_line, records), stage="storage.write_chunk_batches")
+
+    def _write_jsonl(self, path: str, lines: Iterable[str], *, stage: str) -> Result[None, ErrInfo]:
         tmp_path: str | None = None
         try:
             with ExitStack() as stack:
                 tmp_dir = os.path.dirname(path) or "."
-                tmp = stack.enter_context(
-                    tempfile.NamedTemporaryFile(mode="w", dir=tmp_dir, delete=False, encoding="utf-8")
-                )
+                tmp = stack.enter_context(tempfile.NamedTemporaryFile(mode="wb", dir=tmp_dir, delete=False))
                 tmp_path = tmp.name
-                for c in chunks:
-                    json.dump(_chunk_to_jsonable(c), tmp, ensure_ascii=False)
-                    tmp.write("\n")
+                with text_writer(tmp.file, codec_for(path)) as out:
+                    write_lines(out, lines)
                 tmp.flush()
                 os.fsync(tmp.fileno())
             os.replace(tmp_path, path)
@@ -74,8 +231,8 @@ class FileStorage(Storage):
                 except OSError:
                     pass
             if isinstance(ex, OSError):
-                return Err(ErrInfo(code="IO_WRITE", msg=str(ex), stage="storage.write_chunks"))
-            return Err(ErrInfo(code="WRITE_FAILED", msg=str(ex), stage="storage.write_chunks"))
+                return Err(ErrInfo(code="IO_WRITE", msg=str(ex), stage=stage))
+            return Err(ErrInfo(code="WRITE_FAILED", msg=str(ex), stage=stage))
 
 
 __all__ = ["FileStorage"]
@@ -0,0 +1,115 @@
+"""Precompiled JSONL chunk encoding and buffered line writes (end-of-Module-09).
+
+The chunk sinks used to build a record per chunk (`dataclasses.asdict` deep
+copies, and cannot copy the ``MappingProxyType`` metadata at all), call
+``json.dump`` on it, and then make a separate ``write("\\n")``. `encode_chunk_line`
+emits the same bytes as ``json.dumps(chunk_record(c), ensure_ascii=False) + "\\n"``
+directly from the fields, using the stdlib's own string escaper and
+``float.__repr__``:
+
+- ``doc_id`` / ``text``: ``json.encoder.encode_basestring`` (C-accelerated)
+- ``start`` / ``end``: ``int.__repr__``
+- ``metadata``: ``"{}"`` when empty, else ``json.dumps``
+- ``embedding``: one ``", ".join(map(float.__repr__, ...))`` for the whole vector
+
+Non-finite floats, non-float/non-int values or non-str ids fall back to
+``json.dumps`` for that line, so output is always byte-identical. `write_lines`
+joins lines into ~1 MiB strings and issues one ``write`` per buffer.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping
+from json.encoder import encode_basestring  # type: ignore[attr-defined]
+from typing import TextIO
+
+from funcpipe_rag.core.rag_types import Chunk, ChunkWithoutEmbedding
+
+DEFAULT_BUFFER_CHARS = 1 << 20
+
+_float_repr = float.__repr__
+_int_repr = int.__repr__
+
+
+def chunk_record(chunk: ChunkWithoutEmbedding) -> dict[str, object]:
+    """Canonical JSONL record of a chunk (``embedding`` only for `Chunk`)."""
+
+    record: dict[str, object] = {
+        "doc_id": chunk.doc_id,
+        "text": chunk.text,
+        "start": chunk.start,
+        "end": chunk.end,
+        "metadata": dict(chunk.metadata),
+    }
+    if isinstance(chunk, Chunk):
+        record["embedding"] = list(chunk.embedding)
+    return record
+
+
+def encode_floats(values: Iterable[float]) -> str:
+    """JSON array text of ``values``, identical to ``json.dumps(list(values))``."""
+
+    vec = values if isinstance(values, (list, tuple)) else list(values)
+    try:
+        body = ", ".join(map(_float_repr, vec))
+    except TypeError:  # ints/bools have their own JSON spelling
+        return json.dumps(list(vec))
+    if "n" in body:  # nan / inf -> NaN / Infinity
+        return json.dumps(list(vec))
+    return f"[{body}]"
+
+
+def _encode_int(value: int) -> str:
+    return _int_repr(value) if type(value) is int else json.dumps(value)
+
+
+def encode_chunk_line(chunk: ChunkWithoutEmbedding) -> str:
+    """``json.dumps(chunk_record(chunk), ensure_ascii=False) + "\\n"`` without building the record."""
+
+    try:
+        meta = chunk.metadata
+        head = (
+            f'{{"doc_id": {encode_basestring(chunk.doc_id)}, "text": {encode_basestring(chunk.text)}, '
+            f'"start": {_encode_int(chunk.start)}, "end": {_encode_int(chunk.end)}, '
+            f'"metadata": {json.dumps(dict(meta), ensure_ascii=False) if meta else "{}"}'
+        )
+    except TypeError:
+        return json.dumps(chunk_record(chunk), ensure_ascii=False) + "\n"
+    if isinstance(chunk, Chunk):
+        return f'{head}, "embedding": {encode_floats(chunk.embedding)}}}\n'
+    return head + "}\n"
+
+
+def encode_record_line(record: Mapping[str, object]) -> str:
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def write_lines(f: TextIO, lines: Iterable[str], *, buffer_chars: int = DEFAULT_BUFFER_CHARS) -> int:
+    """Write ``lines`` joined into ~``buffer_chars`` strings; returns the number of lines."""
+
+    if buffer_chars <= 0:
+        raise ValueError("buffer_chars must be > 0")
+    buf: list[str] = []
+    size = count = 0
+    for line in lines:
+        buf.append(line)
+        size += len(line)
+        count += 1
+        if size >= buffer_chars:
+            f.write("".join(buf))
+            buf.clear()
+            size = 0
+    if buf:
+        f.write("".join(buf))
+    return count
+
+
+__all__ = [
+    "DEFAULT_BUFFER_CHARS",
+    "chunk_record",
+    "encode_chunk_line",
+    "encode_floats",
+    "encode_record_line",
+    "write_lines",
+]
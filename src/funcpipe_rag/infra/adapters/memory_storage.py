@@ -5,10 +5,13 @@ End-of-Module-09 snapshot."""
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Callable, Collection, Iterator
+from dataclasses import replace
 
 from funcpipe_rag.core.rag_types import Chunk, RawDoc
+from funcpipe_rag.core.rules_pred import Pred, compile_pred
 from funcpipe_rag.domain.capabilities import Storage
+from funcpipe_rag.infra.adapters.file_storage import RAW_DOC_FIELDS, projection
 from funcpipe_rag.result.types import ErrInfo, Ok, Result
 
 
@@ -17,9 +20,26 @@ class InMemoryStorage(Storage):
         self.docs: dict[str, list[RawDoc]] = dict(preload or {})
         self.written: dict[str, list[Chunk]] = defaultdict(list)
 
-    def read_docs(self, path: str) -> Iterator[Result[RawDoc, ErrInfo]]:
+    def read_docs(
+        self,
+        path: str,
+        *,
+        keep: Pred | None = None,
+        columns: Collection[str] | None = None,
+    ) -> Iterator[Result[RawDoc, ErrInfo]]:
+        """Same contract as `FileStorage.read_docs`, including keep/columns pushdown."""
+
+        keep_doc = compile_pred(keep) if keep is not None else None
+        dropped = {f: "" for f in RAW_DOC_FIELDS if f not in projection(columns)}
+        return self._iter_docs(path, keep_doc, dropped)
+
+    def _iter_docs(
+        self, path: str, keep_doc: Callable[[RawDoc], bool] | None, dropped: dict[str, str]
+    ) -> Iterator[Result[RawDoc, ErrInfo]]:
         for doc in self.docs.get(path, []):
-            yield Ok(doc)
+            if keep_doc is not None and not keep_doc(doc):
+                continue
+            yield Ok(replace(doc, **dropped) if dropped else doc)
 
     def write_chunks(self, path: str, chunks: Iterator[Chunk]) -> Result[None, ErrInfo]:
         self.written[path].extend(list(chunks))
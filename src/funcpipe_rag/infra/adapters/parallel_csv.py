@@ -0,0 +1,273 @@
+"""Process-parallel CSV ingestion over record-aligned byte ranges (end-of-Module-09).
+
+`FileStorage.read_docs` parses the whole file with one ``csv.DictReader``.
+`read_doc_batches` cuts the data section into byte ranges of roughly
+``target_bytes``, parses each range with its own ``DictReader`` (fed the file's
+header as ``fieldnames``) in a process pool, and streams back one
+``list[Result[RawDoc, ErrInfo]]`` per range.
+
+Cuts must fall on record boundaries even when quoted fields contain newlines
+or an unquoted field contains a stray ``"``. If a fresh `infra.adapters.csv_index`
+sidecar exists its offsets are used. Otherwise the parent frames records with
+`csv_index.scan_records` (``csv.reader`` itself, so the framing is exactly
+`read_docs`'), cutting a range whenever ``target_bytes`` have accumulated and
+submitting it at once, so the framing pass overlaps with the workers. That
+pass costs about half of a sequential `read_docs`; a saved sidecar removes it.
+
+Workers number their rows locally. The parent shifts ``PARSE_ROW`` row
+numbers by the rows of all earlier ranges, so errors match a sequential
+`read_docs`. With ``ordered=False`` batches are yielded as they complete, and
+only a batch that contains errors waits until every earlier range has
+reported its row count.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import multiprocessing as mp
+import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import ExitStack
+from multiprocessing.context import BaseContext
+from typing import BinaryIO
+
+from funcpipe_rag.core.rag_types import RawDoc
+from funcpipe_rag.infra.adapters.csv_index import (
+    index_path_for,
+    load_csv_index,
+    scan_records,
+)
+from funcpipe_rag.result.types import Err, ErrInfo, Ok, Result
+
+DocBatch = list[Result[RawDoc, ErrInfo]]
+
+_STAGE = "storage.read_doc_batches"
+
+
+def _framed_ranges(f: BinaryIO, target: int) -> tuple[tuple[str, ...], Iterator[tuple[int, int]]]:
+    """Header plus a lazy stream of record-aligned ranges of about ``target`` bytes, framed by ``csv.reader``."""
+
+    records = scan_records(f)
+    header = tuple(next(records, (0, []))[1])
+
+    def ranges() -> Iterator[tuple[int, int]]:
+        start = -1
+        for pos, fields in records:
+            if not fields:
+                continue
+            if start < 0:
+                start = pos
+            elif pos - start >= target:
+                yield start, pos
+                start = pos
+        if start >= 0:
+            yield start, f.tell()
+
+    return header, ranges()
+
+
+def _open_ranges(path: str, target_bytes: int, stack: ExitStack) -> tuple[tuple[str, ...], Iterator[tuple[int, int]]]:
+    loaded = load_csv_index(index_path_for(path))
+    if isinstance(loaded, Ok) and loaded.value.matches(path):
+        index = loaded.value
+        if not len(index):
+            return index.header, iter(())
+        parts = max(1, -(-(index.offsets[-1] - index.offsets[0]) // target_bytes))
+        return index.header, iter(index.byte_ranges(parts))
+    return _framed_ranges(stack.enter_context(open(path, "rb")), target_bytes)
+
+
+def plan_byte_ranges(path: str, *, target_bytes: int) -> tuple[tuple[str, ...], list[tuple[int, int]]]:
+    """CSV header plus record-aligned ``(start, end)`` ranges covering every data record."""
+
+    if target_bytes <= 0:
+        raise ValueError("target_bytes must be > 0")
+    with ExitStack() as stack:
+        header, ranges = _open_ranges(path, target_bytes, stack)
+        return header, list(ranges)
+
+
+_FIELDS = ("doc_id", "title", "abstract", "categories")
+
+# What a worker sends back for one range: ok rows as plain field tuples
+# (dataclass `Ok(RawDoc)` objects pickle ~10x slower than tuples), the
+# PARSE_ROW failures as ``(position, local_row, msg, raw_row)``, and the
+# number of CSV rows seen.
+_RangeOut = tuple[list[tuple[str, ...]], list[tuple[int, int, str, dict[object, object]]], int]
+
+
+def _parse_range(path: str, header: tuple[str, ...], start: int, end: int) -> _RangeOut:
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    oks: list[tuple[str, ...]] = []
+    errs: list[tuple[int, int, str, dict[object, object]]] = []
+    width = len(header)
+    fast = header == _FIELDS
+    row_num = 0
+    for fields in csv.reader(io.StringIO(text, newline="")):
+        if not fields:
+            continue  # DictReader skips blank rows too
+        row_num += 1
+        if fast and len(fields) == width:
+            oks.append(tuple(fields))
+            continue
+        # Same dict DictReader would build (restval None, surplus under key None).
+        row: dict[object, object] = dict(zip(header, fields))
+        for name in header[len(fields) :]:
+            row[name] = None
+        if len(fields) > width:
+            row[None] = fields[width:]
+        try:
+            doc = RawDoc(**row)  # type: ignore[arg-type]
+        except (TypeError, ValueError) as ex:
+            errs.append((len(oks) + len(errs), row_num, str(ex), row))
+            continue
+        oks.append((doc.doc_id, doc.title, doc.abstract, doc.categories))
+    return oks, errs, row_num
+
+
+def _to_batch(oks: list[tuple[str, ...]], errs: list[tuple[int, int, str, dict[object, object]]], base: int) -> DocBatch:
+    batch: DocBatch = [Ok(RawDoc(*t)) for t in oks]
+    for pos, row, msg, raw in errs:
+        batch.insert(pos, Err(ErrInfo(code="PARSE_ROW", msg=msg, stage=_STAGE, ctx={"row": base + row, "raw_row": raw})))
+    return batch
+
+
+def _default_context() -> BaseContext:
+    if "fork" in mp.get_all_start_methods():
+        return mp.get_context("fork")
+    return mp.get_context()
+
+
+def read_doc_batches(
+    path: str,
+    *,
+    workers: int | None = None,
+    ordered: bool = True,
+    target_bytes: int = 16 << 20,
+    inflight: int | None = None,
+    mp_context: BaseContext | None = None,
+) -> Iterator[DocBatch]:
+    """Parse ``path`` in parallel, one ``Result`` batch per byte range.
+
+    Flattening the batches with ``ordered=True`` gives exactly the results of
+    ``FileStorage().read_docs(path)`` (PARSE_ROW stage aside). ``workers``
+    defaults to ``os.cpu_count()`` and ``inflight`` to ``2 * workers``; bad
+    arguments raise ``ValueError`` at call time.
+    """
+
+    n_workers = workers if workers is not None else (os.cpu_count() or 1)
+    max_inflight = inflight if inflight is not None else 2 * n_workers
+    if n_workers <= 0:
+        raise ValueError("workers must be > 0")
+    if max_inflight <= 0:
+        raise ValueError("inflight must be > 0")
+    if target_bytes <= 0:
+        raise ValueError("target_bytes must be > 0")
+    return _read_batches(
+        path, workers=n_workers, ordered=ordered, target_bytes=target_bytes, inflight=max_inflight, mp_context=mp_context
+    )
+
+
+def _read_batches(
+    path: str,
+    *,
+    workers: int,
+    ordered: bool,
+    target_bytes: int,
+    inflight: int,
+    mp_context: BaseContext | None,
+) -> Iterator[DocBatch]:
+    with ExitStack() as stack:
+        try:
+            header, ranges = _open_ranges(path, target_bytes, stack)
+        except (OSError, UnicodeDecodeError) as ex:
+            yield [Err(ErrInfo(code="IO_READ", msg=str(ex), stage=_STAGE))]
+            return
+        yield from _run_ranges(path, header, ranges, workers=workers, ordered=ordered, inflight=inflight, mp_context=mp_context)
+
+
+def _run_ranges(
+    path: str,
+    header: tuple[str, ...],
+    ranges: Iterator[tuple[int, int]],
+    *,
+    workers: int,
+    ordered: bool,
+    inflight: int,
+    mp_context: BaseContext | None,
+) -> Iterator[DocBatch]:
+    ex: ProcessPoolExecutor | None = None
+    pending: deque[tuple[int, Future[_RangeOut]]] = deque()
+    next_range = 0
+    scan_error: ErrInfo | None = None
+    exhausted = False
+
+    def submit_next() -> None:
+        # Ranges are framed lazily, so the scan overlaps with the workers.
+        nonlocal ex, next_range, scan_error, exhausted
+        if exhausted:
+            return
+        try:
+            rng = next(ranges, None)
+        except (OSError, UnicodeDecodeError) as err:
+            scan_error, rng = ErrInfo(code="IO_READ", msg=str(err), stage=_STAGE), None
+        if rng is None:
+            exhausted = True
+            return
+        if ex is None:
+            ex = ProcessPoolExecutor(
+                max_workers=workers, mp_context=mp_context if mp_context is not None else _default_context()
+            )
+        pending.append((next_range, ex.submit(_parse_range, path, header, *rng)))
+        next_range += 1
+
+    # Row-number bookkeeping for unordered completion: ``bases[k]`` is known
+    # once every range before ``k`` has reported its row count.
+    counts: dict[int, int] = {}
+    bases: list[int] = [0]
+    held: dict[int, _RangeOut] = {}
+
+    def advance() -> Iterator[DocBatch]:
+        while len(bases) - 1 in counts:
+            k = len(bases) - 1
+            bases.append(bases[k] + counts[k])
+            if k in held:
+                oks, errs, _ = held.pop(k)
+                yield _to_batch(oks, errs, bases[k])
+
+    try:
+        while len(pending) < inflight and not exhausted:
+            submit_next()
+        while pending:
+            if ordered:
+                k, fut = pending.popleft()
+            else:
+                done, _ = wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                k, fut = next(p for p in pending if p[1] in done)
+                pending.remove((k, fut))
+            try:
+                out = fut.result()
+            except (OSError, UnicodeDecodeError) as err:
+                out = None
+                yield [Err(ErrInfo(code="IO_READ", msg=str(err), stage=_STAGE))]
+            submit_next()
+            counts[k] = out[2] if out is not None else 0
+            if out is not None:
+                if out[1] and k >= len(bases):
+                    held[k] = out
+                else:
+                    yield _to_batch(out[0], out[1], bases[k] if k < len(bases) else 0)
+            yield from advance()
+        if scan_error is not None:
+            yield [Err(scan_error)]
+    finally:
+        if ex is not None:
+            ex.shutdown(wait=True, cancel_futures=True)
+
+
+__all__ = ["DocBatch", "plan_byte_ranges", "read_doc_batches"]
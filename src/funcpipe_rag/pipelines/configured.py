@@ -37,9 +37,29 @@ def _env_from_params(params: Mapping[str, object]) -> RagEnv:
     chunk_size = params.get("chunk_size", 512)
     overlap = params.get("overlap", 0)
     tail_policy = params.get("tail_policy", "emit_short")
-    if not isinstance(chunk_size, int) or not isinstance(overlap, int) or not isinstance(tail_policy, str):
-        raise TypeError("chunk params must be: chunk_size:int, overlap:int, tail_policy:str")
-    return RagEnv(chunk_size=chunk_size, overlap=overlap, tail_policy=tail_policy)
+    chunk_mode = params.get("chunk_mode", "fixed")
+    min_chunk_size = params.get("min_chunk_size")
+    max_chunk_size = params.get("max_chunk_size")
+    if (
+        not isinstance(chunk_size, int)
+        or not isinstance(overlap, int)
+        or not isinstance(tail_policy, str)
+        or not isinstance(chunk_mode, str)
+        or not (min_chunk_size is None or isinstance(min_chunk_size, int))
+        or not (max_chunk_size is None or isinstance(max_chunk_size, int))
+    ):
+        raise TypeError(
+            "chunk params must be: chunk_size:int, overlap:int, tail_policy:str, chunk_mode:str, "
+            "min_chunk_size:int|None, max_chunk_size:int|None"
+        )
+    return RagEnv(
+        chunk_size=chunk_size,
+        overlap=overlap,
+        tail_policy=tail_policy,
+        chunk_mode=chunk_mode,
+        min_chunk_size=min_chunk_size,
+        max_chunk_size=max_chunk_size,
+    )
 
 
 def build_rag_pipeline(
@@ -5,13 +5,15 @@ from __future__ import annotations
 import functools
 import hashlib
 import os
+import struct
 import threading
 from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Hashable, Optional, ParamSpec, TypeVar, cast
 
-from funcpipe_rag.core.rag_types import ChunkWithoutEmbedding
+from funcpipe_rag.core.rag_types import Chunk, ChunkWithoutEmbedding, SpanChunk
 
 K = TypeVar("K", bound=Hashable)
 V = TypeVar("V")
@@ -30,6 +32,7 @@ class CacheInfo:
     hits: int = 0
     misses: int = 0
     evictions: int = 0
+    disk_hits: int = 0
 
 
 def memoize_keyed(
@@ -127,21 +130,215 @@ class DiskCache:
         os.replace(tmp, p)
 
 
-def content_hash_key(chunk: ChunkWithoutEmbedding, *, norm_version: str = "v1") -> str:
-    """Deterministic content key (must match normalisation semantics)."""
+def content_hash_key(
+    chunk: ChunkWithoutEmbedding | SpanChunk,
+    *,
+    norm_version: str = "v1",
+    normalize: bool = True,
+) -> str:
+    """Deterministic content key (must match normalisation semantics).
+
+    ``normalize=False`` keys on the exact text, for values (like embeddings)
+    that are not invariant under whitespace/case normalisation; `SpanChunk`
+    inputs are then hashed straight from their parent buffer.
+    """
 
-    norm_text = " ".join(chunk.text.strip().lower().split())
     h = hashlib.blake2b(digest_size=32)
     h.update(norm_version.encode())
     h.update(b"\x00")
-    h.update(norm_text.encode("utf-8"))
+    if normalize:
+        h.update(" ".join(chunk.text.strip().lower().split()).encode("utf-8"))
+    elif isinstance(chunk, SpanChunk):
+        h.update(chunk.text_bytes())
+    else:
+        h.update(chunk.text.encode("utf-8"))
     return h.hexdigest()
 
 
+_VECTOR = struct.Struct("<16d")
+
+
+def embedder_id(fn: Callable[..., object]) -> str:
+    """Stable ``module.qualname`` identity of an embedder.
+
+    ``functools.partial`` is unwrapped, and a `CachedEmbedder` (or its bound
+    ``embed_batch``) is identified by the embedder it wraps, since the cache
+    does not change results.
+    """
+
+    owner = getattr(fn, "__self__", None)
+    if isinstance(owner, CachedEmbedder) and getattr(fn, "__name__", None) == "embed_batch":
+        fn = owner.inner_batch if owner.inner_batch is not None else owner.inner
+    if isinstance(fn, CachedEmbedder):
+        fn = fn.inner
+    while isinstance(fn, functools.partial):
+        fn = fn.func
+    target = fn if hasattr(fn, "__qualname__") else type(fn)
+    return f"{getattr(target, '__module__', '?')}.{getattr(target, '__qualname__', '?')}"
+
+
+class CachedEmbedder:
+    """Content-addressed embedder cache: in-process LRU → `DiskCache` → inner embedder.
+
+    Keys are ``content_hash_key(chunk, norm_version=..., normalize=False)``, so
+    bump ``norm_version`` whenever the inner embedder's output changes. Cached
+    vectors are re-attached to the incoming chunk's ids/offsets/metadata.
+    ``embed_batch`` resolves a whole batch against both tiers before embedding
+    the remaining misses once each (through ``inner_batch`` when given).
+
+    ``inner_batch`` may differ from ``inner`` (e.g. float32 vs float64), so its
+    vectors live under their own ``batch_norm_version``, which defaults to
+    ``norm_version`` plus `embedder_id` of ``inner_batch``. A chunk embedded
+    through one path is never served to the other.
+    """
+
+    def __init__(
+        self,
+        inner: Callable[[ChunkWithoutEmbedding], Chunk],
+        cache: DiskCache | None = None,
+        *,
+        norm_version: str = "v1",
+        maxsize: int = 65536,
+        inner_batch: Callable[[list[ChunkWithoutEmbedding]], Sequence[Chunk]] | None = None,
+        batch_norm_version: str | None = None,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        self.inner = inner
+        self.inner_batch = inner_batch
+        self.cache = cache
+        self.norm_version = norm_version
+        if batch_norm_version is None:
+            batch_norm_version = norm_version if inner_batch is None else f"{norm_version}/{embedder_id(inner_batch)}"
+        self.batch_norm_version = batch_norm_version
+        self.maxsize = maxsize
+        self._lru: OrderedDict[str, tuple[float, ...]] = OrderedDict()
+        self._info = CacheInfo()
+        self._lock = threading.RLock()
+
+    def _key(self, chunk: ChunkWithoutEmbedding, norm_version: str) -> str:
+        return content_hash_key(chunk, norm_version=norm_version, normalize=False)
+
+    def _lookup(self, key: str) -> tuple[float, ...] | None:
+        with self._lock:
+            vec = self._lru.get(key)
+            if vec is not None:
+                self._lru.move_to_end(key)
+                self._info.hits += 1
+                return vec
+        raw = self.cache.get(key) if self.cache is not None else None
+        if raw is not None and len(raw) == _VECTOR.size:
+            vec = _VECTOR.unpack(raw)
+            with self._lock:
+                self._info.hits += 1
+                self._info.disk_hits += 1
+                self._remember(key, vec)
+            return vec
+        with self._lock:
+            self._info.misses += 1
+        return None
+
+    def _remember(self, key: str, vec: tuple[float, ...]) -> None:
+        self._lru[key] = vec
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+            self._info.evictions += 1
+
+    def _store(self, key: str, vec: tuple[float, ...]) -> None:
+        if self.cache is not None:
+            self.cache.set(key, _VECTOR.pack(*vec))
+        with self._lock:
+            self._remember(key, vec)
+
+    def __call__(self, chunk: ChunkWithoutEmbedding) -> Chunk:
+        key = self._key(chunk, self.norm_version)
+        vec = self._lookup(key)
+        if vec is None:
+            embedded = self.inner(chunk)
+            self._store(key, embedded.embedding)
+            return embedded
+        return _with_embedding(chunk, vec)
+
+    def embed_batch(self, chunks: list[ChunkWithoutEmbedding]) -> list[Chunk]:
+        keys = [self._key(c, self.batch_norm_version) for c in chunks]
+        found: dict[str, tuple[float, ...]] = {}
+        todo: dict[str, ChunkWithoutEmbedding] = {}
+        for key, chunk in zip(keys, chunks):
+            if key in found or key in todo:
+                with self._lock:
+                    self._info.hits += 1
+                continue
+            vec = self._lookup(key)
+            if vec is None:
+                todo[key] = chunk
+            else:
+                found[key] = vec
+
+        if todo:
+            pending = list(todo.values())
+            if self.inner_batch is not None:
+                embedded = list(self.inner_batch(pending))
+                if len(embedded) != len(pending):
+                    raise ValueError("batch embedder must return one Chunk per input chunk")
+            else:
+                embedded = [self.inner(c) for c in pending]
+            for key, e in zip(todo, embedded):
+                self._store(key, e.embedding)
+                found[key] = e.embedding
+
+        return [_with_embedding(c, found[k]) for k, c in zip(keys, chunks)]
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(**vars(self._info))
+
+    def cache_clear(self) -> None:
+        """Drop the in-process tier (the disk tier is left intact)."""
+
+        with self._lock:
+            self._lru.clear()
+
+
+def _with_embedding(chunk: ChunkWithoutEmbedding, vec: tuple[float, ...]) -> Chunk:
+    return Chunk(
+        doc_id=chunk.doc_id,
+        text=chunk.text,
+        start=chunk.start,
+        end=chunk.end,
+        metadata=chunk.metadata,
+        embedding=vec,
+    )
+
+
+def cached_embedder(
+    inner: Callable[[ChunkWithoutEmbedding], Chunk],
+    cache: DiskCache | None = None,
+    norm_version: str = "v1",
+    *,
+    maxsize: int = 65536,
+    inner_batch: Callable[[list[ChunkWithoutEmbedding]], Sequence[Chunk]] | None = None,
+    batch_norm_version: str | None = None,
+) -> CachedEmbedder:
+    """Wrap ``inner`` with an LRU tier, an optional persistent tier, and batched lookups."""
+
+    return CachedEmbedder(
+        inner,
+        cache,
+        norm_version=norm_version,
+        maxsize=maxsize,
+        inner_batch=inner_batch,
+        batch_norm_version=batch_norm_version,
+    )
+
+
 __all__ = [
     "lru_cache_custom",
     "memoize_keyed",
     "CacheInfo",
     "DiskCache",
     "content_hash_key",
+    "embedder_id",
+    "CachedEmbedder",
+    "cached_embedder",
 ]
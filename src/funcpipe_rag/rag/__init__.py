@@ -5,8 +5,10 @@ entrypoints live here instead.
 """
 
 from .types import DocRule, RagTaps, DebugConfig, Observations, TraceLens, RagTraceV3
-from .clean_cfg import CleanConfig, make_cleaner, DEFAULT_CLEAN_CONFIG
+from .clean_cfg import CleanConfig, compile_cleaner, make_cleaner, DEFAULT_CLEAN_CONFIG
+from .external_sort import structural_dedup_chunks_external
 from .config import (
+    BatchEmbedder,
     RagConfig,
     RagCoreDeps,
     RagBoundaryDeps,
@@ -20,6 +22,7 @@ from .core import (
     _trace_iter,
     gen_chunk_doc,
     gen_chunk_spans,
+    gen_span_chunks,
     gen_overlapping_chunks,
     iter_rag,
     iter_rag_core,
@@ -35,6 +38,7 @@ from .core import (
     iter_chunks_from_cleaned,
     full_rag_api,
     full_rag_api_docs,
+    gen_rag_api_docs,
     full_rag_api_path,
 )
 
@@ -47,7 +51,10 @@ __all__ = [
     "RagTraceV3",
     "CleanConfig",
     "DEFAULT_CLEAN_CONFIG",
+    "compile_cleaner",
     "make_cleaner",
+    "structural_dedup_chunks_external",
+    "BatchEmbedder",
     "RagConfig",
     "RagCoreDeps",
     "DocsReader",
@@ -59,6 +66,7 @@ __all__ = [
     "_trace_iter",
     "gen_chunk_doc",
     "gen_chunk_spans",
+    "gen_span_chunks",
     "gen_overlapping_chunks",
     "iter_rag",
     "iter_rag_core",
@@ -74,5 +82,6 @@ __all__ = [
     "iter_chunks_from_cleaned",
     "full_rag_api",
     "full_rag_api_docs",
+    "gen_rag_api_docs",
     "full_rag_api_path",
 ]
@@ -0,0 +1,63 @@
+"""Vectorized batch embedding stage (end-of-Module-09; NumPy path).
+
+`funcpipe_rag.rag.stages.embed_chunk` is the canonical per-chunk embedder. This
+module provides the batch contract used by `RagCoreDeps.batch_embedder`:
+hash every chunk text once, decode all digests together into an ``(N, 16)``
+float32 matrix, then build the `Chunk` values from the matrix rows.
+
+The vectors are the `embed_chunk` vectors rounded to float32 (the same
+precision trade-off as the Module 05 hybrid path in `rag.domain.perf`).
+`SpanChunk` inputs are hashed straight from their parent document buffer.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from hashlib import sha256
+
+import numpy as np
+from numpy.typing import NDArray
+
+from funcpipe_rag.core.rag_types import Chunk, ChunkWithoutEmbedding, SpanChunk
+
+EMBED_DIM = 16
+# Vectorized `rag.stages._digest_vector`: big-endian uint16 digest words / 65535.
+_WORD_SCALE = np.float32(16**4 - 1)
+
+
+def embed_matrix_bytes(buffers: Iterable[bytes | memoryview]) -> NDArray[np.float32]:
+    """Embed UTF-8 ``buffers`` into an ``(N, 16)`` float32 matrix in one vectorized pass."""
+
+    digests = b"".join(sha256(b).digest() for b in buffers)
+    words = np.frombuffer(digests, dtype=">u2").reshape(-1, EMBED_DIM)
+    return words.astype(np.float32) / _WORD_SCALE
+
+
+def embed_matrix(texts: Sequence[str]) -> NDArray[np.float32]:
+    """Embed ``texts`` into an ``(N, 16)`` float32 matrix in one vectorized pass."""
+
+    return embed_matrix_bytes(t.encode("utf-8") for t in texts)
+
+
+def _utf8(chunk: ChunkWithoutEmbedding | SpanChunk) -> bytes | memoryview:
+    return chunk.text_bytes() if isinstance(chunk, SpanChunk) else chunk.text.encode("utf-8")
+
+
+def embed_chunks_batch(chunks: Sequence[ChunkWithoutEmbedding | SpanChunk]) -> list[Chunk]:
+    """Batch embedder: ``list[ChunkWithoutEmbedding | SpanChunk] -> list[Chunk]`` (order-preserving)."""
+
+    rows = embed_matrix_bytes(_utf8(c) for c in chunks).tolist()
+    return [
+        Chunk(
+            doc_id=c.doc_id,
+            text=c.text,
+            start=c.start,
+            end=c.end,
+            metadata=c.metadata,
+            embedding=tuple(row),
+        )
+        for c, row in zip(chunks, rows)
+    ]
+
+
+__all__ = ["EMBED_DIM", "embed_chunks_batch", "embed_matrix", "embed_matrix_bytes"]
@@ -14,8 +14,9 @@ from funcpipe_rag.rag.stages import (
     iter_chunk_doc,
     iter_chunk_spans,
     iter_overlapping_chunks_text,
+    iter_span_chunks,
 )
-from funcpipe_rag.core.rag_types import ChunkWithoutEmbedding, CleanDoc, RagEnv
+from funcpipe_rag.core.rag_types import ChunkWithoutEmbedding, CleanDoc, RagEnv, SpanChunk
 
 T = TypeVar("T")
 
@@ -32,6 +33,12 @@ def gen_chunk_spans(doc: CleanDoc, env: RagEnv) -> Iterator[tuple[int, int]]:
     yield from iter_chunk_spans(doc, env)
 
 
+def gen_span_chunks(doc: CleanDoc, env: RagEnv) -> Iterator[SpanChunk]:
+    """Yield lazy `SpanChunk` views (text sliced from the abstract on access)."""
+
+    yield from iter_span_chunks(doc, env)
+
+
 def gen_overlapping_chunks(
     doc_id: str,
     text: str,
@@ -67,5 +74,6 @@ __all__ = [
     "gen_chunk_doc",
     "gen_chunk_spans",
     "gen_overlapping_chunks",
+    "gen_span_chunks",
     "sliding_windows",
 ]
@@ -7,10 +7,12 @@ End-of-Module-09 snapshot."""
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from typing import Callable
 
 from funcpipe_rag.core.rag_types import CleanDoc, RawDoc
+from funcpipe_rag.core.text_arena import TextArena
 
 TextRule = Callable[[str], str]
 
@@ -47,11 +49,136 @@ def clean_abstract(text: str, cfg: CleanConfig) -> str:
     return text
 
 
+_BUILTIN_RULES: dict[str, TextRule] = dict(RULES)
+_WS_ONLY = frozenset({"strip", "replace_newlines", "collapse_ws"})
+
+# Single-pass kernels for common adjacent rule pairs (after peephole).
+_FUSED: dict[tuple[str, str], TextRule] = {
+    ("lower", "collapse_ws"): lambda t: " ".join(t.lower().split()),
+    ("upper", "collapse_ws"): lambda t: " ".join(t.upper().split()),
+    ("collapse_ws", "lower"): lambda t: " ".join(t.split()).lower(),
+    ("collapse_ws", "upper"): lambda t: " ".join(t.split()).upper(),
+}
+
+
+def _is_builtin(name: str) -> bool:
+    return name in _BUILTIN_RULES and RULES.get(name) is _BUILTIN_RULES[name]
+
+
+def _peephole(names: Iterable[str]) -> tuple[str, ...]:
+    """Drop whitespace rules made redundant by a neighbouring built-in rule.
+
+    ``collapse_ws`` subsumes any run of built-in whitespace-only rules right
+    before it, and leaves nothing for a following ``strip``/``replace_newlines``
+    to do. Case rules are never reordered or merged (``"İ".lower().upper()``
+    differs from ``"İ".upper()``); overridden or unknown rules act as barriers.
+    """
+
+    out: list[str] = []
+    for name in names:
+        if not _is_builtin(name):
+            out.append(name)
+            continue
+        prev = out[-1] if out and _is_builtin(out[-1]) else None
+        if name == "collapse_ws":
+            while out and _is_builtin(out[-1]) and out[-1] in _WS_ONLY:
+                out.pop()
+            out.append(name)
+        elif name == "strip" and prev in {"strip", "collapse_ws"} or name == "replace_newlines" and prev in {"replace_newlines", "collapse_ws"}:
+            continue
+        else:
+            out.append(name)
+    return tuple(out)
+
+
+def compile_cleaner(cfg: CleanConfig) -> TextRule:
+    """Compile ``cfg`` once into a ``str -> str`` equivalent to `clean_abstract`.
+
+    Rules are resolved from `RULES` at compile time, redundant whitespace passes
+    are removed, and known adjacent pairs run as one fused kernel; anything else
+    falls back to plain composition.
+    """
+
+    names = _peephole(cfg.rule_names)
+    steps: list[TextRule] = []
+    i = 0
+    while i < len(names):
+        pair = names[i : i + 2]
+        if len(pair) == 2 and all(_is_builtin(n) for n in pair) and pair in _FUSED:
+            steps.append(_FUSED[pair])
+            i += 2
+        else:
+            steps.append(RULES[names[i]])
+            i += 1
+
+    if not steps:
+        return str
+    if len(steps) == 1:
+        return steps[0]
+    chain = tuple(steps)
+
+    def compiled(text: str) -> str:
+        for step in chain:
+            text = step(text)
+        return text
+
+    return compiled
+
+
+BytesRule = Callable[[bytes], bytes]
+
+_BYTES_RULES: dict[str, BytesRule] = {
+    "strip": bytes.strip,
+    "lower": bytes.lower,
+    "upper": bytes.upper,
+    "collapse_ws": lambda b: b" ".join(b.split()),
+    "replace_newlines": lambda b: b.replace(b"\n", b" "),
+}
+
+# ASCII characters that ``str`` treats as whitespace but ``bytes`` does not.
+_STR_ONLY_WS = re.compile(b"[\x1c-\x1f]")
+
+
+def _bytes_safe(raw: bytes) -> bool:
+    return _STR_ONLY_WS.search(raw) is None
+
+
+def compile_bytes_cleaner(cfg: CleanConfig) -> BytesRule | None:
+    """Byte-level twin of `compile_cleaner` for ASCII text, or ``None``.
+
+    Only available when every rule is an unmodified built-in; the result equals
+    ``compile_cleaner(cfg)`` on ASCII input without ``\\x1c``–``\\x1f``.
+    """
+
+    names = _peephole(cfg.rule_names)
+    if not all(_is_builtin(n) for n in names):
+        return None
+    if names in (("lower", "collapse_ws"), ("upper", "collapse_ws")):
+        case = bytes.lower if names[0] == "lower" else bytes.upper
+        return lambda b: b" ".join(case(b).split())
+    steps = tuple(_BYTES_RULES[n] for n in names)
+
+    def compiled(raw: bytes) -> bytes:
+        for step in steps:
+            raw = step(raw)
+        return raw
+
+    return compiled
+
+
+def clean_arena(arena: TextArena, cfg: CleanConfig) -> TextArena:
+    """Clean every abstract of ``arena``; ASCII docs are cleaned as bytes slices."""
+
+    return arena.map_abstracts(compile_bytes_cleaner(cfg), compile_cleaner(cfg), bytes_ok=_bytes_safe)
+
+
 def make_cleaner(cfg: CleanConfig) -> Callable[[RawDoc], CleanDoc]:
     """Bind a cleaner config into a pure ``RawDoc -> CleanDoc``."""
 
+    clean = compile_cleaner(cfg)
+
     def cleaner(doc: RawDoc) -> CleanDoc:
-        abstract = clean_abstract(doc.abstract, cfg)
+        abstract = clean(doc.abstract)
         return CleanDoc(doc_id=doc.doc_id, title=doc.title, abstract=abstract, categories=doc.categories)
 
     return cleaner
@@ -65,5 +192,8 @@ __all__ = [
     "collapse_ws",
     "replace_newlines",
     "clean_abstract",
+    "compile_cleaner",
+    "compile_bytes_cleaner",
+    "clean_arena",
     "make_cleaner",
 ]
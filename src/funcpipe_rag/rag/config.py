@@ -7,17 +7,21 @@ and extended in Module 03 with streaming entry points.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from collections.abc import Iterable, Iterator
-from typing import Callable, Mapping, Protocol
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Protocol
 
 from funcpipe_rag.rag.clean_cfg import CleanConfig, DEFAULT_CLEAN_CONFIG, RULES, make_cleaner
 from funcpipe_rag.rag.types import DebugConfig, Observations, RagTaps
 from funcpipe_rag.core.rules_pred import DEFAULT_RULES, RulesConfig
+from funcpipe_rag.policies.memo import CacheInfo, DiskCache, cached_embedder
 from funcpipe_rag.rag.stages import embed_chunk
 from funcpipe_rag.core.rag_types import Chunk, ChunkWithoutEmbedding, CleanDoc, RagEnv, RawDoc
 from funcpipe_rag.result import Err, Ok, Result
 
 
+BatchEmbedder = Callable[[list[ChunkWithoutEmbedding]], Sequence[Chunk]]
+
+
 class DocsReader(Protocol):
     def read_docs(self, path: str) -> Result[list[RawDoc], str]: ...
 
@@ -28,13 +32,24 @@ class RagConfig:
     keep: RulesConfig = DEFAULT_RULES
     clean: CleanConfig = DEFAULT_CLEAN_CONFIG
     debug: DebugConfig = DebugConfig()
+    embed_batch_size: int = 256
 
 
 @dataclass(frozen=True)
 class RagCoreDeps:
+    """Injected stage implementations.
+
+    When ``batch_embedder`` is set, the cores embed in batches of
+    ``RagConfig.embed_batch_size`` instead of calling ``embedder`` per chunk.
+    ``cache_info`` (set by ``get_deps(..., embed_cache=...)``) lets
+    `full_rag_api_docs` report embedding-cache stats in `Observations.extra`.
+    """
+
     cleaner: Callable[[RawDoc], CleanDoc]
     embedder: Callable[[ChunkWithoutEmbedding], Chunk]
     taps: RagTaps | None = None
+    batch_embedder: BatchEmbedder | None = None
+    cache_info: Callable[[], CacheInfo] | None = None
 
 
 @dataclass(frozen=True)
@@ -43,9 +58,40 @@ class RagBoundaryDeps:
     reader: DocsReader
 
 
-def get_deps(config: RagConfig, *, taps: RagTaps | None = None) -> RagCoreDeps:
+def get_deps(
+    config: RagConfig,
+    *,
+    taps: RagTaps | None = None,
+    batch_embedder: BatchEmbedder | None = None,
+    embed_cache: DiskCache | bool = False,
+    embed_norm_version: str = "embed_chunk-v1",
+) -> RagCoreDeps:
+    """Wire default deps; ``embed_cache`` adds a content-addressed embedding cache.
+
+    ``embed_cache=True`` keeps an in-process LRU tier only; a `DiskCache` adds
+    a persistent tier shared across runs. ``embed_norm_version`` names
+    `embed_chunk`'s output; ``batch_embedder`` results are cached under a
+    separate version derived from its `embedder_id`, so float32 batch vectors
+    never stand in for exact per-chunk ones.
+    """
+
     cleaner = make_cleaner(config.clean)
-    return RagCoreDeps(cleaner=cleaner, embedder=embed_chunk, taps=taps)
+    if embed_cache is False:
+        return RagCoreDeps(cleaner=cleaner, embedder=embed_chunk, taps=taps, batch_embedder=batch_embedder)
+
+    cached = cached_embedder(
+        embed_chunk,
+        embed_cache if isinstance(embed_cache, DiskCache) else None,
+        embed_norm_version,
+        inner_batch=batch_embedder,
+    )
+    return RagCoreDeps(
+        cleaner=cleaner,
+        embedder=cached,
+        taps=taps,
+        batch_embedder=cached.embed_batch if batch_embedder is not None else None,
+        cache_info=cached.cache_info,
+    )
 
 
 def make_rag_fn(
@@ -109,6 +155,7 @@ def boundary_rag_config(raw: Mapping[str, object]) -> Result[RagConfig, str]:
 
 
 __all__ = [
+    "BatchEmbedder",
     "DocsReader",
     "RagConfig",
     "RagCoreDeps",
@@ -26,7 +26,7 @@ from funcpipe_rag.policies.breakers import (
     short_circuit_on_err_emit,
     short_circuit_on_err_truncate,
 )
-from funcpipe_rag.policies.memo import DiskCache, content_hash_key, lru_cache_custom, memoize_keyed
+from funcpipe_rag.policies.memo import CachedEmbedder, DiskCache, cached_embedder, content_hash_key, lru_cache_custom, memoize_keyed
 from funcpipe_rag.policies.reports import (
     ErrGroup,
     ErrReport,
@@ -113,10 +113,11 @@ from funcpipe_rag.tree import (
     scan_count_length_maxdepth,
     scan_tree,
 )
-from .chunking import gen_chunk_doc, gen_chunk_spans, gen_overlapping_chunks, sliding_windows
+from .chunking import gen_chunk_doc, gen_chunk_spans, gen_overlapping_chunks, gen_span_chunks, sliding_windows
 from .rag_api import (
     full_rag_api,
     full_rag_api_docs,
+    gen_rag_api_docs,
     full_rag_api_path,
     iter_chunks_from_cleaned,
     iter_rag,
@@ -232,6 +233,8 @@ __all__ = [
     "memoize_keyed",
     "DiskCache",
     "content_hash_key",
+    "CachedEmbedder",
+    "cached_embedder",
 
     # Module 04: Reports
     "ErrGroup",
@@ -243,6 +246,7 @@ __all__ = [
     "_trace_iter",
     "gen_chunk_doc",
     "gen_chunk_spans",
+    "gen_span_chunks",
     "gen_overlapping_chunks",
     "sliding_windows",
     "gen_grouped_chunks",
@@ -258,5 +262,6 @@ __all__ = [
     "iter_chunks_from_cleaned",
     "full_rag_api",
     "full_rag_api_docs",
+    "gen_rag_api_docs",
     "full_rag_api_path",
 ]
@@ -0,0 +1,117 @@
+"""Out-of-core canonical dedup: external merge sort on ``(doc_id, start)`` (end-of-Module-09).
+
+`rag.stages.structural_dedup_chunks` sorts every chunk in memory. This module
+produces exactly the same output for streams larger than RAM:
+
+1. buffer chunks until the estimated run size reaches ``max_run_bytes``
+2. stable-sort the run on ``(doc_id, start)`` and spill it to a temp file as
+   pickled blocks of plain tuples
+3. k-way merge the runs with `streaming.fanin.make_merge` (``heapq.merge`` is
+   stable across sources, so ties keep input order), deduplicating each
+   ``(doc_id, start)`` group on the structural key while merging
+
+Temp files live in a private directory that is removed when the generator is
+exhausted or closed.
+"""
+
+from __future__ import annotations
+
+import pickle
+import tempfile
+from collections.abc import Iterable, Iterator
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+from funcpipe_rag.core.rag_types import Chunk
+from funcpipe_rag.streaming.fanin import make_merge
+
+# (doc_id, start, text, end, metadata | None, embedding)
+_Record = tuple[str, int, str, int, "dict[str, Any] | None", tuple[float, ...]]
+
+_SORT_KEY = itemgetter(0, 1)
+_BLOCK = 4096
+_RECORD_OVERHEAD = 400  # rough per-chunk cost of the tuple, ints, and 16 floats
+
+
+def _to_record(c: Chunk) -> _Record:
+    return (c.doc_id, c.start, c.text, c.end, dict(c.metadata) if c.metadata else None, c.embedding)
+
+
+def _to_chunk(r: _Record) -> Chunk:
+    doc_id, start, text, end, metadata, embedding = r
+    return Chunk(doc_id=doc_id, text=text, start=start, end=end, metadata=metadata or {}, embedding=embedding)
+
+
+def _spill(run: list[_Record], path: Path) -> Path:
+    with path.open("wb") as f:
+        for i in range(0, len(run), _BLOCK):
+            pickle.dump(run[i : i + _BLOCK], f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path: Path) -> Iterator[_Record]:
+    with path.open("rb") as f:
+        while True:
+            try:
+                block: list[_Record] = pickle.load(f)
+            except EOFError:
+                return
+            yield from block
+
+
+def _dedup_sorted(records: Iterable[_Record]) -> Iterator[Chunk]:
+    for _, group in groupby(records, key=_SORT_KEY):
+        seen: set[tuple[str, int]] = set()
+        for r in group:
+            k = (r[2], r[3])
+            if k not in seen:
+                seen.add(k)
+                yield _to_chunk(r)
+
+
+def structural_dedup_chunks_external(
+    chunks: Iterable[Chunk],
+    *,
+    max_run_bytes: int = 256 * 1024 * 1024,
+    tmp_dir: str | None = None,
+) -> Iterator[Chunk]:
+    """Lazily yield ``structural_dedup_chunks(chunks)`` using bounded memory.
+
+    ``max_run_bytes`` bounds the estimated size of each in-memory run; streams
+    that fit in a single run are sorted in memory without touching disk.
+    Arguments are validated at call time, not on first iteration.
+    """
+
+    if max_run_bytes <= 0:
+        raise ValueError("max_run_bytes must be > 0")
+    return _dedup_external(chunks, max_run_bytes, tmp_dir)
+
+
+def _dedup_external(chunks: Iterable[Chunk], max_run_bytes: int, tmp_dir: str | None) -> Iterator[Chunk]:
+    with tempfile.TemporaryDirectory(prefix="funcpipe-dedup-", dir=tmp_dir) as d:
+        runs: list[Path] = []
+        buf: list[_Record] = []
+        size = 0
+        for c in chunks:
+            buf.append(_to_record(c))
+            size += _RECORD_OVERHEAD + len(c.text) + len(c.doc_id)
+            if size >= max_run_bytes:
+                buf.sort(key=_SORT_KEY)
+                runs.append(_spill(buf, Path(d) / f"run-{len(runs):06d}.pkl"))
+                buf, size = [], 0
+        buf.sort(key=_SORT_KEY)
+
+        if not runs:
+            yield from _dedup_sorted(buf)
+            return
+
+        tail = tuple(buf)
+        sources = [partial(_read_run, p) for p in runs] + [partial(iter, tail)]
+        del buf
+        yield from _dedup_sorted(make_merge(*sources, key=_SORT_KEY)())
+
+
+__all__ = ["structural_dedup_chunks_external"]
@@ -0,0 +1,152 @@
+"""Multi-process execution of `iter_rag_core` (end-of-Module-09; NumPy path).
+
+`result.stream.par_try_map_iter` is thread-based and therefore GIL-bound for
+the CPU-heavy clean → chunk → embed path. `parallel_rag_core` shards the
+document stream into batches, runs `iter_rag_core` on each shard in a process
+pool, and streams the chunks back:
+
+- at most ``inflight`` shards are submitted-but-not-yet-yielded at any time,
+  so memory stays bounded regardless of input size
+- ``ordered=True`` yields shards in input order (a FIFO reorder buffer, like
+  `policies.retries.restore_input_order`); ``ordered=False`` yields shards as
+  they complete
+- shards travel back as float64 `core.chunk_batch.ChunkBatch` columns
+  (`Chunk` metadata is a ``MappingProxyType`` and does not pickle), so the
+  reconstructed chunks are equal to the sequential ones
+- the keep predicate is compiled once per worker, so an adaptive one
+  (``RulesConfig.adaptive_sample``) samples across all of that worker's
+  shards; its learned order and stats stay in the worker
+
+``config`` and ``deps`` are handed to each worker once via the pool
+initializer. The pool uses the platform's default start method unless
+``mp_context`` is given; under ``fork`` they are inherited rather than pickled,
+so closure-based deps (e.g. the `make_cleaner` cleaner from `get_deps`) work
+unchanged. Under ``spawn``/``forkserver`` (the macOS / Windows defaults) they
+must be picklable, which `get_deps` deps are not. ``fork`` is not chosen
+implicitly because forking a threaded parent is unsafe on macOS; pass
+``mp_context=multiprocessing.get_context("fork")`` where that is acceptable.
+
+``deps.taps`` are rejected: they would run in the workers, and their side
+effects would never reach the caller. Tap the chunk stream this function
+returns instead.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from multiprocessing.context import BaseContext
+
+import numpy as np
+
+from funcpipe_rag.core.chunk_batch import ChunkBatch
+from funcpipe_rag.core.rag_types import Chunk, DocRule, RawDoc
+from funcpipe_rag.core.rules_adaptive import compile_rules
+
+from .config import RagConfig, RagCoreDeps
+from .rag_api import iter_rag_core
+
+_WORKER_STATE: tuple[RagConfig, RagCoreDeps, DocRule] | None = None
+
+
+def _init_worker(config: RagConfig, deps: RagCoreDeps) -> None:
+    global _WORKER_STATE
+    # One keep predicate per worker, so an adaptive one samples across shards.
+    _WORKER_STATE = (config, deps, compile_rules(config.keep))
+
+
+def _run_shard(docs: list[RawDoc]) -> ChunkBatch:
+    if _WORKER_STATE is None:
+        raise RuntimeError("parallel_rag_core worker was not initialised")
+    config, deps, keep = _WORKER_STATE
+    return ChunkBatch.from_chunks(iter_rag_core(docs, config, deps, keep=keep), dtype=np.float64)
+
+
+def parallel_rag_core(
+    docs: Iterable[RawDoc],
+    config: RagConfig,
+    deps: RagCoreDeps,
+    *,
+    workers: int | None = None,
+    ordered: bool = True,
+    inflight: int | None = None,
+    batch_size: int = 64,
+    mp_context: BaseContext | None = None,
+) -> Iterator[Chunk]:
+    """Process-parallel `iter_rag_core`: same chunks, sharded ``batch_size`` docs at a time.
+
+    ``workers`` defaults to ``os.cpu_count()`` and ``inflight`` to ``2 * workers``.
+    Worker exceptions propagate to the consumer when their shard is reached;
+    bad arguments (including ``deps.taps``) raise ``ValueError`` at call time.
+    """
+
+    n_workers = workers if workers is not None else (os.cpu_count() or 1)
+    max_inflight = inflight if inflight is not None else 2 * n_workers
+    if n_workers <= 0:
+        raise ValueError("workers must be > 0")
+    if max_inflight <= 0:
+        raise ValueError("inflight must be > 0")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be > 0")
+    if deps.taps is not None:
+        raise ValueError("deps.taps are not supported in parallel_rag_core (they would run in the workers)")
+    return _run_parallel(
+        iter(docs),
+        config,
+        deps,
+        workers=n_workers,
+        ordered=ordered,
+        inflight=max_inflight,
+        batch_size=batch_size,
+        mp_context=mp_context,
+    )
+
+
+def _run_parallel(
+    it: Iterator[RawDoc],
+    config: RagConfig,
+    deps: RagCoreDeps,
+    *,
+    workers: int,
+    ordered: bool,
+    inflight: int,
+    batch_size: int,
+    mp_context: BaseContext | None,
+) -> Iterator[Chunk]:
+    ex = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context if mp_context is not None else mp.get_context(),
+        initializer=_init_worker,
+        initargs=(config, deps),
+    )
+    pending: deque[Future[ChunkBatch]] = deque()
+
+    def submit_next() -> bool:
+        shard = list(islice(it, batch_size))
+        if not shard:
+            return False
+        pending.append(ex.submit(_run_shard, shard))
+        return True
+
+    try:
+        while len(pending) < inflight and submit_next():
+            pass
+        while pending:
+            if ordered:
+                fut = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                fut = next(f for f in pending if f in done)
+                pending.remove(fut)
+            batch = fut.result()
+            submit_next()
+            yield from batch.iter_chunks()
+    finally:
+        ex.shutdown(wait=True, cancel_futures=True)
+
+
+__all__ = ["parallel_rag_core"]
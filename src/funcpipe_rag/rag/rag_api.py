@@ -4,25 +4,30 @@ This module contains the domain-specific core pipeline entry points:
 - a minimal lazy pipeline (`iter_rag`)
 - the fully-configurable instrumented core (`iter_rag_core`)
 - the doc-materializing API for taps/observations (`full_rag_api_docs`)
+- its one-pass, bounded-memory counterpart (`gen_rag_api_docs`)
 - a boundary helper that returns a `Result` (`full_rag_api_path`)
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator, Sequence
+from bisect import insort
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
 from itertools import chain
 from typing import TypeVar
 
 from funcpipe_rag.core.rules_dsl import any_doc
-from funcpipe_rag.core.rules_pred import eval_pred
-from funcpipe_rag.rag.stages import embed_chunk, structural_dedup_chunks
+from funcpipe_rag.core.rules_adaptive import compile_rules
+from funcpipe_rag.core.structural_dedup import SeenSet, structural_dedup_lazy
+from funcpipe_rag.policies.memo import CacheInfo
+from funcpipe_rag.rag.stages import embed_chunk, iter_embed_batched, structural_dedup_chunks
 from funcpipe_rag.core.rag_types import Chunk, ChunkWithoutEmbedding, CleanDoc, DocRule, RawDoc, RagEnv
 from funcpipe_rag.result import Err, Ok, Result
 
 from funcpipe_rag.fp import StageInstrumentation, instrument_stage
+from funcpipe_rag.streaming import tap_prefix
 
 from .chunking import gen_chunk_doc
-from .config import RagBoundaryDeps, RagConfig, RagCoreDeps
+from .config import BatchEmbedder, RagBoundaryDeps, RagConfig, RagCoreDeps
 from .types import Observations
 
 T = TypeVar("T")
@@ -55,17 +60,25 @@ def iter_rag(
     yield from embedded
 
 
-def iter_rag_core(docs: Iterable[RawDoc], config: RagConfig, deps: RagCoreDeps) -> Iterator[Chunk]:
+def iter_rag_core(
+    docs: Iterable[RawDoc],
+    config: RagConfig,
+    deps: RagCoreDeps,
+    *,
+    keep: DocRule | None = None,
+) -> Iterator[Chunk]:
     """Parametric streaming core: filter (RulesConfig) → clean → chunk → embed.
 
+    ``keep`` overrides ``compile_rules(config.keep)``, e.g. to reuse one
+    `AdaptivePred` (and its learned order) across calls.
+
     Module 09 stdlib-first note:
     - This pipeline is built from stdlib primitives (`filter`, `map`, `itertools.chain`).
     - Optional tracing/probes are applied via `instrument_stage` only when enabled.
     - See `course-book/reference/fp-standards.md` for the repo's stdlib-first guidance.
     """
 
-    def keep_rule(doc: RawDoc) -> bool:
-        return eval_pred(doc, config.keep.keep_pred)
+    keep_rule = keep if keep is not None else compile_rules(config.keep)
 
     def check_chunk(chunk: ChunkWithoutEmbedding) -> None:
         if chunk.start < 0 or chunk.end < chunk.start:
@@ -84,6 +97,8 @@ def iter_rag_core(docs: Iterable[RawDoc], config: RagConfig, deps: RagCoreDeps)
         return chain.from_iterable(map(chunker, stream))
 
     def _embed(stream: Iterable[ChunkWithoutEmbedding]) -> Iterator[Chunk]:
+        if deps.batch_embedder is not None:
+            return iter_embed_batched(stream, deps.batch_embedder, batch_size=config.embed_batch_size)
         return map(deps.embedder, stream)
 
     kept_stage: Callable[[Iterable[RawDoc]], Iterator[RawDoc]] = _kept
@@ -140,14 +155,34 @@ def iter_chunks_from_cleaned(
     cleaned: Iterable[CleanDoc],
     config: RagConfig,
     embedder: Callable[[ChunkWithoutEmbedding], Chunk],
+    *,
+    batch_embedder: BatchEmbedder | None = None,
 ) -> Iterator[Chunk]:
     """Streaming sub-core: chunk + embed from cleaned docs."""
 
+    if batch_embedder is not None:
+        chunks = (chunk for cd in cleaned for chunk in gen_chunk_doc(cd, config.env))
+        yield from iter_embed_batched(chunks, batch_embedder, batch_size=config.embed_batch_size)
+        return
+
     for cd in cleaned:
         for chunk in gen_chunk_doc(cd, config.env):
             yield embedder(chunk)
 
 
+def _cache_extra(deps: RagCoreDeps, before: CacheInfo | None) -> tuple[tuple[str, CacheInfo], ...]:
+    if deps.cache_info is None or before is None:
+        return ()
+    after = deps.cache_info()
+    delta = CacheInfo(
+        hits=after.hits - before.hits,
+        misses=after.misses - before.misses,
+        evictions=after.evictions - before.evictions,
+        disk_hits=after.disk_hits - before.disk_hits,
+    )
+    return (("embed_cache", delta),)
+
+
 def full_rag_api_docs(
     docs: Iterable[RawDoc],
     config: RagConfig,
@@ -157,17 +192,22 @@ def full_rag_api_docs(
 
     docs_list = list(docs)
     sample_size = config.env.sample_size
+    cache_before = deps.cache_info() if deps.cache_info is not None else None
 
-    kept_docs = [d for d in docs_list if eval_pred(d, config.keep.keep_pred)]
+    keep = compile_rules(config.keep)
+    kept_docs = [d for d in docs_list if keep(d)]
     _tap(kept_docs, deps.taps.docs if deps.taps else None)
 
     cleaned = [deps.cleaner(d) for d in kept_docs]
     _tap(cleaned, deps.taps.cleaned if deps.taps else None)
 
-    chunks_pre_dedup = list(iter_chunks_from_cleaned(cleaned, config, deps.embedder))
+    chunks_pre_dedup = list(
+        iter_chunks_from_cleaned(cleaned, config, deps.embedder, batch_embedder=deps.batch_embedder)
+    )
     _tap(chunks_pre_dedup, deps.taps.chunks if deps.taps else None)
 
     chunks = structural_dedup_chunks(chunks_pre_dedup)
+    extra = _cache_extra(deps, cache_before)
     obs = Observations(
         total_docs=len(docs_list),
         kept_docs=len(kept_docs),
@@ -175,12 +215,99 @@ def full_rag_api_docs(
         total_chunks=len(chunks),
         sample_doc_ids=tuple(d.doc_id for d in kept_docs[:sample_size]),
         sample_chunk_starts=tuple(c.start for c in chunks[:sample_size]),
-        extra=(),
+        extra=extra,
         warnings=(),
     )
     return chunks, obs
 
 
+def gen_rag_api_docs(
+    docs: Iterable[RawDoc],
+    config: RagConfig,
+    deps: RagCoreDeps,
+    *,
+    tap_limit: int = 1024,
+    on_observations: Callable[[Observations], None] | None = None,
+    dedup_seen: SeenSet[int] | None = None,
+) -> Generator[Chunk, None, Observations]:
+    """One-pass, bounded-memory variant of `full_rag_api_docs`.
+
+    Yields deduplicated chunks in encounter order (the same set of chunks that
+    `full_rag_api_docs` returns sorted) and returns, as the generator's return
+    value and via ``on_observations``, the same `Observations`. Counts are
+    incremental folds, samples are fixed-size buffers, and taps see at most the
+    first ``tap_limit`` items of their stage, so peak memory is the dedup key
+    set plus O(sample_size + tap_limit). Pass ``dedup_seen`` (e.g. a
+    `FingerprintSet`) to key dedup by 128-bit fingerprints instead of full text.
+    """
+
+    if tap_limit < 0:
+        raise ValueError("tap_limit must be >= 0")
+
+    sample_size = config.env.sample_size
+    cache_before = deps.cache_info() if deps.cache_info is not None else None
+    keep = compile_rules(config.keep)
+    total_docs = kept_count = cleaned_count = total_chunks = 0
+    sample_doc_ids: list[str] = []
+    smallest: list[tuple[str, int, int]] = []
+
+    def count_docs(stream: Iterable[RawDoc]) -> Iterator[RawDoc]:
+        nonlocal total_docs
+        for d in stream:
+            total_docs += 1
+            yield d
+
+    def kept_stage(stream: Iterable[RawDoc]) -> Iterator[RawDoc]:
+        nonlocal kept_count
+        for d in stream:
+            if keep(d):
+                kept_count += 1
+                if len(sample_doc_ids) < sample_size:
+                    sample_doc_ids.append(d.doc_id)
+                yield d
+
+    def clean_stage(stream: Iterable[RawDoc]) -> Iterator[CleanDoc]:
+        nonlocal cleaned_count
+        for d in stream:
+            cleaned_count += 1
+            yield deps.cleaner(d)
+
+    def bounded_tap(stream: Iterable[T], handler: Callable[[tuple[T, ...]], None] | None) -> Iterable[T]:
+        return stream if handler is None else tap_prefix(stream, tap_limit, handler)
+
+    taps = deps.taps
+    kept: Iterable[RawDoc] = bounded_tap(kept_stage(count_docs(docs)), taps.docs if taps else None)
+    cleaned: Iterable[CleanDoc] = bounded_tap(clean_stage(kept), taps.cleaned if taps else None)
+    embedded: Iterable[Chunk] = bounded_tap(
+        iter_chunks_from_cleaned(cleaned, config, deps.embedder, batch_embedder=deps.batch_embedder),
+        taps.chunks if taps else None,
+    )
+
+    for seq, chunk in enumerate(structural_dedup_lazy(embedded, seen=dedup_seen)):
+        total_chunks += 1
+        key = (chunk.doc_id, chunk.start, seq)
+        if len(smallest) < sample_size:
+            insort(smallest, key)
+        elif key < smallest[-1]:
+            insort(smallest, key)
+            smallest.pop()
+        yield chunk
+
+    obs = Observations(
+        total_docs=total_docs,
+        kept_docs=kept_count,
+        cleaned_docs=cleaned_count,
+        total_chunks=total_chunks,
+        sample_doc_ids=tuple(sample_doc_ids),
+        sample_chunk_starts=tuple(start for _, start, _ in smallest),
+        extra=_cache_extra(deps, cache_before),
+        warnings=(),
+    )
+    if on_observations is not None:
+        on_observations(obs)
+    return obs
+
+
 def full_rag_api(
     docs: Iterable[RawDoc],
     config: RagConfig,
@@ -211,5 +338,6 @@ __all__ = [
     "iter_chunks_from_cleaned",
     "full_rag_api",
     "full_rag_api_docs",
+    "gen_rag_api_docs",
     "full_rag_api_path",
 ]
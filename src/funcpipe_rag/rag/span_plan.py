@@ -0,0 +1,87 @@
+"""Vectorized corpus-wide chunk span planning (end-of-Module-09; NumPy path).
+
+`rag.stages.iter_chunk_spans` walks one document at a time in a Python loop.
+`plan_chunk_spans` computes the same ``(start, end)`` spans for a whole corpus
+from an array of abstract lengths in one vectorized pass. With ``step = k - o``
+the per-document chunk count is:
+
+- ``emit_short`` / ``pad``: ``ceil(n / step)`` (0 for empty docs)
+- ``drop``: ``floor((n - k) / step) + 1`` when ``n >= k``, else 0
+
+so chunk counts (and output sizes) are known before any text is touched.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from funcpipe_rag.core.rag_types import CleanDoc, RagEnv, SpanChunk, SpanSource
+
+
+@dataclass(frozen=True, eq=False)
+class SpanPlan:
+    """Flat span table: row ``r`` is ``(doc_index[r], starts[r], ends[r])``."""
+
+    doc_index: NDArray[np.int64]
+    starts: NDArray[np.int64]
+    ends: NDArray[np.int64]
+    counts: NDArray[np.int64]
+
+    def __len__(self) -> int:
+        return int(self.starts.shape[0])
+
+
+def chunk_counts(lengths: ArrayLike, env: RagEnv) -> NDArray[np.int64]:
+    """Number of chunks each document of the given length produces under ``env``."""
+
+    if env.chunk_mode != "fixed":
+        raise ValueError('span planning requires chunk_mode="fixed" (cdc spans depend on the text)')
+    k, o = env.chunk_size, env.overlap
+    if k <= 0 or not 0 <= o < k:
+        raise ValueError("invalid chunk/overlap")
+    n = np.asarray(lengths, dtype=np.int64)
+    if n.ndim != 1:
+        raise ValueError("lengths must be one-dimensional")
+    if n.size and int(n.min()) < 0:
+        raise ValueError("lengths must be >= 0")
+
+    step = k - o
+    if env.tail_policy == "drop":
+        return np.where(n >= k, (n - k) // step + 1, 0)
+    return -(-n // step)
+
+
+def plan_chunk_spans(lengths: ArrayLike, env: RagEnv) -> SpanPlan:
+    """Spans for every document at once, identical to `iter_chunk_spans` per document."""
+
+    n = np.asarray(lengths, dtype=np.int64)
+    counts = chunk_counts(n, env)
+    step = env.chunk_size - env.overlap
+
+    doc_index = np.repeat(np.arange(n.shape[0], dtype=np.int64), counts)
+    first_row = np.cumsum(counts) - counts
+    within = np.arange(doc_index.shape[0], dtype=np.int64) - np.repeat(first_row, counts)
+    starts = within * step
+    ends = starts + env.chunk_size
+    if env.tail_policy != "pad":
+        np.minimum(ends, np.repeat(n, counts), out=ends)
+    return SpanPlan(doc_index=doc_index, starts=starts, ends=ends, counts=counts)
+
+
+def iter_planned_span_chunks(docs: Sequence[CleanDoc], plan: SpanPlan) -> Iterator[SpanChunk]:
+    """Materialize a plan as `SpanChunk` views (one shared `SpanSource` per doc)."""
+
+    sources: dict[int, SpanSource] = {}
+    for d, start, end in zip(plan.doc_index.tolist(), plan.starts.tolist(), plan.ends.tolist()):
+        source = sources.get(d)
+        if source is None:
+            sources.clear()
+            source = sources[d] = SpanSource(docs[d].abstract)
+        yield SpanChunk(doc_id=docs[d].doc_id, source=source, start=start, end=end)
+
+
+__all__ = ["SpanPlan", "chunk_counts", "iter_planned_span_chunks", "plan_chunk_spans"]
@@ -7,7 +7,10 @@ them together with configuration-as-data, taps/probes, and boundary adapters.
 from __future__ import annotations
 
 import hashlib
-from collections.abc import Iterable, Iterator
+import math
+import struct
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import islice
 
 from funcpipe_rag.core.rag_types import (
     Chunk,
@@ -15,8 +18,11 @@ from funcpipe_rag.core.rag_types import (
     CleanDoc,
     RagEnv,
     RawDoc,
+    SpanChunk,
+    SpanSource,
 )
 from funcpipe_rag.core.structural_dedup import structural_dedup_lazy
+from funcpipe_rag.core.text_arena import TextArena
 
 
 def clean_doc(doc: RawDoc) -> CleanDoc:
@@ -75,6 +81,13 @@ def iter_overlapping_chunks_text(
 def iter_chunk_spans(doc: CleanDoc, env: RagEnv) -> Iterator[tuple[int, int]]:
     """Yield (start, end) chunk spans for a document."""
 
+    if env.chunk_mode == "cdc":
+        yield from iter_cdc_spans(doc.abstract, env)
+        return
+    yield from _iter_spans(len(doc.abstract), env)
+
+
+def _iter_spans(n: int, env: RagEnv) -> Iterator[tuple[int, int]]:
     k = env.chunk_size
     o = env.overlap
     tail_policy = env.tail_policy
@@ -82,7 +95,6 @@ def iter_chunk_spans(doc: CleanDoc, env: RagEnv) -> Iterator[tuple[int, int]]:
         raise ValueError("invalid chunk/overlap")
 
     step = k - o
-    n = len(doc.abstract)
     i = 0
     while i < n:
         j = i + k
@@ -92,9 +104,70 @@ def iter_chunk_spans(doc: CleanDoc, env: RagEnv) -> Iterator[tuple[int, int]]:
         i += step
 
 
+_M64 = (1 << 64) - 1
+_GEAR = tuple(
+    int.from_bytes(hashlib.blake2b(b"funcpipe-gear" + bytes([i]), digest_size=8).digest(), "big") for i in range(256)
+)
+
+
+def iter_cdc_spans(text: str, env: RagEnv) -> Iterator[tuple[int, int]]:
+    """Content-defined (start, end) spans using a Gear rolling hash.
+
+    A boundary is cut after position ``i`` once the chunk has at least the
+    minimum size and the top bits of the hash (which cover the last ~64
+    characters) are zero, or when the chunk reaches the maximum size. Cut
+    points depend on local content only, so an edit moves just the boundaries
+    near it and later chunks keep their text (and their embedding-cache keys).
+    """
+
+    lo, avg, hi = env.cdc_bounds
+    bits = round(math.log2(avg - lo)) if avg > lo else 0
+    mask = ((1 << bits) - 1) << (64 - bits) if bits else 0
+    gear = _GEAR
+    n = len(text)
+    start = 0
+    h = 0
+    for i, ch in enumerate(text):
+        o = ord(ch)
+        h = ((h << 1) + gear[(o ^ (o >> 8)) & 0xFF]) & _M64
+        size = i + 1 - start
+        if size >= hi or (size >= lo and not h & mask):
+            yield (start, i + 1)
+            start = i + 1
+    if start < n and not (env.tail_policy == "drop" and n - start < lo):
+        yield (start, n)
+
+
+def iter_span_chunks(doc: CleanDoc, env: RagEnv) -> Iterator[SpanChunk]:
+    """Yield zero-copy span chunks sharing one `SpanSource` over ``doc.abstract``.
+
+    Same ``(doc_id, start, end, text)`` sequence as `iter_chunk_doc`, but no
+    chunk text is sliced until a consumer reads ``SpanChunk.text``.
+    """
+
+    source = SpanSource(doc.abstract)
+    for start, end in iter_chunk_spans(doc, env):
+        yield SpanChunk(doc_id=doc.doc_id, source=source, start=start, end=end)
+
+
+def iter_arena_span_chunks(arena: TextArena, env: RagEnv) -> Iterator[SpanChunk]:
+    """`iter_span_chunks` over every doc of a `TextArena`, viewing the arena buffer."""
+
+    for i, doc_id in enumerate(arena.doc_ids):
+        source = arena.source(i)
+        spans = iter_cdc_spans(source.text, env) if env.chunk_mode == "cdc" else _iter_spans(len(source), env)
+        for start, end in spans:
+            yield SpanChunk(doc_id=doc_id, source=source, start=start, end=end)
+
+
 def iter_chunk_doc(doc: CleanDoc, env: RagEnv) -> Iterator[ChunkWithoutEmbedding]:
     """Yield chunks lazily from a cleaned document."""
 
+    if env.chunk_mode == "cdc":
+        text = doc.abstract
+        for start, end in iter_cdc_spans(text, env):
+            yield ChunkWithoutEmbedding(doc_id=doc.doc_id, text=text[start:end], start=start, end=end)
+        return
     yield from iter_overlapping_chunks_text(
         doc_id=doc.doc_id,
         text=doc.abstract,
@@ -104,12 +177,22 @@ def iter_chunk_doc(doc: CleanDoc, env: RagEnv) -> Iterator[ChunkWithoutEmbedding
     )
 
 
+_DIGEST_WORDS = struct.Struct(">16H")
+
+
+def _digest_vector(data: bytes | memoryview) -> tuple[float, ...]:
+    """The embedding of UTF-8 ``data``: SHA-256 as 16 big-endian uint16 words, each scaled by 1/65535.
+
+    Single source of the mapping; `rag.batch_embed` vectorizes the same one.
+    """
+
+    return tuple(w / 65535 for w in _DIGEST_WORDS.unpack(hashlib.sha256(data).digest()))
+
+
 def embed_chunk(chunk: ChunkWithoutEmbedding) -> Chunk:
     """Produce a deterministic 16-dimensional embedding from chunk text."""
 
-    digest = hashlib.sha256(chunk.text.encode("utf-8")).hexdigest()
-    step = 4
-    vector = tuple(int(digest[i : i + step], 16) / (16**step - 1) for i in range(0, len(digest), step))[:16]
+    vector = _digest_vector(chunk.text.encode("utf-8"))
     return Chunk(
         doc_id=chunk.doc_id,
         text=chunk.text,
@@ -120,6 +203,39 @@ def embed_chunk(chunk: ChunkWithoutEmbedding) -> Chunk:
     )
 
 
+def embed_span_chunk(chunk: SpanChunk) -> Chunk:
+    """`embed_chunk` for span chunks: hash from the parent buffer, slice text once."""
+
+    vector = _digest_vector(chunk.text_bytes())
+    return Chunk(
+        doc_id=chunk.doc_id,
+        text=chunk.text,
+        start=chunk.start,
+        end=chunk.end,
+        metadata=chunk.metadata,
+        embedding=vector,
+    )
+
+
+def iter_embed_batched(
+    chunks: Iterable[ChunkWithoutEmbedding],
+    batch_embedder: Callable[[list[ChunkWithoutEmbedding]], Sequence[Chunk]],
+    *,
+    batch_size: int,
+) -> Iterator[Chunk]:
+    """Drive a batch embedder over a chunk stream in fixed-size batches (order-preserving)."""
+
+    if batch_size <= 0:
+        raise ValueError("batch_size must be > 0")
+
+    it = iter(chunks)
+    while batch := list(islice(it, batch_size)):
+        embedded = batch_embedder(batch)
+        if len(embedded) != len(batch):
+            raise ValueError("batch embedder must return one Chunk per input chunk")
+        yield from embedded
+
+
 def structural_dedup_chunks(chunks: Iterable[Chunk]) -> list[Chunk]:
     """Canonical deduplication: sort by (doc_id, start) then remove duplicates."""
 
@@ -131,8 +247,13 @@ __all__ = [
     "clean_doc",
     "chunk_doc",
     "iter_chunk_spans",
+    "iter_cdc_spans",
     "iter_overlapping_chunks_text",
+    "iter_span_chunks",
+    "iter_arena_span_chunks",
     "iter_chunk_doc",
     "embed_chunk",
+    "embed_span_chunk",
+    "iter_embed_batched",
     "structural_dedup_chunks",
 ]
@@ -11,8 +11,8 @@ from itertools import dropwhile, groupby, islice
 from operator import attrgetter
 from typing import TypeVar
 
-from funcpipe_rag.core.rules_pred import eval_pred
-from funcpipe_rag.core.structural_dedup import structural_dedup_lazy
+from funcpipe_rag.core.rules_adaptive import compile_rules
+from funcpipe_rag.core.structural_dedup import SeenSet, structural_dedup_lazy
 from funcpipe_rag.core.rag_types import Chunk, ChunkWithoutEmbedding, CleanDoc, RawDoc
 from funcpipe_rag.streaming import TraceLens, ensure_contiguous, trace_iter
 
@@ -46,7 +46,8 @@ def stream_chunks(
     if trace_docs is not None:
         stream = trace_iter(stream, trace_docs)
 
-    kept = (d for d in stream if eval_pred(d, config.keep.keep_pred))
+    keep = compile_rules(config.keep)
+    kept = filter(keep, stream)
     cleaned: Iterable[CleanDoc] = (deps.cleaner(d) for d in kept)
     if trace_cleaned is not None:
         cleaned = trace_iter(cleaned, trace_cleaned)
@@ -71,10 +72,10 @@ def gen_stream_embedded(
     yield from embedded
 
 
-def gen_stream_deduped(chunks: Iterable[Chunk]) -> Iterator[Chunk]:
-    """Streaming structural dedup stage (order-preserving)."""
+def gen_stream_deduped(chunks: Iterable[Chunk], *, seen: SeenSet[int] | None = None) -> Iterator[Chunk]:
+    """Streaming structural dedup stage (order-preserving; ``seen`` as in `structural_dedup_lazy`)."""
 
-    yield from structural_dedup_lazy(chunks)
+    yield from structural_dedup_lazy(chunks, seen=seen)
 
 
 def gen_bounded_chunks(
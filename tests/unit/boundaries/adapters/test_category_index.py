@@ -0,0 +1,93 @@
+"""CategoryIndex: bitmap answers match a scan with eval_pred, incrementally and after reload."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from funcpipe_rag.boundaries.adapters.category_index import (
+    CategoryIndex,
+    load_category_index,
+    save_category_index,
+)
+from funcpipe_rag.core.rag_types import RawDoc
+from funcpipe_rag.core.rules_pred import (
+    All,
+    AnyOf,
+    Eq,
+    LenGt,
+    Not,
+    Pred,
+    StartsWith,
+    eval_pred,
+)
+from funcpipe_rag.result.types import Ok
+
+_cats = st.sampled_from(["cs.AI", "cs.LG", "cs.AI cs.LG", "math.NT", "math", "", "quant-ph"])
+_doc = st.builds(RawDoc, doc_id=st.sampled_from("abcdefgh"), title=st.just(""), abstract=st.just(""), categories=_cats)
+_leaf = st.one_of(
+    st.builds(Eq, st.just("categories"), _cats),
+    st.builds(StartsWith, st.just("categories"), st.sampled_from(["", "cs", "cs.", "math", "q", "z"])),
+    st.builds(LenGt, st.just("categories"), st.integers(-1, 6)),
+    st.builds(Eq, st.just("doc_id"), st.sampled_from("abz")),
+)
+_pred: st.SearchStrategy[Pred] = st.recursive(
+    _leaf,
+    lambda inner: st.one_of(
+        st.builds(All, st.lists(inner, max_size=3).map(tuple)),
+        st.builds(AnyOf, st.lists(inner, max_size=3).map(tuple)),
+        st.builds(Not, inner),
+    ),
+    max_leaves=8,
+)
+
+
+def _scan(docs: list[RawDoc], pred: Pred) -> set[str]:
+    latest = {d.doc_id: d for d in docs}
+    return {i for i, d in latest.items() if eval_pred(d, pred)}
+
+
+@given(first=st.lists(_doc, max_size=12), more=st.lists(_doc, max_size=6), pred=_pred)
+def test_index_matches_scan_incrementally_and_after_roundtrip(first: list[RawDoc], more: list[RawDoc], pred: Pred) -> None:
+    index = CategoryIndex.from_docs(first)
+    assert set(index.matching_doc_ids(pred)) == _scan(first, pred)
+    index.add(more)
+    expected = _scan(first + more, pred)
+    got = index.matching_doc_ids(pred)
+    assert len(got) == len(set(got)) and set(got) == expected
+    assert CategoryIndex.from_bytes(index.to_bytes()).matching_doc_ids(pred) == got
+
+
+def test_persistence_and_unindexed_paths(tmp_path: Path) -> None:
+    path = str(tmp_path / "cats.idx")
+    assert isinstance(load_category_index(path), Ok) and len(load_category_index(path).value) == 0  # type: ignore[union-attr]
+    docs = [RawDoc(str(i), "", "", "cs.AI" if i % 4 else "math.NT") for i in range(200)]
+    index = CategoryIndex.from_docs(docs)
+    assert save_category_index(path, index) == Ok(None)
+    loaded = load_category_index(path)
+    assert isinstance(loaded, Ok)
+    assert loaded.value.matching_rows(StartsWith("categories", "math")) == list(range(0, 200, 4))
+    assert loaded.value.values == ("cs.AI", "math.NT")
+    with pytest.raises(ValueError, match="cannot answer"):
+        index.bitmap(LenGt("abstract", 3))
+    (tmp_path / "bad.idx").write_bytes(b"nope")
+    assert not isinstance(load_category_index(str(tmp_path / "bad.idx")), Ok)
+
+
+def test_prefix_over_many_sparse_values_builds_no_per_value_bitmaps(monkeypatch: pytest.MonkeyPatch) -> None:
+    from funcpipe_rag.boundaries.adapters import category_index
+
+    docs = [RawDoc(str(i), "", "", f"cs.{i % 3000}" if i % 10 else "math.NT") for i in range(30_000)]
+    index = CategoryIndex.from_docs(docs)
+    calls = []
+    real = category_index._rows_to_bitmap
+    monkeypatch.setattr(category_index, "_rows_to_bitmap", lambda rows, n: calls.append(n) or real(rows, n))
+
+    pred = StartsWith("categories", "cs.")
+    assert index.matching_doc_ids(pred) == [d.doc_id for d in docs if eval_pred(d, pred)]
+    assert calls == []  # 3000 sparse values, one shared buffer
+    assert index.matching_doc_ids(AnyOf((pred, Eq("categories", "math.NT")))) == [d.doc_id for d in docs]
+    assert len(calls) == 1  # the dense "math.NT" value only
@@ -0,0 +1,118 @@
+"""Incremental re-ingest: manifest diffing, delta outputs, tombstones."""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+
+from funcpipe_rag.boundaries.adapters.manifest import (
+    Manifest,
+    ManifestStats,
+    load_manifest,
+    plan_ingest,
+    rag_config_fingerprint,
+    save_manifest,
+)
+from funcpipe_rag.boundaries.shells.cli import main
+from funcpipe_rag.boundaries.shells.rag_api_shell import run, tombstones_path
+from funcpipe_rag.core.rag_types import RagEnv, RawDoc
+from funcpipe_rag.rag.batch_embed import embed_chunks_batch
+from funcpipe_rag.rag.config import RagConfig, get_deps
+from funcpipe_rag.result import Ok
+
+
+def _write_csv(path: Path, docs: list[RawDoc]) -> None:
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=["doc_id", "title", "abstract", "categories"])
+        w.writeheader()
+        for d in docs:
+            w.writerow(vars(d))
+
+
+def _read_jsonl(path: Path) -> list[dict[str, object]]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _docs(*abstracts: str) -> list[RawDoc]:
+    return [RawDoc(f"d{i}", "t", a, "cs.AI") for i, a in enumerate(abstracts)]
+
+
+def test_plan_partitions_changed_unchanged_removed() -> None:
+    fp = rag_config_fingerprint(RagConfig(env=RagEnv(chunk_size=16)))
+    first = plan_ingest(_docs("a", "b", "c"), Manifest(), fp)
+    assert first.stats == ManifestStats(new=3, changed=0, unchanged=0, removed=0)
+    assert [d.doc_id for d in first.new] == ["d0", "d1", "d2"] and first.changed == ()
+
+    second = plan_ingest(_docs("a", "B")[:2], first.manifest, fp)
+    assert [d.doc_id for d in second.changed] == ["d1"] and second.new == ()
+    assert second.removed == ("d2",)
+    assert second.stats == ManifestStats(new=0, changed=1, unchanged=1, removed=1)
+
+    third = plan_ingest(_docs("a", "b", "c", "d"), second.manifest, fp)
+    assert [d.doc_id for d in third.to_process] == ["d1", "d2", "d3"]
+    assert [d.doc_id for d in third.new] == ["d2", "d3"] and [d.doc_id for d in third.changed] == ["d1"]
+
+    other_fp = rag_config_fingerprint(RagConfig(env=RagEnv(chunk_size=32)))
+    assert plan_ingest(_docs("a", "b", "c"), first.manifest, other_fp).stats.changed == 3
+
+
+def test_fingerprint_tracks_the_configured_embedder() -> None:
+    config = RagConfig(env=RagEnv(chunk_size=16))
+    plain = rag_config_fingerprint(config)
+    assert rag_config_fingerprint(config, get_deps(config)) == plain
+    assert rag_config_fingerprint(config, get_deps(config, embed_cache=True)) == plain  # caching is transparent
+    batched = rag_config_fingerprint(config, get_deps(config, batch_embedder=embed_chunks_batch))
+    assert batched != plain
+    assert rag_config_fingerprint(config, get_deps(config, batch_embedder=embed_chunks_batch, embed_cache=True)) == batched
+
+
+def test_manifest_roundtrip_and_missing_file(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    assert load_manifest(str(path)) == Ok(Manifest())
+    m = Manifest({"d0": "h0"})
+    assert save_manifest(str(path), m) == Ok(None)
+    assert load_manifest(str(path)) == Ok(m)
+
+
+def test_shell_run_writes_only_deltas(tmp_path: Path) -> None:
+    csv_path, out, manifest = tmp_path / "in.csv", tmp_path / "out.jsonl", tmp_path / "m.json"
+    config = RagConfig(env=RagEnv(chunk_size=8))
+
+    _write_csv(csv_path, _docs("alpha beta gamma", "delta epsilon", "zeta"))
+    res = run(str(csv_path), str(out), config=config, manifest_path=str(manifest))
+    assert isinstance(res, Ok)
+    assert res.value.extra[-1] == ("manifest", ManifestStats(new=3, changed=0, unchanged=0, removed=0))
+    assert {r["doc_id"] for r in _read_jsonl(out)} == {"d0", "d1", "d2"}
+    tombstones = Path(tombstones_path(str(manifest)))  # the same file the CLI uses
+    assert _read_jsonl(tombstones) == []  # first run: nothing to retract
+
+    _write_csv(csv_path, _docs("alpha beta gamma", "delta EPSILON changed"))
+    res = run(str(csv_path), str(out), config=config, manifest_path=str(manifest))
+    assert isinstance(res, Ok)
+    assert res.value.extra[-1] == ("manifest", ManifestStats(new=0, changed=1, unchanged=1, removed=1))
+    assert {r["doc_id"] for r in _read_jsonl(out)} == {"d1"}
+    assert _read_jsonl(tombstones) == [
+        {"doc_id": "d1", "reason": "changed"},
+        {"doc_id": "d2", "reason": "removed"},
+    ]
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(["in.csv", "out.jsonl", "m.json", tombstones.name])
+
+
+def test_cli_manifest_skips_unchanged_docs(tmp_path: Path) -> None:
+    csv_path, cfg_path, manifest = tmp_path / "in.csv", tmp_path / "cfg.json", tmp_path / "m.json"
+    cfg_path.write_text(json.dumps({"steps": [{"name": "clean"}, {"name": "chunk"}, {"name": "embed"}]}))
+    _write_csv(csv_path, _docs("one", "two"))
+    argv = [str(csv_path), "--config", str(cfg_path), "--manifest", str(manifest)]
+    assert main(argv) == 0
+    saved = load_manifest(str(manifest))
+    assert isinstance(saved, Ok) and set(saved.value.entries) == {"d0", "d1"}
+    tombstones = Path(tombstones_path(str(manifest)))
+    assert _read_jsonl(tombstones) == []
+
+    assert main(argv) == 0
+    assert load_manifest(str(manifest)) == saved
+
+    _write_csv(csv_path, _docs("one"))
+    assert main(argv) == 0
+    assert _read_jsonl(tombstones) == [{"doc_id": "d1", "reason": "removed"}]
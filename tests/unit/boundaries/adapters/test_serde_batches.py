@@ -0,0 +1,109 @@
+"""Batch-framed msgpack streams: one header, per-batch migration, float32 embeddings."""
+
+from __future__ import annotations
+
+import io
+
+import msgpack  # type: ignore[import-untyped]
+import numpy as np
+import pytest
+
+from funcpipe_rag.boundaries.adapters.serde import (
+    BATCH_STREAM_MAGIC,
+    MIGRATORS,
+    Envelope,
+    dec_chunk,
+    dec_chunk_columns,
+    dec_result,
+    enc_chunk,
+    enc_result,
+    iter_msgpack_batches,
+    iter_msgpack_columns,
+    to_msgpack,
+    write_msgpack_batches,
+)
+from funcpipe_rag.core.rag_types import Chunk
+from funcpipe_rag.fp.core import Ok
+
+
+def _chunks(n: int) -> list[Chunk]:
+    return [
+        Chunk(
+            doc_id=f"d{i % 3}",
+            text=f"text {i} ✓",
+            start=i,
+            end=i + 4,
+            metadata={"i": i} if i % 4 == 0 else {},
+            embedding=tuple(float(np.float32(i + k / 8)) for k in range(16)),
+        )
+        for i in range(n)
+    ]
+
+
+def test_chunk_stream_round_trips_in_batches() -> None:
+    chunks = _chunks(10)
+    buf = io.BytesIO()
+    assert write_msgpack_batches(buf, chunks, enc_chunk(), batch_size=4) == 10
+    data = buf.getvalue()
+    assert data.startswith(BATCH_STREAM_MAGIC) and data.count(b"chunk") == 1  # tag stored once
+
+    batches = list(iter_msgpack_batches(io.BytesIO(data), dec_chunk()))
+    assert [len(b) for b in batches] == [4, 4, 2]
+    assert [c for b in batches for c in b] == chunks
+    assert [c.embedding for b in batches for c in b] == [c.embedding for c in chunks]
+
+    per_record = sum(len(to_msgpack(c, enc_chunk())) for c in chunks)
+    assert len(data) < per_record * 0.7
+
+
+def test_columns_decode_into_chunk_batch() -> None:
+    chunks = _chunks(9)
+    buf = io.BytesIO()
+    write_msgpack_batches(buf, chunks, enc_chunk(), batch_size=5)
+    envs = list(iter_msgpack_columns(io.BytesIO(buf.getvalue())))
+    assert isinstance(envs[0].payload["embedding"], bytes) and envs[0].payload["start"] == [0, 1, 2, 3, 4]
+    batches = [dec_chunk_columns()(env) for env in envs]
+    assert [c for b in batches for c in b.iter_chunks()] == chunks
+    np.testing.assert_array_equal(batches[1].embeddings, np.array([c.embedding for c in chunks[5:]], np.float32))
+
+
+def test_migration_resolves_once_per_batch() -> None:
+    calls: list[int] = []
+
+    def v0_to_v1(env: Envelope) -> Envelope:
+        calls.append(1)
+        return Envelope("chunk", 1, {**env.payload, "metadata": env.payload.get("metadata", {})})
+
+    def enc_v0(c: Chunk) -> Envelope:
+        env = enc_chunk()(c)
+        payload = dict(env.payload)
+        del payload["metadata"]
+        return Envelope("chunk", 0, payload)
+
+    chunks = [Chunk(c.doc_id, c.text, c.start, c.end, embedding=c.embedding) for c in _chunks(6)]
+    buf = io.BytesIO()
+    write_msgpack_batches(buf, chunks, enc_v0, batch_size=4)
+    old = dict(MIGRATORS)
+    try:
+        MIGRATORS[("chunk", 0)] = v0_to_v1
+        assert [c for b in iter_msgpack_batches(io.BytesIO(buf.getvalue()), dec_chunk()) for c in b] == chunks
+        assert len(calls) == 6
+        envs = list(iter_msgpack_columns(io.BytesIO(buf.getvalue())))
+        assert [e.ver for e in envs] == [1, 1] and isinstance(envs[0].payload["embedding"], bytes)
+    finally:
+        MIGRATORS.clear()
+        MIGRATORS.update(old)
+
+
+def test_generic_records_and_malformed_streams() -> None:
+    buf = io.BytesIO()
+    write_msgpack_batches(buf, [Ok(1), Ok(2)], enc_result())
+    assert list(iter_msgpack_batches(io.BytesIO(buf.getvalue()), dec_result())) == [[Ok(1), Ok(2)]]
+    assert list(iter_msgpack_batches(io.BytesIO(b""), dec_result())) == []
+
+    with pytest.raises(ValueError):
+        write_msgpack_batches(io.BytesIO(), [Ok(1), 2], lambda x: enc_result()(x) if isinstance(x, Ok) else Envelope("x", 1, {}))
+    with pytest.raises(ValueError):
+        list(iter_msgpack_batches(io.BytesIO(buf.getvalue()[:-3]), dec_result()))
+    with pytest.raises(ValueError):
+        list(iter_msgpack_batches(io.BytesIO(msgpack.packb({"tag": "result"})), dec_result()))
@@ -0,0 +1,87 @@
+"""ChunkBatch: lossless columnar round trips and batch-native dedup/write/serde."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+
+import hypothesis.strategies as st
+import numpy as np
+from hypothesis import given
+
+from funcpipe_rag import structural_dedup_chunks, structural_dedup_lazy
+from funcpipe_rag.boundaries.adapters.serde import (
+    dec_chunk_batch,
+    enc_chunk_batch,
+    from_json,
+    to_json,
+)
+from funcpipe_rag.core.chunk_batch import (
+    ChunkBatch,
+    gen_deduped_batches,
+    iter_chunk_batches,
+    structural_dedup_batch,
+)
+from funcpipe_rag.core.rag_types import Chunk, ChunkWithoutEmbedding
+from funcpipe_rag.infra.adapters.file_storage import FileStorage
+from funcpipe_rag.result.types import Ok
+from tests.strategies import pipeline_chunk_strategy
+
+# ChunkBatch offsets are int64 columns.
+chunk_strategy = pipeline_chunk_strategy().filter(lambda c: c.end < 2**63)
+
+
+@given(chunks=st.lists(chunk_strategy, max_size=30))
+def test_chunk_batch_roundtrip_is_lossless_with_float64(chunks: list[Chunk]) -> None:
+    batch = ChunkBatch.from_chunks(chunks, dtype=np.float64)
+    assert len(batch) == len(chunks)
+    assert batch.to_chunks() == chunks
+
+
+@given(chunks=st.lists(chunk_strategy, max_size=30))
+def test_chunk_batch_float32_roundtrip_is_a_fixed_point(chunks: list[Chunk]) -> None:
+    once = ChunkBatch.from_chunks(chunks).to_chunks()
+    assert ChunkBatch.from_chunks(once).to_chunks() == once
+
+
+def test_chunk_batch_keeps_metadata_and_unembedded_rows() -> None:
+    rows = [
+        ChunkWithoutEmbedding("a", "héllo", 0, 5, metadata={"k": 1}),
+        ChunkWithoutEmbedding("b", "world", 5, 10),
+    ]
+    batch = ChunkBatch.from_chunks(rows)
+    assert batch.embeddings is None
+    assert batch.doc_ids == ("a", "b")
+    assert bytes(batch.text_bytes(0)) == "héllo".encode()
+    out = batch.to_chunks()
+    assert out == rows
+    assert dict(out[0].metadata) == {"k": 1}
+
+
+@given(chunks=st.lists(chunk_strategy, max_size=30), size=st.integers(min_value=1, max_value=8))
+def test_batch_dedup_matches_chunk_dedup(chunks: list[Chunk], size: int) -> None:
+    batches = list(iter_chunk_batches(chunks, size))
+    whole = ChunkBatch.concat(batches)
+    assert structural_dedup_batch(ChunkBatch.from_chunks(chunks, dtype=np.float64)).to_chunks() == (
+        structural_dedup_chunks(chunks)
+    )
+    lazy = [c for b in gen_deduped_batches(batches) for c in b.iter_chunks()]
+    assert lazy == list(structural_dedup_lazy(whole.to_chunks()))
+
+
+@given(chunks=st.lists(chunk_strategy, max_size=10))
+def test_batch_serde_and_write(chunks: list[Chunk]) -> None:
+    batch = ChunkBatch.from_chunks(chunks)
+    decoded = from_json(to_json(batch, enc_chunk_batch()), dec_chunk_batch())
+    assert decoded.to_chunks() == batch.to_chunks()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "out.jsonl")
+        assert FileStorage().write_chunk_batches(path, iter_chunk_batches(chunks, 4)) == Ok(None)
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+    assert [(r["doc_id"], r["text"], r["start"], r["end"]) for r in records] == [
+        (c.doc_id, c.text, c.start, c.end) for c in batch.iter_chunks()
+    ]
+    assert [r["embedding"] for r in records] == [list(c.embedding) for c in batch.to_chunks()]
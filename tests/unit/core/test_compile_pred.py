@@ -0,0 +1,83 @@
+"""compile_pred: one closure per predicate tree, equivalent to eval_pred."""
+
+from __future__ import annotations
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from funcpipe_rag import (
+    All,
+    AnyOf,
+    Eq,
+    LenGt,
+    Not,
+    Pred,
+    RawDoc,
+    StartsWith,
+    compile_pred,
+    eval_pred,
+)
+
+_paths = st.sampled_from(["doc_id", "title", "abstract", "categories"])
+_small = st.text(alphabet="abc", max_size=3)
+_leaf = st.one_of(
+    st.builds(Eq, _paths, _small),
+    st.builds(StartsWith, _paths, _small),
+    st.builds(LenGt, _paths, st.integers(min_value=-1, max_value=4)),
+)
+_pred: st.SearchStrategy[Pred] = st.recursive(
+    _leaf,
+    lambda inner: st.one_of(
+        st.builds(All, st.lists(inner, max_size=4).map(tuple)),
+        st.builds(AnyOf, st.lists(inner, max_size=4).map(tuple)),
+        st.builds(Not, inner),
+    ),
+    max_leaves=12,
+)
+_doc = st.builds(RawDoc, doc_id=_small, title=_small, abstract=_small, categories=_small)
+
+
+_nullable_doc = st.builds(
+    RawDoc, doc_id=_small, title=_small | st.none(), abstract=_small | st.none(), categories=_small | st.none()
+)
+
+
+@given(pred=_pred, docs=st.lists(_doc, max_size=8))
+def test_compiled_matches_interpreter(pred: Pred, docs: list[RawDoc]) -> None:
+    keep = compile_pred(pred)
+    assert [keep(d) for d in docs] == [eval_pred(d, pred) for d in docs]
+
+
+def test_compile_validates_eagerly() -> None:
+    with pytest.raises(ValueError, match="Unknown path"):
+        compile_pred(AnyOf((Eq("title", "x"), Eq("nope", "y"))))
+    with pytest.raises(ValueError, match="Unknown predicate"):
+        compile_pred(All((object(),)))  # type: ignore[arg-type]
+
+
+def test_non_str_fields_raise_eval_preds_value_error() -> None:
+    doc = RawDoc("1", "t", None, None)  # type: ignore[arg-type]  # DictReader pads short rows with None
+    for pred in (StartsWith("categories", "cs"), StartsWith("categories", ""), LenGt("abstract", -1)):
+        with pytest.raises(ValueError) as interpreted:
+            eval_pred(doc, pred)
+        with pytest.raises(ValueError) as compiled:
+            compile_pred(pred)(doc)
+        assert str(compiled.value) == str(interpreted.value)
+
+
+@given(pred=_pred, docs=st.lists(_nullable_doc, max_size=8))
+def test_compiled_never_raises_where_interpreter_returns(pred: Pred, docs: list[RawDoc]) -> None:
+    fn = compile_pred(pred)
+    for d in docs:
+        try:
+            got = fn(d)
+        except ValueError as exc:
+            with pytest.raises(ValueError, match="path must be"):
+                eval_pred(d, pred)
+            assert "path must be" in str(exc)
+            continue
+        try:
+            assert got == eval_pred(d, pred)
+        except ValueError:
+            pass  # a folded/skipped leaf would have raised
@@ -0,0 +1,143 @@
+"""AdaptivePred: sampled cost/selectivity reordering with unchanged results."""
+
+from __future__ import annotations
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from funcpipe_rag import (
+    AdaptivePred,
+    All,
+    AnyOf,
+    Eq,
+    LenGt,
+    Not,
+    RagConfig,
+    RagEnv,
+    RawDoc,
+    RulesConfig,
+    StartsWith,
+    compile_rules,
+    eval_pred,
+    full_rag_api_docs,
+    get_deps,
+    iter_rag_core,
+)
+
+_small = st.text(alphabet="ab", max_size=3)
+_doc = st.builds(RawDoc, doc_id=_small, title=_small, abstract=_small, categories=_small)
+_leaf = st.one_of(
+    st.builds(Eq, st.sampled_from(["title", "categories"]), _small),
+    st.builds(StartsWith, st.just("abstract"), _small),
+    st.builds(LenGt, st.just("abstract"), st.integers(0, 3)),
+)
+_pred = st.recursive(
+    _leaf,
+    lambda inner: st.one_of(
+        st.builds(All, st.lists(inner, max_size=4).map(tuple)),
+        st.builds(AnyOf, st.lists(inner, max_size=4).map(tuple)),
+        st.builds(Not, inner),
+    ),
+    max_leaves=10,
+)
+
+
+@given(pred=st.builds(All, st.lists(_pred, max_size=4).map(tuple)), docs=st.lists(_doc, max_size=20), sample=st.integers(1, 5))
+def test_results_match_eval_pred_before_and_after_freeze(pred: All, docs: list[RawDoc], sample: int) -> None:
+    keep = AdaptivePred(pred, sample=sample)
+    assert [keep(d) for d in docs] == [eval_pred(d, pred) for d in docs]
+
+
+def _outcome(fn, doc: RawDoc) -> object:  # type: ignore[no-untyped-def]
+    try:
+        return fn(doc)
+    except ValueError:
+        return ValueError
+
+
+@given(
+    pred=st.builds(All, st.lists(_pred, max_size=4).map(tuple)),
+    docs=st.lists(st.builds(RawDoc, doc_id=_small, title=_small, abstract=st.none() | _small, categories=_small), max_size=20),
+    sample=st.integers(1, 5),
+)
+def test_none_fields_never_raise_where_eval_pred_returns(pred: All, docs: list[RawDoc], sample: int) -> None:
+    keep = AdaptivePred(pred, sample=sample)
+    for d in docs:
+        expected = _outcome(lambda x: eval_pred(x, pred), d)
+        got = _outcome(keep, d)
+        assert got == expected or expected is ValueError
+
+
+class _FakeTimer:
+    """Constant-step clock: every child costs the same, so selectivity decides."""
+
+    def __init__(self) -> None:
+        self.now = 0
+
+    def __call__(self) -> int:
+        self.now += 1
+        return self.now
+
+
+def test_freezes_selective_cheap_child_first() -> None:
+    timer = _FakeTimer()
+    pred = All((LenGt("abstract", 0), Eq("categories", "cs.AI")))
+    keep = AdaptivePred(pred, sample=4, timer=timer)
+    docs = [RawDoc(str(i), "", "x" * 10, "cs.AI" if i == 0 else "math") for i in range(6)]
+    assert [keep(d) for d in docs] == [True] + [False] * 5
+    assert keep.frozen and keep.order == (1, 0)
+    assert [(s.calls, s.passes) for s in keep.stats] == [(4, 4), (4, 1)]
+
+    any_keep = AdaptivePred(AnyOf((Eq("title", "zz"), StartsWith("categories", "cs"))), sample=2, timer=timer)
+    for d in docs:
+        any_keep(d)
+    assert any_keep.order == (1, 0)
+
+
+def test_compile_rules_and_pipeline_parity() -> None:
+    pred = All((LenGt("abstract", 3), AnyOf((StartsWith("categories", "cs."), Eq("title", "keep")))))
+    assert not isinstance(compile_rules(RulesConfig(pred)), AdaptivePred)
+    adaptive = compile_rules(RulesConfig(pred, adaptive_sample=2))
+    assert isinstance(adaptive, AdaptivePred) and isinstance(adaptive.subnodes[1], AdaptivePred)
+
+    docs = [RawDoc(str(i), "keep" if i % 3 else "", "word " * i, "cs.AI" if i % 2 else "math") for i in range(12)]
+    static = RagConfig(env=RagEnv(chunk_size=8), keep=RulesConfig(pred))
+    adapt = RagConfig(env=RagEnv(chunk_size=8), keep=RulesConfig(pred, adaptive_sample=3))
+    assert full_rag_api_docs(docs, adapt, get_deps(adapt))[0] == full_rag_api_docs(docs, static, get_deps(static))[0]
+    with pytest.raises(ValueError):
+        RulesConfig(adaptive_sample=-1)
+    with pytest.raises(ValueError):
+        AdaptivePred(Not(Eq("title", "")))  # type: ignore[arg-type]
+
+
+def test_raising_child_gives_eval_pred_answer_while_sampling_and_frozen() -> None:
+    pred = All((Eq("doc_id", "zzz"), StartsWith("categories", "cs.")))
+    none_doc = RawDoc("a", "t", "x", None)  # type: ignore[arg-type]
+    keep = AdaptivePred(pred, sample=2, timer=_FakeTimer())
+    assert keep(none_doc) is False  # sampling: every child runs, StartsWith raises
+    assert keep(RawDoc("zzz", "t", "x", "math")) is False
+    assert keep.frozen and keep.order == (1, 0)  # StartsWith never passed, so it now runs first
+    assert keep(none_doc) is False and eval_pred(none_doc, pred) is False
+
+    flipped = AdaptivePred(All((StartsWith("categories", "cs."), Eq("doc_id", "zzz"))), sample=2, timer=_FakeTimer())
+    for d in [RawDoc(str(i), "t", "x", "cs.AI") for i in range(2)]:
+        flipped(d)
+    assert flipped.frozen and flipped.order == (1, 0)
+    with pytest.raises(ValueError):
+        flipped(RawDoc("zzz", "t", "x", None))  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        eval_pred(RawDoc("zzz", "t", "x", None), flipped.pred)  # type: ignore[arg-type]
+
+
+def test_shared_keep_adapts_across_iter_rag_core_calls() -> None:
+    pred = All((LenGt("abstract", 0), Eq("categories", "cs.AI")))
+    config = RagConfig(env=RagEnv(chunk_size=8), keep=RulesConfig(pred, adaptive_sample=4))
+    keep = compile_rules(config.keep)
+    assert isinstance(keep, AdaptivePred)
+    docs = [RawDoc(str(i), "t", "some words", "cs.AI" if i == 0 else "math") for i in range(3)]
+    for _ in range(2):
+        assert list(iter_rag_core(docs, config, get_deps(config), keep=keep)) == list(
+            iter_rag_core(docs, config, get_deps(config))
+        )
+    assert keep.frozen and keep.stats[0].calls == 4
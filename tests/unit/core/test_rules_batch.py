@@ -0,0 +1,73 @@
+"""eval_pred_batch: columnar masks agree with per-doc eval_pred."""
+
+from __future__ import annotations
+
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from hypothesis import given
+
+from funcpipe_rag import All, AnyOf, Eq, LenGt, Not, Pred, RawDoc, StartsWith, eval_pred
+from funcpipe_rag.core.rules_batch import doc_columns, eval_pred_batch
+
+_paths = st.sampled_from(["doc_id", "title", "abstract", "categories"])
+_small = st.text(alphabet="abé", max_size=3)
+_leaf = st.one_of(
+    st.builds(Eq, _paths, _small | st.integers(0, 2)),
+    st.builds(StartsWith, _paths, _small),
+    st.builds(LenGt, _paths, st.integers(min_value=-1, max_value=4)),
+)
+_pred: st.SearchStrategy[Pred] = st.recursive(
+    _leaf,
+    lambda inner: st.one_of(
+        st.builds(All, st.lists(inner, max_size=4).map(tuple)),
+        st.builds(AnyOf, st.lists(inner, max_size=4).map(tuple)),
+        st.builds(Not, inner),
+    ),
+    max_leaves=12,
+)
+_doc = st.builds(RawDoc, doc_id=_small, title=_small, abstract=_small, categories=_small)
+
+
+@given(pred=_pred, docs=st.lists(_doc, max_size=10))
+def test_batch_mask_matches_eval_pred(pred: Pred, docs: list[RawDoc]) -> None:
+    mask = eval_pred_batch(pred, doc_columns(docs))
+    assert mask.dtype == np.bool_ and mask.shape == (len(docs),)
+    assert mask.tolist() == [eval_pred(d, pred) for d in docs]
+
+
+def test_object_columns_and_validation() -> None:
+    cols = {"categories": np.array(["cs.AI", "math.NT", "cs.LG"], dtype=object), "abstract": ["x" * 9, "", "yy"]}
+    pred = All((StartsWith("categories", "cs."), LenGt("abstract", 3)))
+    assert eval_pred_batch(pred, cols).tolist() == [True, False, False]
+    with pytest.raises(ValueError, match="Missing column"):
+        eval_pred_batch(Eq("title", "t"), cols)
+    with pytest.raises(ValueError, match="Unknown path"):
+        eval_pred_batch(Eq("nope", "t"), cols)
+    with pytest.raises(ValueError, match="equal length"):
+        eval_pred_batch(All(()), {"title": ["a"], "abstract": []})
+
+
+def _outcome(doc: RawDoc, pred: Pred) -> bool | None:
+    try:
+        return eval_pred(doc, pred)
+    except ValueError:
+        return None
+
+
+@given(
+    pred=_pred,
+    docs=st.lists(st.builds(RawDoc, doc_id=_small, title=_small, abstract=_small, categories=st.none() | _small), max_size=10),
+)
+def test_none_cells_match_eval_pred_wherever_it_returns(pred: Pred, docs: list[RawDoc]) -> None:
+    mask = eval_pred_batch(pred, doc_columns(docs)).tolist()
+    assert all(e is None or m == e for m, e in zip(mask, (_outcome(d, pred) for d in docs)))
+
+
+def test_none_cell_is_not_the_string_none() -> None:
+    cols = {"categories": ["None", None, "Nx"]}
+    assert eval_pred_batch(Eq("categories", "None"), cols).tolist() == [True, False, False]
+    assert eval_pred_batch(Eq("categories", None), cols).tolist() == [False, True, False]
+    assert eval_pred_batch(StartsWith("categories", "N"), cols).tolist() == [True, False, True]
+    assert eval_pred_batch(LenGt("categories", 1), cols).tolist() == [True, False, True]
+    assert doc_columns([RawDoc("1", "t", "a", None)])["categories"].tolist() == [None]  # type: ignore[arg-type]
@@ -0,0 +1,77 @@
+"""parse_rule compiles once: same results and sandbox, a flat hand-lambda-shaped closure."""
+
+from __future__ import annotations
+
+import pytest
+
+from funcpipe_rag import RawDoc, parse_rule
+
+_DOCS = [
+    RawDoc("1", "Graph Kernels", "a" * 600, "cs.LG"),
+    RawDoc("2", "", "short", "math.NT"),
+    RawDoc("3", "QUANTUM", "b" * 10, "quant-ph"),
+]
+
+_CASES = [
+    ('d.categories.startswith("cs.") and len(d.abstract) > 500', lambda d: d.categories.startswith("cs.") and len(d.abstract) > 500),
+    ('not d.title or "quantum" in d.title.lower()', lambda d: not d.title or "quantum" in d.title.lower()),
+    ("d.title.startswith(d.categories.lower()) or d.abstract", lambda d: bool(d.title.startswith(d.categories.lower()) or d.abstract)),
+    ('(d.title and d.abstract) == True', lambda d: bool(d.title) and bool(d.abstract)),
+    ("len(d.abstract) >= 10 and d.categories != 'math.NT'", lambda d: len(d.abstract) >= 10 and d.categories != "math.NT"),
+]
+
+
+@pytest.mark.parametrize(("expr", "expected"), _CASES)
+def test_compiled_rule_matches_python(expr: str, expected) -> None:  # type: ignore[no-untyped-def]
+    rule = parse_rule(expr)
+    assert [rule(d) for d in _DOCS] == [expected(d) for d in _DOCS]
+    assert all(type(rule(d)) is bool for d in _DOCS)
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "__import__('os')",
+        "d.__class__",
+        "d.title.title",
+        "d",
+        "1 < len(d.title) < 5",
+        "d.title.lower(1)",
+        "d.title.startswith()",
+        "len(d.title, d.abstract)",
+    ],
+)
+def test_rejected_at_parse_time(expr: str) -> None:
+    with pytest.raises(ValueError):
+        parse_rule(expr)
+
+
+def test_runtime_type_checks_are_kept() -> None:
+    with pytest.raises(ValueError, match="startswith"):
+        parse_rule("d.title.startswith(3)")(_DOCS[0])
+
+
+@pytest.mark.parametrize(
+    ("expr", "match"),
+    [('d.categories.startswith("cs.")', "startswith"), ('d.categories.lower() == "cs"', "lower")],
+)
+def test_none_field_raises_value_error(expr: str, match: str) -> None:
+    short_row = RawDoc("4", "t", "a", None)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match=match):
+        parse_rule(expr)(short_row)
+
+
+def test_rule_compiles_to_a_flat_lambda_over_doc_fields() -> None:
+    # Structural stand-in for "costs the same as a hand-written lambda": the
+    # rule is one code object that touches only doc fields and the sandbox
+    # helpers, with no interpreter or AST walk left on the per-doc path.
+    expr = 'd.categories.startswith("cs.") and len(d.abstract) > 500 and not "x" in d.title.lower()'
+    rule = parse_rule(expr)
+    code = rule.__code__
+    assert code.co_filename == "<rule>" and code.co_varnames == ("d",)
+    assert rule.__closure__ is None
+    assert not any(isinstance(c, type(code)) for c in code.co_consts)
+    helpers = {"len", "bool", "_lower", "_startswith"}
+    assert set(code.co_names) <= {"doc_id", "title", "abstract", "categories", "lower", "startswith"} | helpers
+    assert set(rule.__globals__) <= helpers | {"__builtins__"}
+    assert rule.__globals__["__builtins__"] == {}
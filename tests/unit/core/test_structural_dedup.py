@@ -0,0 +1,73 @@
+"""Fingerprint-keyed structural dedup: compact sets, Bloom filters, LRU windows."""
+
+from __future__ import annotations
+
+import hypothesis.strategies as st
+from hypothesis import given
+
+from funcpipe_rag import (
+    BloomFilter,
+    Chunk,
+    FingerprintSet,
+    LRUWindow,
+    structural_dedup_compact,
+    structural_dedup_lazy,
+)
+
+_VEC = (0.5,) * 16
+
+_chunks = st.lists(
+    st.builds(
+        Chunk,
+        doc_id=st.sampled_from(["a", "b", "ab"]),
+        text=st.sampled_from(["", "x", "y", "xy", "é"]),
+        start=st.integers(min_value=0, max_value=3),
+        end=st.integers(min_value=3, max_value=5),
+        embedding=st.just(_VEC),
+    ),
+    max_size=80,
+)
+
+
+@given(chunks=_chunks)
+def test_compact_dedup_matches_exact_dedup(chunks: list[Chunk]) -> None:
+    assert list(structural_dedup_compact(chunks)) == list(structural_dedup_lazy(chunks))
+
+
+@given(keys=st.lists(st.integers(min_value=0, max_value=2**128 - 1), max_size=300))
+def test_fingerprint_set_behaves_like_a_set(keys: list[int]) -> None:
+    fs = FingerprintSet(capacity=4)
+    ref: set[int] = set()
+    for k in keys:
+        assert (k in fs) == (k in ref or (k == 0 and 1 in ref) or (k == 1 and 0 in ref))
+        fs.add(k)
+        ref.add(k)
+    assert all(k in fs for k in keys)
+    assert len(fs) == len({k or 1 for k in keys})
+    assert fs.nbytes <= 16 * 2 * max(8, len(fs)) * 4 // 3 + 16
+
+
+def test_fingerprint_set_bytes_per_key_matches_documented_bound() -> None:
+    fs = FingerprintSet(capacity=8)
+    for k in range(1, 20_001):
+        fs.add(k * 0x9E3779B97F4A7C15)
+        if k >= 64:
+            assert 21 <= fs.nbytes / len(fs) <= 43
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives() -> None:
+    bloom = BloomFilter(capacity=2000, fp_rate=0.01)
+    inserted = [(i * 0x9E3779B97F4A7C15_9E3779B97F4A7C15) % 2**128 for i in range(2000)]
+    for k in inserted:
+        bloom.add(k)
+    assert all(k in bloom for k in inserted)
+    probes = [(i * 0xD1B54A32D192ED03_94D049BB133111EB + 7) % 2**128 for i in range(1, 20001)]
+    false_positives = sum(k in bloom for k in probes if k not in set(inserted))
+    assert false_positives / len(probes) < 0.03
+    assert abs(bloom.false_positive_rate() - 0.01) < 0.005
+
+
+def test_lru_window_forgets_old_keys() -> None:
+    chunks = [Chunk(doc_id="d", text=t, start=0, end=1, embedding=_VEC) for t in "abcab"]
+    assert [c.text for c in structural_dedup_lazy(chunks, seen=LRUWindow(maxsize=2))] == list("abcab")
+    assert [c.text for c in structural_dedup_lazy(chunks, seen=LRUWindow(maxsize=3))] == list("abc")
@@ -0,0 +1,65 @@
+"""TextArena: contiguous buffer, byte-level cleaning, zero-copy span chunks."""
+
+from __future__ import annotations
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from funcpipe_rag import (
+    CleanConfig,
+    RagEnv,
+    RawDoc,
+    TextArena,
+    clean_arena,
+    embed_chunk,
+    embed_span_chunk,
+    iter_arena_span_chunks,
+    iter_chunk_doc,
+    iter_text_arenas,
+    make_cleaner,
+)
+from funcpipe_rag.policies.memo import content_hash_key
+from funcpipe_rag.rag.clean_cfg import RULES
+
+_text = st.text(alphabet=st.sampled_from(list(" \t\n\x0b\x1c\x1fAbC.é")), max_size=60) | st.text(max_size=30)
+_docs = st.lists(st.builds(RawDoc, doc_id=st.text(min_size=1, max_size=5), title=st.text(max_size=5), abstract=_text, categories=st.just("cs")), max_size=10)
+_rules = st.lists(st.sampled_from(sorted(RULES)), max_size=5).map(tuple)
+
+
+@given(docs=_docs)
+def test_arena_roundtrips_abstracts(docs: list[RawDoc]) -> None:
+    arena = TextArena.from_docs(docs)
+    assert len(arena) == len(docs)
+    assert [arena.abstract(i) for i in range(len(docs))] == [d.abstract for d in docs]
+    assert bytes(arena.abstract_bytes(0) if docs else b"") == (docs[0].abstract.encode() if docs else b"")
+
+
+@given(docs=_docs, rule_names=_rules)
+def test_clean_arena_matches_make_cleaner(docs: list[RawDoc], rule_names: tuple[str, ...]) -> None:
+    cfg = CleanConfig(rule_names)
+    cleaner = make_cleaner(cfg)
+    assert list(clean_arena(TextArena.from_docs(docs), cfg).iter_clean_docs()) == [cleaner(d) for d in docs]
+
+
+@given(docs=_docs, chunk_size=st.integers(min_value=1, max_value=9), tail_policy=st.sampled_from(["emit_short", "drop", "pad"]))
+def test_arena_span_chunks_match_copying_chunker(docs: list[RawDoc], chunk_size: int, tail_policy: str) -> None:
+    env = RagEnv(chunk_size=chunk_size, overlap=chunk_size // 2, tail_policy=tail_policy)
+    arena = clean_arena(TextArena.from_docs(docs), CleanConfig())
+    spans = list(iter_arena_span_chunks(arena, env))
+    copies = [c for d in arena.iter_clean_docs() for c in iter_chunk_doc(d, env)]
+    assert [s.to_chunk() for s in spans] == copies
+    assert [embed_span_chunk(s) for s in spans] == [embed_chunk(c) for c in copies]
+    assert [content_hash_key(s, normalize=False) for s in spans] == [
+        content_hash_key(c, normalize=False) for c in copies
+    ]
+
+
+def test_ascii_span_bytes_view_the_arena_buffer() -> None:
+    arena = TextArena.from_docs([RawDoc("a", "", "hello world", ""), RawDoc("b", "", "héllo", "")])
+    first = next(iter_arena_span_chunks(arena, RagEnv(chunk_size=4)))
+    view = first.text_bytes()
+    assert isinstance(view, memoryview) and view.obj is arena.buffer
+    assert [len(b) for b in iter_text_arenas(iter([RawDoc("x", "", "", "")] * 5), 2)] == [2, 2, 1]
+    with pytest.raises(ValueError):
+        next(iter_text_arenas([], 0))
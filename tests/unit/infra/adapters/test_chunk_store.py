@@ -0,0 +1,90 @@
+"""Memory-mapped chunk store: lossless round trip, O(1) row access, zero-copy embeddings."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from funcpipe_rag.core.chunk_batch import ChunkBatch
+from funcpipe_rag.core.rag_types import Chunk, ChunkWithoutEmbedding
+from funcpipe_rag.infra.adapters.chunk_store import (
+    HEADER_SIZE,
+    ChunkStore,
+    open_chunk_store,
+)
+from funcpipe_rag.result.types import Err, Ok
+
+
+def _chunks(n: int) -> list[Chunk]:
+    return [
+        Chunk(
+            doc_id=f"d{i % 7}",
+            text=f"chunk {i} héllo ✓" * (i % 3),
+            start=i * 10,
+            end=i * 10 + 5,
+            metadata={"i": i} if i % 5 == 0 else {},
+            embedding=tuple(float(np.float32(i / (k + 1))) for k in range(16)),
+        )
+        for i in range(n)
+    ]
+
+
+def test_round_trip_and_random_access(tmp_path: Path) -> None:
+    chunks = _chunks(9001)  # crosses the spool flush size
+    path = str(tmp_path / "chunks.bin")
+    assert ChunkStore().write_chunks(path, iter(chunks)) == Ok(None)
+    with open_chunk_store(path) as store:
+        assert len(store) == len(chunks)
+        assert list(store) == chunks
+        for row in (0, 4999, 9000, -1):
+            got, want = store[row], chunks[row]
+            assert got == want and got.embedding == want.embedding
+            assert dict(got.metadata) == dict(want.metadata)
+        assert store.doc_id(12) == "d5" and store.text(4) == chunks[4].text
+        with pytest.raises(IndexError):
+            store[len(chunks)]
+
+
+def test_embeddings_are_a_zero_copy_memmap(tmp_path: Path) -> None:
+    chunks = _chunks(50)
+    path = str(tmp_path / "chunks.bin")
+    ChunkStore().write_chunks(path, iter(chunks))
+    store = open_chunk_store(path)
+    emb = store.embeddings
+    assert isinstance(emb, np.memmap) and emb.dtype == np.float32 and emb.shape == (50, 16)
+    assert not emb.flags.writeable
+    np.testing.assert_array_equal(emb, np.array([c.embedding for c in chunks], dtype=np.float32))
+    batch = store.to_batch()
+    assert isinstance(batch, ChunkBatch) and list(batch.iter_chunks()) == chunks
+    store.close()
+
+
+def test_float64_store_is_exact(tmp_path: Path) -> None:
+    chunk = Chunk("d", "t", 0, 1, embedding=tuple(0.1 * k for k in range(16)))
+    path = str(tmp_path / "chunks.bin")
+    ChunkStore(embedding_dtype="float64").write_chunks(path, iter([chunk]))
+    with open_chunk_store(path) as store:
+        assert store[0].embedding == chunk.embedding
+
+
+def test_empty_store_and_failures(tmp_path: Path) -> None:
+    path = str(tmp_path / "empty.bin")
+    assert ChunkStore().write_chunks(path, iter([])) == Ok(None)
+    with open_chunk_store(path) as store:
+        assert len(store) == 0 and list(store) == [] and store.embeddings.shape == (0, 16)
+    assert HEADER_SIZE == 184  # the size the module docstring documents
+
+    bad = ChunkStore().write_chunks(str(tmp_path / "bad.bin"), iter([ChunkWithoutEmbedding("d", "t", 0, 1)]))
+    assert isinstance(bad, Err) and bad.error.code == "WRITE_FAILED"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["empty.bin"]
+
+    missing = ChunkStore().write_chunks(str(tmp_path / "nope" / "x.bin"), iter(_chunks(1)))
+    assert isinstance(missing, Err) and missing.error.code == "IO_WRITE"
+
+    (tmp_path / "foreign.bin").write_bytes(b"x" * 400)
+    with pytest.raises(ValueError):
+        open_chunk_store(str(tmp_path / "foreign.bin"))
+    with pytest.raises(ValueError):
+        ChunkStore(embedding_dtype="int32")
@@ -0,0 +1,117 @@
+"""Compressed CSV in / JSONL out: transparent codecs, prefetching reads, block-parallel writes."""
+
+from __future__ import annotations
+
+import bz2
+import csv
+import gzip
+import io
+import json
+import lzma
+from pathlib import Path
+
+import pytest
+
+from funcpipe_rag.boundaries.shells.rag_api_shell import FSReader, write_chunks_jsonl
+from funcpipe_rag.core.rag_types import Chunk
+from funcpipe_rag.core.rules_pred import Eq
+from funcpipe_rag.infra.adapters.compression import (
+    PrefetchReader,
+    codec_for,
+    open_text,
+    text_writer,
+)
+from funcpipe_rag.infra.adapters.file_storage import FileStorage
+from funcpipe_rag.result.types import Err, Ok
+
+_OPEN = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+
+def _csv_text(n: int) -> str:
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    w.writerow(["doc_id", "title", "abstract", "categories"])
+    for i in range(n):
+        w.writerow([f"d{i}", f"title {i}", f"line one\nline two ✓ {i}", "cs.AI" if i % 2 else "math.CO"])
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+def test_compressed_csv_reads_like_plain(tmp_path: Path, suffix: str) -> None:
+    text = _csv_text(300)
+    plain = tmp_path / "docs.csv"
+    plain.write_text(text, encoding="utf-8", newline="")
+    packed = tmp_path / f"docs.csv{suffix}"
+    with _OPEN[suffix](packed, "wt", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+    storage = FileStorage()
+    assert list(storage.read_docs(str(packed))) == list(storage.read_docs(str(plain)))
+    keep = Eq("categories", "cs.AI")
+    assert list(storage.read_docs(str(packed), keep=keep)) == list(storage.read_docs(str(plain), keep=keep))
+    assert [r for b in storage.read_doc_batches(str(packed)) for r in b] == list(storage.read_docs(str(plain)))
+    assert FSReader().read_docs(str(packed)) == FSReader().read_docs(str(plain))
+    assert isinstance(next(storage.read_docs_by_id(str(packed), ["d1"])), Err)
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+def test_compressed_jsonl_writes_are_multi_member_and_readable(tmp_path: Path, suffix: str) -> None:
+    chunks = [Chunk(f"d{i}", f"text {i} ✓", i, i + 1, embedding=(float(i),) * 16) for i in range(2000)]
+    plain, packed = tmp_path / "out.jsonl", tmp_path / f"out.jsonl{suffix}"
+    storage = FileStorage()
+    assert storage.write_chunks(str(plain), iter(chunks)) == Ok(None)
+    assert storage.write_chunks(str(packed), iter(chunks)) == Ok(None)
+    with _OPEN[suffix](packed, "rb") as f:
+        assert f.read() == plain.read_bytes()
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([plain.name, packed.name])
+
+    shell_out = tmp_path / f"shell.jsonl{suffix}"
+    assert write_chunks_jsonl(str(shell_out), chunks[:3]) == Ok(None)
+    with open_text(str(shell_out)) as f:
+        assert [json.loads(line)["doc_id"] for line in f] == ["d0", "d1", "d2"]
+
+
+def test_block_writer_emits_independent_gzip_members() -> None:
+    raw = io.BytesIO()
+    with text_writer(raw, "gzip", workers=3, block_size=1000) as out:
+        out.write("x" * 10_500)
+    assert not raw.closed
+    data = raw.getvalue()
+    assert data.count(b"\x1f\x8b\x08") >= 11  # one member per 1000-byte block
+    assert gzip.decompress(data) == b"x" * 10_500
+
+    empty = io.BytesIO()
+    with text_writer(empty, "lzma"):
+        pass
+    assert lzma.decompress(empty.getvalue()) == b""
+
+
+def test_prefetch_reader_surfaces_errors_and_stops_early(tmp_path: Path) -> None:
+    bad = tmp_path / "bad.csv.gz"
+    bad.write_bytes(gzip.compress(_csv_text(50).encode())[:-12])
+    results = list(FileStorage().read_docs(str(bad)))
+    assert isinstance(results[-1], Err) and results[-1].error.code == "IO_READ"
+
+    reader = PrefetchReader(io.BytesIO(b"abc" * 10_000), block_size=7, queue_blocks=2)
+    assert reader.read(5) == b"abcab"
+    reader.close()
+    assert not reader._thread.is_alive()
+
+    assert codec_for("a.CSV.GZ") == "gzip" and codec_for("a.csv") is None
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".xz"])
+def test_truncated_archive_yields_rows_before_the_error(tmp_path: Path, suffix: str) -> None:
+    plain = tmp_path / "docs.csv"
+    plain.write_text(_csv_text(2000), encoding="utf-8", newline="")
+    whole = tmp_path / f"whole.csv{suffix}"
+    with _OPEN[suffix](whole, "wb") as f:
+        f.write(plain.read_bytes())
+    data = whole.read_bytes()
+    cut = tmp_path / f"cut.csv{suffix}"
+    cut.write_bytes(data[: len(data) * 3 // 4])
+
+    results = list(FileStorage().read_docs(str(cut)))
+    assert isinstance(results[-1], Err) and results[-1].error.code == "IO_READ"
+    assert len(results) > 1000
+    assert results[:-1] == list(FileStorage().read_docs(str(plain)))[: len(results) - 1]
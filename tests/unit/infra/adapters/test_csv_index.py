@@ -0,0 +1,77 @@
+"""CSV byte-offset sidecar: quoted multi-line records, staleness, random access."""
+
+from __future__ import annotations
+
+import csv
+import os
+from pathlib import Path
+
+import hypothesis.strategies as st
+from hypothesis import given, settings
+
+from funcpipe_rag.core.rag_types import RawDoc
+from funcpipe_rag.infra.adapters.csv_index import (
+    build_csv_index,
+    ensure_csv_index,
+    index_path_for,
+)
+from funcpipe_rag.infra.adapters.file_storage import FileStorage
+from funcpipe_rag.result.types import Err, Ok
+
+_text = st.text(alphabet=st.sampled_from(list('ab ,"\n\ré')), max_size=12)
+_doc = st.builds(RawDoc, doc_id=st.text(alphabet="xyz", min_size=1, max_size=3), title=_text, abstract=_text, categories=_text)
+
+
+def _write(path: Path, docs: list[RawDoc]) -> str:
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=["doc_id", "title", "abstract", "categories"])
+        w.writeheader()
+        for d in docs:
+            w.writerow(vars(d))
+    return str(path)
+
+
+@settings(max_examples=60)
+@given(docs=st.lists(_doc, max_size=12), parts=st.integers(1, 4))
+def test_random_access_matches_sequential_read(tmp_path_factory, docs: list[RawDoc], parts: int) -> None:  # type: ignore[no-untyped-def]
+    path = _write(tmp_path_factory.mktemp("idx") / "in.csv", docs)
+    storage = FileStorage()
+    latest = {d.doc_id: d for d in docs}
+    ids = list(reversed(latest))
+    assert list(storage.read_docs_by_id(path, ids)) == [Ok(latest[i]) for i in ids]
+
+    index = build_csv_index(path)
+    assert len(index) == len(docs)
+    with open(path, "rb") as f:
+        blob = f.read()
+    ranges = index.byte_ranges(parts)
+    assert "".join(blob[a:b].decode() for a, b in ranges) == blob[index.offsets[0] :].decode()
+
+
+def test_sidecar_is_reused_until_the_file_changes(tmp_path: Path) -> None:
+    path = _write(tmp_path / "in.csv", [RawDoc("a", "t", "multi\nline", "cs"), RawDoc("b", "t", 'say "hi"', "cs")])
+    first = ensure_csv_index(path)
+    assert os.path.exists(index_path_for(path))
+    assert ensure_csv_index(path).rows == first.rows
+
+    _write(tmp_path / "in.csv", [RawDoc("c", "t", "x", "cs")])
+    os.utime(path, ns=(first.mtime_ns + 10**9, first.mtime_ns + 10**9))
+    (doc,) = FileStorage().read_docs_by_id(path, ["c"])
+    assert doc == Ok(RawDoc("c", "t", "x", "cs"))
+    (missing,) = FileStorage().read_docs_by_id(path, ["a"])
+    assert isinstance(missing, Err) and missing.error.code == "NOT_FOUND"
+
+
+def test_stray_quote_in_unquoted_field_keeps_later_records(tmp_path: Path) -> None:
+    path = tmp_path / "in.csv"
+    rows = ['doc_id,title,abstract,categories', '1,5" disk,abs,cs.AI', '2,t,"multi\nline",cs', "3,t,a,cs"]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    expected = list(FileStorage().read_docs(str(path)))
+    assert len(expected) == 3
+    index = build_csv_index(str(path))
+    assert len(index) == 3
+    assert list(FileStorage().read_docs_by_id(str(path), ["3", "1", "2"], index=index)) == [
+        expected[2],
+        expected[0],
+        expected[1],
+    ]
@@ -0,0 +1,62 @@
+"""Precompiled chunk encoder is byte-identical to json.dump; sinks stay atomic."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import hypothesis.strategies as st
+from hypothesis import given
+
+from funcpipe_rag.core.rag_types import Chunk, ChunkWithoutEmbedding
+from funcpipe_rag.infra.adapters.file_storage import FileStorage
+from funcpipe_rag.infra.adapters.jsonl_writer import (
+    chunk_record,
+    encode_chunk_line,
+    write_lines,
+)
+from funcpipe_rag.result.types import Ok
+
+_floats = st.floats(allow_nan=True, allow_infinity=True) | st.integers(-3, 3)
+_meta = st.dictionaries(st.text(max_size=3), st.integers() | st.text(max_size=3) | st.none(), max_size=3)
+_chunk = st.builds(
+    Chunk,
+    doc_id=st.text(max_size=8),
+    text=st.text(max_size=40),
+    start=st.integers(0, 10**12),
+    end=st.just(10**12 + 1),
+    metadata=_meta,
+    embedding=st.lists(_floats, min_size=16, max_size=16).map(tuple),
+)
+
+
+@given(chunk=_chunk)
+def test_encoder_is_byte_identical_to_json_dump(chunk: Chunk) -> None:
+    expected = json.dumps(chunk_record(chunk), ensure_ascii=False) + "\n"
+    assert encode_chunk_line(chunk) == expected
+    bare = ChunkWithoutEmbedding(chunk.doc_id, chunk.text, chunk.start, chunk.end, chunk.metadata)
+    assert encode_chunk_line(bare) == json.dumps(chunk_record(bare), ensure_ascii=False) + "\n"
+
+
+def test_write_lines_buffers_into_few_writes() -> None:
+    class CountingIO(io.StringIO):
+        calls = 0
+
+        def write(self, s: str) -> int:
+            CountingIO.calls += 1
+            return super().write(s)
+
+    out = CountingIO()
+    assert write_lines(out, (f"{i}\n" for i in range(1000)), buffer_chars=1000) == 1000
+    assert out.getvalue() == "".join(f"{i}\n" for i in range(1000))
+    assert CountingIO.calls < 10
+
+
+def test_file_storage_writes_chunks_with_metadata(tmp_path: Path) -> None:
+    path = tmp_path / "out.jsonl"
+    chunks = [Chunk("d", "héllo", 0, 5, metadata={"k": 1}, embedding=(0.5,) * 16)] * 3
+    assert FileStorage().write_chunks(str(path), iter(chunks)) == Ok(None)
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert rows == [chunk_record(c) for c in chunks]
+    assert [p.name for p in tmp_path.iterdir()] == ["out.jsonl"]
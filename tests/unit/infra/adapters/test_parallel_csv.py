@@ -0,0 +1,95 @@
+"""Parallel byte-range CSV ingestion agrees with the sequential reader."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given, settings
+
+from funcpipe_rag.core.rag_types import RawDoc
+from funcpipe_rag.infra.adapters.csv_index import (
+    build_csv_index,
+    index_path_for,
+    save_csv_index,
+)
+from funcpipe_rag.infra.adapters.file_storage import FileStorage
+from funcpipe_rag.infra.adapters.parallel_csv import plan_byte_ranges, read_doc_batches
+from funcpipe_rag.result.types import Err, Ok
+
+_text = st.text(alphabet=st.sampled_from(list('ab ,"\n')), max_size=30)
+_doc = st.builds(RawDoc, doc_id=st.text(alphabet="xyz", min_size=1, max_size=3), title=_text, abstract=_text, categories=_text)
+
+
+def _write(path: Path, docs: list[RawDoc]) -> str:
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=["doc_id", "title", "abstract", "categories"])
+        w.writeheader()
+        for d in docs:
+            w.writerow(vars(d))
+    return str(path)
+
+
+def _strip_stage(results: list) -> list:  # type: ignore[type-arg]
+    return [Err(r.error._replace(stage="")) if isinstance(r, Err) else r for r in results]
+
+
+@settings(max_examples=40, deadline=None)
+@given(docs=st.lists(_doc, max_size=25), target=st.integers(1, 200))
+def test_cuts_are_record_aligned(tmp_path_factory, docs: list[RawDoc], target: int) -> None:  # type: ignore[no-untyped-def]
+    path = _write(tmp_path_factory.mktemp("pc") / "in.csv", docs)
+    header, ranges = plan_byte_ranges(path, target_bytes=target)
+    index = build_csv_index(path)
+    assert header == index.header
+    starts = set(index.offsets)
+    assert all(a in starts and b in starts for a, b in ranges)
+    assert [a for a, _ in ranges[1:]] == [b for _, b in ranges[:-1]]
+
+
+def test_parallel_matches_sequential_with_row_fixup(tmp_path: Path) -> None:
+    docs = [RawDoc(f"d{i}", "t", f'line {i}\n"quoted", more', "cs") for i in range(40)]
+    path = _write(tmp_path / "in.csv", docs)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("bad,t,a,cs,EXTRA\n")  # surplus field -> PARSE_ROW
+        f.write('d99,t,"tail, with comma",cs\n')
+    expected = _strip_stage(list(FileStorage().read_docs(path)))
+
+    for ordered in (True, False):
+        batches = list(read_doc_batches(path, workers=2, ordered=ordered, target_bytes=64))
+        assert len(batches) > 4
+        flat = _strip_stage([r for b in batches for r in b])
+        if ordered:
+            assert flat == expected
+        else:
+            assert sorted(map(repr, flat)) == sorted(map(repr, expected))
+    (err,) = [r for r in expected if isinstance(r, Err)]
+    assert err.error.ctx["row"] == 41
+
+    save_csv_index(index_path_for(path), build_csv_index(path))
+    via_index = [r for b in FileStorage().read_doc_batches(path, workers=2) for r in b]
+    assert _strip_stage(via_index) == expected
+    assert [r for r in via_index if isinstance(r, Ok)][-1] == Ok(RawDoc("d99", "t", "tail, with comma", "cs"))
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"inflight": 0}, {"target_bytes": 0}])
+def test_bad_parameters_raise_at_call_time(tmp_path: Path, kwargs: dict[str, int]) -> None:
+    path = _write(tmp_path / "in.csv", [RawDoc("d", "t", "a", "cs")])
+    with pytest.raises(ValueError):
+        read_doc_batches(path, **kwargs)  # type: ignore[arg-type]
+
+
+def test_stray_quote_in_unquoted_field_does_not_shift_cuts(tmp_path: Path) -> None:
+    path = tmp_path / "in.csv"
+    rows = ['doc_id,title,abstract,categories', '0,5" disk,plain,cs.AI']
+    rows += [f'{i},t{i},"multi\nline {i}",cs' for i in range(1, 200)]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    expected = _strip_stage(list(FileStorage().read_docs(str(path))))
+    assert len(expected) == 200 and all(isinstance(r, Ok) for r in expected)
+
+    _, ranges = plan_byte_ranges(str(path), target_bytes=64)
+    assert {a for a, _ in ranges} <= set(build_csv_index(str(path)).offsets)
+    batches = list(read_doc_batches(str(path), workers=2, target_bytes=64))
+    assert len(batches) > 4
+    assert _strip_stage([r for b in batches for r in b]) == expected
@@ -0,0 +1,92 @@
+"""read_docs pushdown: keep predicate and column projection before RawDoc construction."""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import replace
+from pathlib import Path
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from funcpipe_rag import AnyOf, Eq, LenGt, Not, RawDoc, StartsWith, eval_pred
+from funcpipe_rag.infra.adapters.file_storage import FileStorage
+from funcpipe_rag.infra.adapters.memory_storage import InMemoryStorage
+from funcpipe_rag.result.types import Err, Ok
+
+_DOCS = [
+    RawDoc("1", "Graphs", "a" * 20, "cs.AI"),
+    RawDoc("2", "Primes", "b" * 5, "math.NT"),
+    RawDoc("3", "Nets", "c" * 50, "cs.LG"),
+    RawDoc("4", "", "", "quant-ph"),
+]
+
+
+def _write(path: Path, header: list[str], rows: list[list[str]]) -> str:
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        w.writerows(rows)
+    return str(path)
+
+
+def _csv(tmp_path: Path, docs: list[RawDoc], extra: bool = False) -> str:
+    header = ["doc_id", "title", "abstract", "categories"] + (["year"] if extra else [])
+    rows = [[d.doc_id, d.title, d.abstract, d.categories] + (["2024"] if extra else []) for d in docs]
+    return _write(tmp_path / "in.csv", header, rows)
+
+
+_preds = st.sampled_from(
+    [
+        StartsWith("categories", "cs."),
+        AnyOf((Eq("categories", "math.NT"), LenGt("abstract", 30))),
+        Not(Eq("title", "")),
+    ]
+)
+
+
+@given(pred=_preds, columns=st.none() | st.sets(st.sampled_from(["title", "abstract", "categories"])))
+def test_file_and_memory_pushdown_agree_with_eval_pred(tmp_path_factory, pred, columns) -> None:  # type: ignore[no-untyped-def]
+    path = _csv(tmp_path_factory.mktemp("pd"), _DOCS, extra=True)
+    dropped = {f: "" for f in ("title", "abstract", "categories") if columns is not None and f not in columns}
+    expected = [Ok(replace(d, **dropped)) for d in _DOCS if eval_pred(d, pred)]
+    assert list(FileStorage().read_docs(path, keep=pred, columns=columns)) == expected
+    mem = InMemoryStorage(preload={"in.csv": _DOCS})
+    assert list(mem.read_docs("in.csv", keep=pred, columns=columns)) == expected
+
+
+def test_pushdown_reports_bad_header_and_rows(tmp_path: Path) -> None:
+    path = _write(tmp_path / "a.csv", ["doc_id", "title"], [["1", "t"]])
+    (res,) = FileStorage().read_docs(path, keep=StartsWith("categories", "cs."))
+    assert isinstance(res, Err) and res.error.code == "PARSE_HEADER"
+
+    path = _write(tmp_path / "b.csv", ["doc_id", "categories"], [["1", "cs.AI", "x"], ["2", "cs.AI"]])
+    bad, good = FileStorage().read_docs(path, columns=["categories"])
+    assert isinstance(bad, Err) and bad.error.code == "PARSE_ROW" and bad.error.ctx["row"] == 1
+    assert good == Ok(RawDoc("2", "", "", "cs.AI"))
+
+    with pytest.raises(ValueError):
+        FileStorage().read_docs(path, keep=Eq("nope", "x"))
+    with pytest.raises(ValueError):
+        FileStorage().read_docs(path, columns=["nope"])
+
+
+def test_short_and_long_rows_match_the_dictreader_mode(tmp_path: Path) -> None:
+    rows = [["1", "t", "a", "cs.AI"], ["2", "t"], ["3", "t", "a", "cs", "extra"], ["4", "t", "a", "math"]]
+    path = _write(tmp_path / "w.csv", ["doc_id", "title", "abstract", "categories"], rows)
+
+    def shape(results: list) -> list:  # type: ignore[type-arg]
+        return [r if isinstance(r, Ok) else (r.error.code, r.error.ctx["row"]) for r in results]
+
+    plain = shape(list(FileStorage().read_docs(path)))
+    assert plain == [
+        Ok(RawDoc("1", "t", "a", "cs.AI")),
+        Ok(RawDoc("2", "t", None, None)),  # type: ignore[arg-type]
+        ("PARSE_ROW", 3),
+        Ok(RawDoc("4", "t", "a", "math")),
+    ]
+    assert shape(list(FileStorage().read_docs(path, columns=["title", "abstract", "categories"]))) == plain
+
+    kept = shape(list(FileStorage().read_docs(path, keep=StartsWith("categories", "cs"))))
+    assert kept == [plain[0], ("PARSE_ROW", 2), ("PARSE_ROW", 3)]  # StartsWith on None cannot be evaluated
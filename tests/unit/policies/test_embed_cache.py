@@ -0,0 +1,104 @@
+"""Embedding cache: transparent results, LRU + disk tiers, stats in Observations."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import hypothesis.strategies as st
+from hypothesis import given, settings
+
+from funcpipe_rag import full_rag_api_docs, get_deps
+from funcpipe_rag.core.rag_types import Chunk, ChunkWithoutEmbedding, RagEnv, RawDoc
+from funcpipe_rag.policies.memo import CacheInfo, DiskCache, cached_embedder
+from funcpipe_rag.rag.batch_embed import embed_chunks_batch
+from funcpipe_rag.rag.config import RagConfig
+from funcpipe_rag.rag.stages import embed_chunk
+
+
+def _counting(fn):
+    calls: list[str] = []
+
+    def wrapped(chunk: ChunkWithoutEmbedding) -> Chunk:
+        calls.append(chunk.text)
+        return fn(chunk)
+
+    return wrapped, calls
+
+
+@given(texts=st.lists(st.sampled_from(["a", "b", " a", "A", "c d", "c  d"]), max_size=40))
+def test_cached_embedder_is_transparent_and_embeds_each_text_once(texts: list[str]) -> None:
+    inner, calls = _counting(embed_chunk)
+    cached = cached_embedder(inner, maxsize=64)
+    chunks = [ChunkWithoutEmbedding(f"d{i}", t, i, i + len(t)) for i, t in enumerate(texts)]
+    assert [cached(c) for c in chunks] == [embed_chunk(c) for c in chunks]
+    assert sorted(calls) == sorted(set(texts))
+    info = cached.cache_info()
+    assert (info.hits, info.misses) == (len(texts) - len(set(texts)), len(set(texts)))
+
+
+def test_lru_tier_evicts_and_disk_tier_survives_restart(tmp_path: Path) -> None:
+    disk = DiskCache(str(tmp_path), namespace="embed")
+    chunks = [ChunkWithoutEmbedding("d", t, 0, 1) for t in "abc"]
+    first = cached_embedder(embed_chunk, disk, maxsize=2)
+    first.embed_batch(chunks)
+    assert first.cache_info().evictions == 1
+
+    inner, calls = _counting(embed_chunk)
+    second = cached_embedder(inner, disk, maxsize=2)
+    assert second.embed_batch(chunks) == [embed_chunk(c) for c in chunks]
+    assert calls == []
+    assert second.cache_info().disk_hits == 3
+
+    bumped = cached_embedder(inner, disk, norm_version="v2")
+    bumped(chunks[0])
+    assert calls == ["a"]
+
+
+def test_embed_batch_uses_inner_batch_for_misses_only() -> None:
+    seen: list[int] = []
+
+    def inner_batch(batch: list[ChunkWithoutEmbedding]) -> list[Chunk]:
+        seen.append(len(batch))
+        return embed_chunks_batch(batch)
+
+    cached = cached_embedder(embed_chunk, inner_batch=inner_batch)
+    chunks = [ChunkWithoutEmbedding("d", t, 0, 1) for t in ["x", "y", "x"]]
+    assert cached.embed_batch(chunks) == embed_chunks_batch(chunks)
+    assert cached.embed_batch(chunks) == embed_chunks_batch(chunks)
+    assert seen == [2]
+
+
+@settings(max_examples=20)
+@given(abstracts=st.lists(st.text(min_size=1, max_size=300), min_size=1, max_size=10))
+def test_reingest_skips_embedding_and_reports_stats(abstracts: list[str]) -> None:
+    docs = [RawDoc(f"doc{i}", "t", a, "cs.AI") for i, a in enumerate(abstracts)]
+    config = RagConfig(env=RagEnv(chunk_size=64))
+    deps = get_deps(config, embed_cache=True)
+    plain_chunks, plain_obs = full_rag_api_docs(docs, config, get_deps(config))
+
+    first_chunks, first_obs = full_rag_api_docs(docs, config, deps)
+    again_chunks, again_obs = full_rag_api_docs(docs, config, deps)
+    assert first_chunks == again_chunks == plain_chunks
+    assert [c.embedding for c in again_chunks] == [c.embedding for c in plain_chunks]
+    assert plain_obs.extra == ()
+
+    (name, first), = first_obs.extra
+    (_, again), = again_obs.extra
+    assert name == "embed_cache"
+    assert again == CacheInfo(hits=first.hits + first.misses, misses=0)
+
+
+def test_batch_and_per_chunk_vectors_do_not_share_cache_keys(tmp_path: Path) -> None:
+    config = RagConfig(env=RagEnv(chunk_size=64))
+    disk = DiskCache(str(tmp_path), namespace="embed")
+    chunk = ChunkWithoutEmbedding("d", "some text ✓", 0, 11)
+    deps = get_deps(config, batch_embedder=embed_chunks_batch, embed_cache=disk)
+    assert deps.batch_embedder is not None
+    assert list(deps.batch_embedder([chunk])) == embed_chunks_batch([chunk])
+    assert embed_chunks_batch([chunk])[0].embedding != embed_chunk(chunk).embedding  # float32 vs float64
+    assert deps.embedder(chunk) == embed_chunk(chunk)
+
+    fresh = get_deps(config, batch_embedder=embed_chunks_batch, embed_cache=disk)
+    assert fresh.embedder(chunk) == embed_chunk(chunk)
+    assert list(fresh.batch_embedder([chunk])) == embed_chunks_batch([chunk])  # type: ignore[misc]
+    assert fresh.cache_info is not None and fresh.cache_info().disk_hits == 2
@@ -0,0 +1,67 @@
+"""Batch embedding contract: equivalence with the per-chunk embedder (float32 precision)."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from hypothesis import given
+
+from funcpipe_rag import full_rag_api_docs, get_deps, iter_embed_batched, iter_rag_core
+from funcpipe_rag.core.rag_types import ChunkWithoutEmbedding, RagEnv, RawDoc
+from funcpipe_rag.rag.batch_embed import embed_chunks_batch, embed_matrix
+from funcpipe_rag.rag.config import RagConfig
+from funcpipe_rag.rag.stages import _digest_vector, embed_chunk
+from tests.strategies import doc_list_strategy, env_strategy
+
+
+def _strip_embedding(chunks: list) -> list[tuple[str, str, int, int]]:
+    return [(c.doc_id, c.text, c.start, c.end) for c in chunks]
+
+
+@given(texts=st.lists(st.text(), max_size=30))
+def test_embed_matrix_matches_embed_chunk_in_float32(texts: list[str]) -> None:
+    matrix = embed_matrix(texts)
+    assert matrix.shape == (len(texts), 16)
+    assert matrix.dtype == np.float32
+    expected = np.asarray(
+        [_digest_vector(t.encode("utf-8")) for t in texts],
+        dtype=np.float32,
+    ).reshape(len(texts), 16)
+    assert np.array_equal(matrix, expected)
+    assert [embed_chunk(ChunkWithoutEmbedding("d", t, 0, len(t))).embedding for t in texts] == [
+        _digest_vector(t.encode("utf-8")) for t in texts
+    ]
+
+
+@given(texts=st.lists(st.text(min_size=1), max_size=20), batch_size=st.integers(min_value=1, max_value=7))
+def test_iter_embed_batched_preserves_order(texts: list[str], batch_size: int) -> None:
+    chunks = [ChunkWithoutEmbedding(f"d{i}", t, 0, len(t)) for i, t in enumerate(texts)]
+    out = list(iter_embed_batched(chunks, embed_chunks_batch, batch_size=batch_size))
+    assert out == embed_chunks_batch(chunks)
+    assert _strip_embedding(out) == _strip_embedding(chunks)
+
+
+def test_iter_embed_batched_rejects_bad_batch_size() -> None:
+    with pytest.raises(ValueError):
+        list(iter_embed_batched([], embed_chunks_batch, batch_size=0))
+
+
+@given(docs=doc_list_strategy(), env=env_strategy(), batch_size=st.integers(min_value=1, max_value=64))
+def test_batched_cores_match_per_chunk_cores(docs: list[RawDoc], env: RagEnv, batch_size: int) -> None:
+    config = RagConfig(env=env, embed_batch_size=batch_size)
+    deps = get_deps(config)
+    batched = replace(deps, batch_embedder=embed_chunks_batch)
+
+    per_chunk = list(iter_rag_core(docs, config, deps))
+    in_batches = list(iter_rag_core(docs, config, batched))
+    assert _strip_embedding(in_batches) == _strip_embedding(per_chunk)
+    for a, b in zip(in_batches, per_chunk):
+        assert np.allclose(a.embedding, b.embedding, rtol=1e-6, atol=1e-7)
+
+    chunks, obs = full_rag_api_docs(docs, config, batched)
+    ref_chunks, ref_obs = full_rag_api_docs(docs, config, deps)
+    assert _strip_embedding(chunks) == _strip_embedding(ref_chunks)
+    assert obs == ref_obs
@@ -0,0 +1,93 @@
+"""Content-defined chunking: bounded sizes, exact coverage, edit stability."""
+
+from __future__ import annotations
+
+import random
+from itertools import pairwise
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from funcpipe_rag import (
+    CleanDoc,
+    RagEnv,
+    iter_cdc_spans,
+    iter_chunk_doc,
+    iter_chunk_spans,
+)
+from funcpipe_rag.core.rag_types import RawDoc
+from funcpipe_rag.pipelines.configured import (
+    PipelineConfig,
+    StepConfig,
+    build_rag_pipeline,
+)
+
+
+def _doc(text: str) -> CleanDoc:
+    return CleanDoc(doc_id="d", title="", abstract=text, categories="")
+
+
+def _words(n: int, seed: int) -> str:
+    rng = random.Random(seed)
+    vocab = ["graph", "neural", "kernel", "quantum", "proof", "lemma", "data", "model", "bound", "rate"]
+    return " ".join(rng.choice(vocab) for _ in range(n))
+
+
+@given(text=st.text(max_size=400), avg=st.integers(min_value=1, max_value=40), tail=st.sampled_from(["emit_short", "drop"]))
+def test_cdc_spans_cover_text_within_bounds(text: str, avg: int, tail: str) -> None:
+    env = RagEnv(chunk_size=avg, chunk_mode="cdc", tail_policy=tail)
+    lo, _, hi = env.cdc_bounds
+    spans = list(iter_chunk_spans(_doc(text), env))
+    assert all(prev[1] == nxt[0] for prev, nxt in pairwise(spans))
+    assert all(lo <= e - s <= hi for s, e in spans[:-1])
+    if spans:
+        assert spans[0][0] == 0 and 0 < spans[-1][1] - spans[-1][0] <= hi
+    if tail == "emit_short":
+        assert (spans[-1][1] if spans else 0) == len(text)
+    chunks = list(iter_chunk_doc(_doc(text), env))
+    assert [(c.start, c.end, c.text) for c in chunks] == [(s, e, text[s:e]) for s, e in spans]
+
+
+def test_cdc_boundaries_are_stable_under_local_edits() -> None:
+    env = RagEnv(chunk_size=64, chunk_mode="cdc")
+    fixed = RagEnv(chunk_size=64)
+    text = _words(2000, seed=7)
+    edited = text[:500] + "X" + text[500:]
+
+    def shared(e: RagEnv) -> float:
+        before = {c.text for c in iter_chunk_doc(_doc(text), e)}
+        after = [c.text for c in iter_chunk_doc(_doc(edited), e)]
+        return sum(t in before for t in after) / len(after)
+
+    assert shared(env) > 0.9
+    assert shared(fixed) < 0.4
+    sizes = [e - s for s, e in iter_cdc_spans(text, env)]
+    assert 32 <= sum(sizes) / len(sizes) <= 128
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"chunk_mode": "rolling"},
+        {"chunk_mode": "cdc", "overlap": 2},
+        {"chunk_mode": "cdc", "tail_policy": "pad"},
+        {"chunk_mode": "cdc", "min_chunk_size": 20},
+        {"chunk_mode": "cdc", "max_chunk_size": 8},
+    ],
+)
+def test_cdc_env_validation(kwargs: dict[str, object]) -> None:
+    with pytest.raises(ValueError):
+        RagEnv(chunk_size=16, **kwargs)
+
+
+def test_pipeline_params_configure_cdc_bounds() -> None:
+    text = "".join(random.Random(7).choice("abcdefgh ") for _ in range(4000))
+    params = {"chunk_size": 64, "chunk_mode": "cdc", "min_chunk_size": 40, "max_chunk_size": 72}
+    steps = (StepConfig("clean"), StepConfig("chunk", params), StepConfig("embed"))
+    pipe = build_rag_pipeline(PipelineConfig(steps=steps))
+    lengths = [r.value.end - r.value.start for r in pipe(iter([RawDoc("d", "t", text, "cs")]))]
+    assert sum(lengths) == len(text) and max(lengths) <= 72 and min(lengths[:-1]) >= 40
+    bad = PipelineConfig(steps=(StepConfig("clean"), StepConfig("chunk", {"chunk_mode": "cdc", "max_chunk_size": "72"})))
+    with pytest.raises(TypeError):
+        build_rag_pipeline(bad)
@@ -0,0 +1,51 @@
+"""External-sort dedup matches the in-memory canonical dedup exactly."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from funcpipe_rag import (
+    Chunk,
+    structural_dedup_chunks,
+    structural_dedup_chunks_external,
+)
+
+_chunks = st.lists(
+    st.builds(
+        Chunk,
+        doc_id=st.sampled_from(["a", "b", "c"]),
+        text=st.sampled_from(["x", "y", "é" * 40]),
+        start=st.integers(min_value=0, max_value=4),
+        end=st.integers(min_value=4, max_value=6),
+        metadata=st.dictionaries(st.just("k"), st.integers(), max_size=1),
+        embedding=st.tuples(*[st.floats(allow_nan=False)] * 16),
+    ),
+    max_size=120,
+)
+
+
+@given(chunks=_chunks, max_run_bytes=st.integers(min_value=1, max_value=20_000))
+def test_external_dedup_matches_in_memory(chunks: list[Chunk], max_run_bytes: int) -> None:
+    got = list(structural_dedup_chunks_external(chunks, max_run_bytes=max_run_bytes))
+    expected = structural_dedup_chunks(chunks)
+    assert got == expected
+    assert [(c.embedding, dict(c.metadata)) for c in got] == [(c.embedding, dict(c.metadata)) for c in expected]
+
+
+def test_external_dedup_spills_and_cleans_up(tmp_path: Path) -> None:
+    chunks = [Chunk(doc_id=f"d{i % 7}", text=str(i % 5), start=i % 3, end=9, embedding=(0.0,) * 16) for i in range(500)]
+    it = structural_dedup_chunks_external(iter(chunks), max_run_bytes=4_000, tmp_dir=str(tmp_path))
+    first = next(it)
+    (spill_dir,) = list(tmp_path.iterdir())
+    assert len(list(spill_dir.iterdir())) > 1
+    assert [first, *it] == structural_dedup_chunks(chunks)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_external_dedup_rejects_bad_budget() -> None:
+    with pytest.raises(ValueError):
+        structural_dedup_chunks_external([], max_run_bytes=0)  # raises before iteration
@@ -0,0 +1,81 @@
+"""Process-parallel core: same chunks as `iter_rag_core`, bounded and optionally ordered."""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from dataclasses import replace
+
+import pytest
+
+from funcpipe_rag import get_deps, iter_rag_core
+from funcpipe_rag.core.rag_types import RagEnv, RawDoc
+from funcpipe_rag.rag.batch_embed import embed_chunks_batch
+from funcpipe_rag.rag.config import RagConfig
+from funcpipe_rag.rag.parallel import parallel_rag_core
+from funcpipe_rag.rag.types import RagTaps
+
+
+def _docs(n: int) -> list[RawDoc]:
+    return [
+        RawDoc(
+            doc_id=f"doc-{i:03d}",
+            title=f"Title {i}",
+            abstract=("  Lorem IPSUM dolor sit amet " * (1 + i % 7)) + f"tail-{i}",
+            categories="cs.AI" if i % 3 else "math.CO",
+        )
+        for i in range(n)
+    ]
+
+
+def _config() -> RagConfig:
+    return RagConfig(env=RagEnv(chunk_size=32, overlap=8))
+
+
+def test_parallel_core_matches_sequential_in_order() -> None:
+    docs = _docs(40)
+    config = _config()
+    deps = get_deps(config)
+    expected = list(iter_rag_core(docs, config, deps))
+    got = list(parallel_rag_core(docs, config, deps, workers=2, inflight=3, batch_size=7))
+    assert got == expected
+    assert [c.embedding for c in got] == [c.embedding for c in expected]
+
+
+def test_parallel_core_unordered_yields_same_multiset() -> None:
+    docs = _docs(30)
+    config = _config()
+    deps = replace(get_deps(config), batch_embedder=embed_chunks_batch)
+    expected = list(iter_rag_core(docs, config, deps))
+    got = list(parallel_rag_core(iter(docs), config, deps, workers=3, ordered=False, batch_size=4))
+
+    def key(c):
+        return (c.doc_id, c.start, c.end, c.text, c.embedding)
+
+    assert sorted(map(key, got)) == sorted(map(key, expected))
+
+
+def test_parallel_core_propagates_worker_errors() -> None:
+    config = _config()
+
+    def boom(doc):
+        raise RuntimeError(f"bad doc {doc.doc_id}")
+
+    deps = replace(get_deps(config), cleaner=boom)
+    if "fork" not in mp.get_all_start_methods():
+        pytest.skip("a local closure as cleaner needs the fork start method")
+    with pytest.raises(RuntimeError, match="bad doc"):
+        list(parallel_rag_core(_docs(3), config, deps, workers=1, mp_context=mp.get_context("fork")))
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"inflight": 0}, {"batch_size": 0}])
+def test_parallel_core_rejects_bad_parameters_at_call_time(kwargs: dict[str, int]) -> None:
+    config = _config()
+    with pytest.raises(ValueError):
+        parallel_rag_core(_docs(1), config, get_deps(config), **kwargs)  # no next() needed
+
+
+def test_parallel_core_rejects_taps_at_call_time() -> None:
+    config = _config()
+    deps = replace(get_deps(config), taps=RagTaps(docs=lambda _: None))
+    with pytest.raises(ValueError, match="taps"):
+        parallel_rag_core(_docs(1), config, deps)
@@ -0,0 +1,71 @@
+"""SpanChunk contract: same chunks as the copying chunker, text sliced lazily."""
+
+from __future__ import annotations
+
+import hypothesis.strategies as st
+import numpy as np
+from hypothesis import given
+
+from funcpipe_rag import (
+    CleanDoc,
+    RagEnv,
+    SpanChunk,
+    SpanSource,
+    embed_chunk,
+    embed_span_chunk,
+    gen_span_chunks,
+    iter_chunk_doc,
+)
+from funcpipe_rag.core.chunk_batch import ChunkBatch
+from funcpipe_rag.rag.batch_embed import embed_chunks_batch
+from funcpipe_rag.rag.stages import _digest_vector
+from tests.strategies import env_strategy
+
+
+def _doc(text: str) -> CleanDoc:
+    return CleanDoc(doc_id="d", title="t", abstract=text, categories="cs.AI")
+
+
+@given(text=st.text(max_size=200), env=env_strategy())
+def test_span_chunks_match_copying_chunker(text: str, env: RagEnv) -> None:
+    doc = _doc(text)
+    spans = list(gen_span_chunks(doc, env))
+    copies = list(iter_chunk_doc(doc, env))
+    assert [s.to_chunk() for s in spans] == copies
+    assert [bytes(s.text_bytes()) for s in spans] == [c.text.encode("utf-8") for c in copies]
+
+
+@given(text=st.text(max_size=120), env=env_strategy())
+def test_span_embeddings_match_embed_chunk(text: str, env: RagEnv) -> None:
+    doc = _doc(text)
+    spans = list(gen_span_chunks(doc, env))
+    copies = list(iter_chunk_doc(doc, env))
+    assert [embed_span_chunk(s) for s in spans] == [embed_chunk(c) for c in copies]
+    assert [embed_span_chunk(s).embedding for s in spans] == [_digest_vector(s.text_bytes()) for s in spans]
+    assert embed_chunks_batch(spans) == embed_chunks_batch(copies)
+
+
+def test_span_chunks_share_one_source_and_view_its_buffer() -> None:
+    spans = list(gen_span_chunks(_doc("abcdefghij"), RagEnv(chunk_size=4, overlap=2)))
+    assert len({id(s.source) for s in spans}) == 1
+    view = spans[1].text_bytes()
+    assert isinstance(view, memoryview)
+    assert view.obj is spans[0].source.utf8()
+    assert bytes(view) == b"cdef"
+
+
+def test_span_chunk_pads_past_end_and_handles_non_ascii() -> None:
+    source = SpanSource("héllo")
+    padded = SpanChunk(doc_id="d", source=source, start=3, end=7)
+    assert padded.text == "lo\0\0"
+    assert bytes(padded.text_bytes()) == b"lo\0\0"
+    assert bytes(SpanChunk(doc_id="d", source=source, start=0, end=2).text_bytes()) == "hé".encode()
+
+
+@given(text=st.text(max_size=120), env=env_strategy())
+def test_chunk_batch_packs_span_chunks(text: str, env: RagEnv) -> None:
+    doc = _doc(text)
+    spans = list(gen_span_chunks(doc, env))
+    batch = ChunkBatch.from_chunks(spans)
+    assert batch.to_chunks() == list(iter_chunk_doc(doc, env))
+    assert batch.embeddings is None or np.isfinite(batch.embeddings).all()
@@ -0,0 +1,46 @@
+"""Vectorized span planning matches the per-document span loop exactly."""
+
+from __future__ import annotations
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from funcpipe_rag import CleanDoc, RagEnv, iter_chunk_doc, iter_chunk_spans
+from funcpipe_rag.rag.span_plan import (
+    chunk_counts,
+    iter_planned_span_chunks,
+    plan_chunk_spans,
+)
+
+_env = st.integers(min_value=1, max_value=12).flatmap(
+    lambda k: st.builds(
+        RagEnv,
+        chunk_size=st.just(k),
+        overlap=st.integers(min_value=0, max_value=k - 1),
+        tail_policy=st.sampled_from(["emit_short", "drop", "pad"]),
+    )
+)
+
+
+def _doc(i: int, text: str) -> CleanDoc:
+    return CleanDoc(doc_id=f"d{i}", title="", abstract=text, categories="")
+
+
+@given(texts=st.lists(st.text(max_size=40), max_size=12), env=_env)
+def test_plan_matches_iter_chunk_spans(texts: list[str], env: RagEnv) -> None:
+    docs = [_doc(i, t) for i, t in enumerate(texts)]
+    plan = plan_chunk_spans([len(t) for t in texts], env)
+    expected = [(i, s, e) for i, d in enumerate(docs) for s, e in iter_chunk_spans(d, env)]
+    assert list(zip(plan.doc_index.tolist(), plan.starts.tolist(), plan.ends.tolist())) == expected
+    assert plan.counts.tolist() == [sum(1 for _ in iter_chunk_spans(d, env)) for d in docs]
+    assert [c.to_chunk() for c in iter_planned_span_chunks(docs, plan)] == [
+        c for d in docs for c in iter_chunk_doc(d, env)
+    ]
+
+
+def test_chunk_counts_rejects_bad_input() -> None:
+    with pytest.raises(ValueError):
+        chunk_counts([-1], RagEnv(chunk_size=4))
+    with pytest.raises(ValueError):
+        chunk_counts([[1]], RagEnv(chunk_size=4))
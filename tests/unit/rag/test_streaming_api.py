@@ -0,0 +1,74 @@
+"""One-pass `gen_rag_api_docs`: same chunks and Observations as `full_rag_api_docs`."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import hypothesis.strategies as st
+from hypothesis import given
+
+from funcpipe_rag import (
+    FingerprintSet,
+    RagTaps,
+    full_rag_api_docs,
+    gen_rag_api_docs,
+    get_deps,
+)
+from funcpipe_rag.core.rag_types import RagEnv, RawDoc
+from funcpipe_rag.rag.config import RagConfig
+from funcpipe_rag.rag.types import Observations
+from tests.strategies import doc_list_strategy
+
+
+def _drain(gen):
+    chunks = []
+    while True:
+        try:
+            chunks.append(next(gen))
+        except StopIteration as stop:
+            return chunks, stop.value
+
+
+@given(
+    docs=doc_list_strategy(),
+    chunk_size=st.integers(min_value=8, max_value=256),
+    sample_size=st.integers(min_value=1, max_value=12),
+)
+def test_streaming_api_matches_materializing_api(docs: list[RawDoc], chunk_size: int, sample_size: int) -> None:
+    docs = docs + docs[:3]
+    config = RagConfig(env=RagEnv(chunk_size=chunk_size, sample_size=sample_size))
+    deps = get_deps(config)
+
+    expected_chunks, expected_obs = full_rag_api_docs(docs, config, deps)
+    seen: list[Observations] = []
+    chunks, obs = _drain(gen_rag_api_docs(iter(docs), config, deps, on_observations=seen.append))
+
+    assert sorted(chunks, key=lambda c: (c.doc_id, c.start)) == expected_chunks
+    assert obs == expected_obs
+    assert seen == [obs]
+
+
+def test_streaming_api_taps_see_bounded_prefixes() -> None:
+    docs = [RawDoc(f"d{i}", "t", "abcdefgh" * 4, "cs.AI") for i in range(20)]
+    config = RagConfig(env=RagEnv(chunk_size=8))
+    calls: dict[str, int] = {}
+    taps = RagTaps(
+        docs=lambda xs: calls.__setitem__("docs", len(xs)),
+        cleaned=lambda xs: calls.__setitem__("cleaned", len(xs)),
+        chunks=lambda xs: calls.__setitem__("chunks", len(xs)),
+    )
+    deps = replace(get_deps(config), taps=taps)
+    chunks, obs = _drain(gen_rag_api_docs(docs, config, deps, tap_limit=5))
+    assert calls == {"docs": 5, "cleaned": 5, "chunks": 5}
+    assert obs.total_chunks == len(chunks) == 80
+
+
+@given(docs=doc_list_strategy())
+def test_streaming_api_with_fingerprint_dedup(docs: list[RawDoc]) -> None:
+    docs = docs + docs[:3]
+    config = RagConfig(env=RagEnv(chunk_size=64))
+    deps = get_deps(config)
+    exact, exact_obs = _drain(gen_rag_api_docs(docs, config, deps))
+    compact, compact_obs = _drain(gen_rag_api_docs(docs, config, deps, dedup_seen=FingerprintSet()))
+    assert compact == exact
+    assert compact_obs == exact_obs